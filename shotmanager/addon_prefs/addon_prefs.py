@@ -1649,6 +1649,14 @@ class UAS_ShotManager_AddonPrefs(AddonPreferences):
         default="JPEG",
     )
 
+    ffmpegFilePath: StringProperty(
+        name="FFmpeg Executable",
+        description="Path of the ffmpeg executable used to encode the playblasts directly."
+        "\nIf empty, the one found in the PATH is used",
+        subtype="FILE_PATH",
+        default="",
+    )
+
     ##################
     # markers ###
     ##################
@@ -380,6 +380,8 @@ def drawRender(context, prefs, layout):
 
         col = mainRow.column(align=True)
         col.prop(prefs, "separatedRenderPanel", text="Make Render Panel a Separated Tab in the Viewport N-Panel")
+        col.separator()
+        col.prop(prefs, "ffmpegFilePath")
 
 
 def drawStampInfo(context, prefs, layout):
@@ -112,7 +112,12 @@ def copy_take(
 
 
 def get_unique_shot_name(shot_manager: UAS_ShotManager_Props, name: str, take_index: int):
-    return shot_manager.getUniqueShotName(shot_manager, name, takeIndex=take_index)
+    return shot_manager.getUniqueShotName(name, takeIndex=take_index)
+
+
+def reserve_unique_shot_names(shot_manager: UAS_ShotManager_Props, name: str, count: int, take_index: int = -1):
+    """Return a list of count unique shot names based on the specified name, to use before a bulk creation of shots"""
+    return shot_manager.reserveUniqueShotNames(name, count, takeIndex=take_index)
 
 
 def add_shot(
@@ -158,6 +163,21 @@ def copy_shot(
     return shot_manager.copyShot(shot, atIndex=at_index, targetTakeIndex=target_take_index, copyCamera=copy_camera)
 
 
+def copy_shots(
+    shot_manager: UAS_ShotManager_Props,
+    shots: list,
+    at_index: int = -1,
+    target_take_index: int = -1,
+    copy_camera: bool = False,
+):
+    """Copy in bulk the specified shots, all belonging to the same take, at the end of the shot list of the target take
+    or at at_index if specified. Much faster than copy_shot on many shots.
+    When copy_camera is True each camera is duplicated once and shared by the copied shots that were sharing it
+    Return the list of the newly added shots
+    """
+    return shot_manager.copyShots(shots, atIndex=at_index, targetTakeIndex=target_take_index, copyCamera=copy_camera)
+
+
 def remove_shot(shot_manager: UAS_ShotManager_Props, shot: UAS_ShotManager_Shot):
     shot_manager.removeShot(shot)
 
@@ -320,22 +340,64 @@ def go_to_next_frame(shot_manager: UAS_ShotManager_Props, current_frame: float):
     return shot_manager.goToNextFrame(current_frame)
 
 
-# works only on current take
 def get_first_shot_index_containing_frame(
-    shot_manager: UAS_ShotManager_Props, frame_index: int, ignore_disabled: bool = False
+    shot_manager: UAS_ShotManager_Props, frame_index: int, ignore_disabled: bool = False, take_index: int = -1
 ):
     """Return the first shot containing the specifed frame, -1 if not found"""
-    return shot_manager.getFirstShotIndexContainingFrame(frame_index, ignoreDisabled=ignore_disabled)
+    return shot_manager.getFirstShotIndexContainingFrame(
+        frame_index, ignoreDisabled=ignore_disabled, takeIndex=take_index
+    )
+
+
+def get_first_shot_index_before_frame(
+    shot_manager: UAS_ShotManager_Props, frame_index: int, ignore_disabled: bool = False, take_index: int = -1
+):
+    """Return the first shot before the specifed frame (supposing thanks to getFirstShotIndexContainingFrame than
+    frameIndex is not in a shot), -1 if not found
+    """
+    return shot_manager.getFirstShotIndexBeforeFrame(frame_index, ignoreDisabled=ignore_disabled, takeIndex=take_index)
 
 
-# works only on current take
 def get_first_shot_index_after_frame(
-    shot_manager: UAS_ShotManager_Props, frame_index: int, ignore_disabled: bool = False
+    shot_manager: UAS_ShotManager_Props, frame_index: int, ignore_disabled: bool = False, take_index: int = -1
 ):
     """Return the first shot after the specifed frame (supposing thanks to getFirstShotIndexContainingFrame than
     frameIndex is not in a shot), -1 if not found
     """
-    return shot_manager.getFirstShotIndexAfterFrame(frame_index, ignoreDisabled=ignore_disabled)
+    return shot_manager.getFirstShotIndexAfterFrame(frame_index, ignoreDisabled=ignore_disabled, takeIndex=take_index)
+
+
+def get_shot_indices_overlapping_range(
+    shot_manager: UAS_ShotManager_Props,
+    range_start: int,
+    range_end: int,
+    ignore_disabled: bool = False,
+    take_index: int = -1,
+):
+    """Return the sorted list of the indices of the shots having at least one frame in the specified range.
+    range_start and range_end are inclusive
+    """
+    return shot_manager.getShotIndicesOverlappingRange(
+        range_start, range_end, ignoreDisabled=ignore_disabled, takeIndex=take_index
+    )
+
+
+def get_shots_table(shot_manager: UAS_ShotManager_Props, take_index: int = -1):
+    """Return a snapshot of the timing data of the shots of the specified take as a NumPy structured array,
+    with the fields name, start, end, duration, enabled, durationLocked, camera and color.
+    Return None if the take is not valid
+    """
+    take = shot_manager.getTakeByIndex(take_index)
+    return None if take is None else take.to_array()
+
+
+def set_shots_table(shot_manager: UAS_ShotManager_Props, table, take_index: int = -1):
+    """Set in bulk the start and end values of the shots of the specified take from a table returned
+    by get_shots_table() and modified
+    """
+    take = shot_manager.getTakeByIndex(take_index)
+    if take is not None:
+        take.from_array(table)
 
 
 def get_shots_using_camera(
@@ -345,11 +407,82 @@ def get_shots_using_camera(
     return shot_manager.getShotsUsingCamera(cam, ignoreDisabled=ignore_disabled, takeIndex=take_index)
 
 
+def get_shots_sharing_camera(
+    shot_manager: UAS_ShotManager_Props,
+    cam: bpy.types.Camera,
+    ignore_disabled: bool = False,
+    take_index: int = -1,
+    in_all_takes: bool = True,
+):
+    """Return a dictionary with all the shots using the specified camera in the specified takes
+    The dictionary is made of "take name" / Shots array
+    """
+    return shot_manager.getShotsSharingCamera(
+        cam, ignoreDisabled=ignore_disabled, takeIndex=take_index, inAllTakes=in_all_takes
+    )
+
+
+def get_shots_sharing_camera_count(
+    shot_manager: UAS_ShotManager_Props, cam: bpy.types.Camera, ignore_disabled: bool = False
+):
+    """Return a tupple made by the number of shots, in all takes, using the camera and the number
+    of takes that have at least one shot using this camera
+    """
+    return shot_manager.getShotsSharingCameraCount(cam, ignoreDisabled=ignore_disabled)
+
+
+def get_num_shared_camera(
+    shot_manager: UAS_ShotManager_Props,
+    cam: bpy.types.Camera,
+    ignore_disabled: bool = False,
+    take_index: int = -1,
+    in_all_takes: bool = True,
+):
+    """Return the number of times the specified camera is used by the shots of the specified takes
+    0 means the camera is not used at all, -1 that the specified take is not valid
+    """
+    return shot_manager.getNumSharedCamera(
+        cam, ignoreDisabled=ignore_disabled, takeIndex=take_index, inAllTakes=in_all_takes
+    )
+
+
+def is_there_shared_cameras_in_take(
+    shot_manager: UAS_ShotManager_Props, ignore_disabled: bool = False, take_index: int = -1
+):
+    """Return True if there is at least 1 camera shared in the specified take, False otherwise"""
+    return shot_manager.isThereSharedCamerasInTake(ignoreDisabled=ignore_disabled, takeIndex=take_index)
+
+
 ####################
 # editing
 ####################
 
 
+def batch_edit(shot_manager: UAS_ShotManager_Props):
+    """Return a context manager deferring the updates triggered by the modifications of the shots
+    (selection, storyboard frames display, redraw...) until its exit, where they are applied once, eg:
+        with batch_edit(shot_manager):
+            for i in range(100):
+                add_shot(shot_manager, name=f"Sh{i:03}", start=i * 10, end=i * 10 + 9)
+    """
+    return shot_manager.batch_edit()
+
+
+def get_edit_model(shot_manager: UAS_ShotManager_Props, take_index: int = -1):
+    """Return a copy of the specified take and of its shots, independent from Blender, on which the edit can
+    be computed. Return None if the take is not valid
+    """
+    return shot_manager.getEditModel(takeIndex=take_index)
+
+
+def get_edit_generation(shot_manager: UAS_ShotManager_Props, take_index: int = None):
+    """Return the generation counter of the edit, incremented each time a shot or a take is changed.
+    If take_index is None the generation covers all the takes, otherwise only the specified take (-1 for the
+    current take)
+    """
+    return shot_manager.getEditGeneration(takeIndex=take_index)
+
+
 def get_edit_duration(shot_manager: UAS_ShotManager_Props, take_index: int = -1):
     """Return edit duration in frames"""
     return shot_manager.getEditDuration(takeIndex=take_index)
@@ -370,6 +503,23 @@ def get_edit_time(
     return shot_manager.getEditTime(reference_shot, frame_index_in_3D_time, referenceLevel=reference_level)
 
 
+def get_3D_time_from_edit_time(
+    shot_manager: UAS_ShotManager_Props,
+    frame_index_in_edit: int,
+    reference_level: str = "TAKE",
+    ignore_disabled: bool = True,
+    take_index: int = -1,
+):
+    """Reverse of get_edit_time: return a tupple made of the index of the shot displayed at the specified edit time,
+    in the whole shots list of the take, and of the corresponding frame in 3D time.
+    Return (-1, -1) if the edit time is out of the edit.
+    reference_level can be "TAKE" or "GLOBAL_EDIT"
+    """
+    return shot_manager.get3DTimeFromEditTime(
+        frame_index_in_edit, referenceLevel=reference_level, ignoreDisabled=ignore_disabled, takeIndex=take_index
+    )
+
+
 def get_edit_current_time(shot_manager: UAS_ShotManager_Props, reference_level: str = "TAKE"):
     """Return edit current time in frames, -1 if no shots or if current shot is disabled
     works only on current take
@@ -49,3 +49,17 @@ def get_num_shots(take_instance: UAS_ShotManager_Take, ignore_disabled: bool = F
 def get_shots_using_camera(take_instance: UAS_ShotManager_Take, cam: bpy.types.Camera, ignore_disabled: bool = False):
     """Return the list of all the shots used by the specified camera"""
     return take_instance.getShotsUsingCamera(cam, ignoreDisabled=ignore_disabled)
+
+
+def to_array(take_instance: UAS_ShotManager_Take):
+    """Return a snapshot of the timing data of the shots of the take as a NumPy structured array,
+    with the fields name, start, end, duration, enabled, durationLocked, camera and color
+    """
+    return take_instance.to_array()
+
+
+def from_array(take_instance: UAS_ShotManager_Take, table):
+    """Set in bulk the start and end values of the shots of the take from a table returned by to_array()
+    and modified
+    """
+    take_instance.from_array(table)
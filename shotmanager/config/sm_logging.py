@@ -35,6 +35,18 @@ import logging
 from ..utils.utils_python import asciiColor
 from ..config import config
 
+# levels of the modes of SM_Logger._print_ext
+_MODE_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# root of the add-on, used to shorten the paths of the log records
+_MODULE_PATH = Path(__file__).parent.parent
+
 
 def getLogger(name):
     return _logger
@@ -96,6 +108,9 @@ class SM_Logger(logging.getLoggerClass()):
             "OTHER": self._formatter_other,
         }
 
+        # key: tupple (color, form), value: Formatter instance
+        self._formattersCache = dict()
+
         self.tags = config.getLoggingTags()
 
     @property
@@ -105,6 +120,7 @@ class SM_Logger(logging.getLoggerClass()):
     @prefix.setter
     def prefix(self, value):
         self._prefix = value
+        self._formattersCache.clear()
 
     @property
     def addon_name(self):
@@ -113,6 +129,7 @@ class SM_Logger(logging.getLoggerClass()):
     @addon_name.setter
     def addon_name(self, value):
         self._addon_name = value
+        self._formattersCache.clear()
 
     def _getFormatter(self, col="", form="DEFAULT"):
         color = self._colors[col] if col != "" else ""
@@ -154,6 +171,14 @@ class SM_Logger(logging.getLoggerClass()):
             f = Formatter(_ENDCOLOR + self._prefix + " {message:<140}", style="{")
         return f
 
+    def _getCachedFormatter(self, col="", form="DEFAULT"):
+        """Return the formatter for the specified color and form, created only at the first call"""
+        f = self._formattersCache.get((col, form), None)
+        if f is None:
+            f = self._getFormatter(col, form)
+            self._formattersCache[(col, form)] = f
+        return f
+
     # def debug_basic(self, msg, extra=None, color="GREEN", formatter="OTHER"):
     #     ch = logging.StreamHandler()
     #     ch.setLevel(logging.DEBUG)
@@ -171,26 +196,35 @@ class SM_Logger(logging.getLoggerClass()):
         """
         ch = logging.StreamHandler()
         ch.setLevel(logging.DEBUG)
-        _logger.handlers[0].setFormatter(self._getFormatter(col, form))
+        _logger.handlers[0].setFormatter(self._getCachedFormatter(col, form))
 
-    def _print_ext(self, mode, msg, extra=None, col="", form="STD", tag=None, display=True):
+    def _print_ext(self, mode, msg, args=(), extra=None, col="", form="STD", tag=None, display=True):
         """
+        The level and the tag are checked before any formatting so that silenced messages cost almost nothing.
         Args:
             mode: "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"
+            msg: the message, or a callable without argument returning it, called only if the message is displayed
+            args: arguments merged in the message with the %-style formatting, only if the message is displayed
         """
         if not display:
             return
 
+        level = _MODE_LEVELS.get(mode, logging.INFO)
+        if not self.isEnabledFor(level):
+            return
+
         # accept or silence message display according to tags (if return is enabled then tag is ignored)
-        if tag is not None:
-            if tag in self.tags:
-                if not self.tags[tag]:
-                    return
+        if tag is not None and not self.tags.get(tag, True):
+            return
+
+        if callable(msg):
+            msg = msg()
 
         if "DEPRECATED" == tag:
             form = "DEPRECATED"
 
-        _logger.handlers[0].setFormatter(self._getFormatter(col, form))
+        handler = _logger.handlers[0]
+        handler.setFormatter(self._getCachedFormatter(col, form))
 
         # Note: marvellous parameter: stacklevel allows to get the call from the sender, otherwise
         # it is this function that is used and the path is not good
@@ -198,41 +232,35 @@ class SM_Logger(logging.getLoggerClass()):
         # and https://www.py4u.net/discuss/157715
         # Other possible approach: refactor all and use an "adaptater":
         # https://docs.python.org/3/howto/logging-cookbook.html#using-loggeradapters-to-impart-contextual-information
-        if "DEBUG" == mode:
-            super(SM_Logger, self).debug(("{}").format(msg), extra=extra, stacklevel=3)
-        elif "WARNING" == mode:
-            super(SM_Logger, self).warning(("{}").format(msg), extra=extra, stacklevel=3)
-        elif "ERROR" == mode:
-            super(SM_Logger, self).error(("{}").format(msg), extra=extra, stacklevel=3)
-        elif "CRITICAL" == mode:
-            super(SM_Logger, self).critical(("{}").format(msg), extra=extra, stacklevel=3)
-        # INFO
-        else:
-            super(SM_Logger, self).info(("{}").format(msg), extra=extra, stacklevel=3)
-
-        _logger.handlers[0].setFormatter(self._getFormatter(self._defaultColor, self._defaultForm))
-
-    def debug_ext(self, msg, extra=None, col="", form="STD", tag=None, display=True):
+        super(SM_Logger, self).log(level, msg, *args, extra=extra, stacklevel=3)
+
+        handler.setFormatter(self._getCachedFormatter(self._defaultColor, self._defaultForm))
+
+    def debug_ext(self, msg, *args, extra=None, col="", form="STD", tag=None, display=True):
         """
         eg:
         _logger.debug_ext(f"message: {text}", tag="DEPRECATED")
         _logger.warning_ext(f"message: {text}")
+
+        In hot paths use %-style arguments or a callable so that the message is built only if it is displayed:
+        _logger.debug_ext("message: %s", text, tag="SHOTS_PLAY_MODE")
+        _logger.debug_ext(lambda: f"message: {text}", tag="SHOTS_PLAY_MODE")
         """
         if form in ["REG", "UNREG"]:
             tag = form
-        self._print_ext("DEBUG", msg, extra=extra, col=col, form=form, tag=tag, display=display)
+        self._print_ext("DEBUG", msg, args, extra=extra, col=col, form=form, tag=tag, display=display)
 
-    def info_ext(self, msg, extra=None, col="DEFAULT", form="INFO", tag=None, display=True):
-        self._print_ext("INFO", msg, extra=extra, col=col, form=form, tag=tag, display=display)
+    def info_ext(self, msg, *args, extra=None, col="DEFAULT", form="INFO", tag=None, display=True):
+        self._print_ext("INFO", msg, args, extra=extra, col=col, form=form, tag=tag, display=display)
 
-    def warning_ext(self, msg, extra=None, col="ORANGE", form="WARNING", tag=None, display=True):
-        self._print_ext("WARNING", msg, extra=extra, col=col, form=form, tag=tag, display=display)
+    def warning_ext(self, msg, *args, extra=None, col="ORANGE", form="WARNING", tag=None, display=True):
+        self._print_ext("WARNING", msg, args, extra=extra, col=col, form=form, tag=tag, display=display)
 
-    def error_ext(self, msg, extra=None, col="RED", form="ERROR", tag=None, display=True):
-        self._print_ext("ERROR", msg, extra=extra, col=col, form=form, tag=tag, display=display)
+    def error_ext(self, msg, *args, extra=None, col="RED", form="ERROR", tag=None, display=True):
+        self._print_ext("ERROR", msg, args, extra=extra, col=col, form=form, tag=tag, display=display)
 
-    def critical_ext(self, msg, extra=None, col="RED_BG", form="CRITICAL", tag=None, display=True):
-        self._print_ext("CRITICAL", msg, extra=extra, col=col, form=form, tag=tag, display=display)
+    def critical_ext(self, msg, *args, extra=None, col="RED_BG", form="CRITICAL", tag=None, display=True):
+        self._print_ext("CRITICAL", msg, args, extra=extra, col=col, form=form, tag=tag, display=display)
 
     # custom function
     def print_ext(self, msg, col="DEFAULT", tag=None, display=True):
@@ -258,9 +286,7 @@ class Formatter(logging.Formatter):
         s = super().format(record)
 
         if self.append_origin:
-            MODULE_PATH = Path(__file__).parent.parent
-            # print("MODULE_PATH:" + str(MODULE_PATH))
-            pathname = Path(record.pathname).relative_to(MODULE_PATH)
+            pathname = Path(record.pathname).relative_to(_MODULE_PATH)
 
             # display the full relative path
             # s += f"  [{os.curdir}{os.sep}{pathname}:{record.lineno}]"
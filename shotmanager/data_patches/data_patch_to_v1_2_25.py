@@ -21,6 +21,7 @@ Data patch
 
 import bpy
 from ..utils import utils
+from ..utils import utils_shot_manager
 from shotmanager.config import config
 
 
@@ -40,12 +41,10 @@ def data_patch_to_v1_2_25():
 
                 # apply patch and apply new data version
                 #   print("       Applying data patch data_patch_to_v1_2_25 to scenes")
-                takes = props.getTakes()
-                for take in takes:
-                    take.getParentScene()
-                    shots = props.getShotsList()
-                    for shot in shots:
-                        shot.getParentScene()
+                # the parent scenes of the takes and shots of all the scenes are resolved in a single pass
+                numFixed, duration = utils_shot_manager.resolveMissingParentScenes()
+                if numFixed:
+                    print(f"       Fixed {numFixed} parent scene(s) in {duration:.3f} s")
 
                 # set right data version
                 # props.dataVersion = bpy.context.window_manager.UAS_shot_manager_version
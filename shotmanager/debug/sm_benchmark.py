@@ -0,0 +1,233 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Headless benchmark of the core edit operations of Shot Manager
+
+Synthetic scenes are built for each combination of number of shots and number of takes, with cameras
+shared between several shots and some disabled shots, and the core functions of the API are timed on them.
+The results are written in a JSON file that can be compared between versions.
+
+Usage, with the add-on installed:
+    blender -b --factory-startup --python sm_benchmark.py -- --output benchmark.json
+    blender -b --factory-startup --python sm_benchmark.py -- --shots 10 100 1000 --takes 1 10 50 --repeat 5
+
+Durations are in milliseconds.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import bpy
+import addon_utils
+
+# a shot in every NUM_SHOTS_PER_DISABLED_SHOT is disabled
+NUM_SHOTS_PER_DISABLED_SHOT = 5
+
+# number of shots sharing each camera
+NUM_SHOTS_PER_CAMERA = 3
+
+SHOT_DURATION = 24
+
+
+def _parseArgs():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Shot Manager headless benchmark")
+    parser.add_argument("--output", default="", help="Path of the JSON result file. Printed if not specified")
+    parser.add_argument("--shots", type=int, nargs="+", default=[10, 100, 1000], help="Numbers of shots per take")
+    parser.add_argument("--takes", type=int, nargs="+", default=[1, 10, 50], help="Numbers of takes")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each measure")
+    return parser.parse_args(argv)
+
+
+def _timeIt(func, repeat):
+    """Run func repeat times and return the min, mean and max durations of the runs, in ms"""
+    durations = []
+    for _i in range(repeat):
+        startTime = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - startTime) * 1000.0)
+    return {"min_ms": min(durations), "mean_ms": sum(durations) / len(durations), "max_ms": max(durations)}
+
+
+def _buildScene(numShots, numTakes):
+    """Create a scene with numTakes takes of numShots shots each, with shared cameras and disabled shots"""
+    from shotmanager.api import shot_manager
+
+    scene = bpy.data.scenes.new(f"SM_Benchmark_{numShots}x{numTakes}")
+    scene.frame_start = 10
+    scene.frame_end = 10 + numShots * SHOT_DURATION
+
+    with bpy.context.temp_override(scene=scene):
+        props = shot_manager.get_shot_manager(scene)
+        shot_manager.initialize_shot_manager(props)
+
+        numCameras = max(1, numShots // NUM_SHOTS_PER_CAMERA)
+        cameras = []
+        for i in range(numCameras):
+            cam = bpy.data.objects.new(f"Cam_{scene.name}_{i:04}", bpy.data.cameras.new(f"Cam_{scene.name}_{i:04}"))
+            scene.collection.objects.link(cam)
+            cameras.append(cam)
+
+        for takeInd in range(numTakes):
+            if 0 < takeInd:
+                shot_manager.add_take(props, at_index=-1, name=f"Take_{takeInd:02}")
+            with shot_manager.batch_edit(props):
+                for i in range(numShots):
+                    start = 10 + i * SHOT_DURATION
+                    shot_manager.add_shot(
+                        props,
+                        at_index=-1,
+                        take_index=takeInd,
+                        name=f"Sh{i * 10:04}",
+                        start=start,
+                        end=start + SHOT_DURATION - 1,
+                        camera=cameras[i % numCameras],
+                        enabled=0 != (i + 1) % NUM_SHOTS_PER_DISABLED_SHOT,
+                    )
+        shot_manager.set_current_take_by_index(props, 0)
+
+    return scene
+
+
+def _benchmarkScene(scene, repeat):
+    """Time the core operations on the current take of the scene"""
+    from shotmanager.api import shot_manager
+    from shotmanager.properties import play_schedule
+
+    timings = dict()
+
+    with bpy.context.temp_override(scene=scene):
+        props = shot_manager.get_shot_manager(scene)
+        shots = shot_manager.get_shots(props)
+        enabledShots = shot_manager.get_shots_list(props, ignore_disabled=True)
+
+        def _getEditTime():
+            for shot in enabledShots:
+                shot_manager.get_edit_time(props, shot, shot.start + 1)
+
+        timings["getEditTime"] = _timeIt(_getEditTime, repeat)
+
+        def _getCurrentShotIndex():
+            for i in range(len(shots)):
+                props.current_shot_index = i
+                shot_manager.get_current_shot_index(props, ignore_disabled=True)
+
+        timings["getCurrentShotIndex"] = _timeIt(_getCurrentShotIndex, repeat)
+
+        def _navigateShots():
+            shot_manager.set_current_shot_by_index(props, 0)
+            for _i in range(len(shots)):
+                shot_manager.go_to_next_shot(props, scene.frame_current)
+            for _i in range(len(shots)):
+                shot_manager.go_to_previous_shot(props, scene.frame_current)
+
+        timings["shotNavigation"] = _timeIt(_navigateShots, repeat)
+
+        def _getShotsSharingCamera():
+            for shot in shots:
+                props.getShotsSharingCamera(shot.camera)
+
+        timings["getShotsSharingCamera"] = _timeIt(_getShotsSharingCamera, repeat)
+
+        # the schedules are cleared so that the schedule is compiled at each run
+        def _compilePlaySchedule():
+            play_schedule.clearAll()
+            play_schedule.getPlaySchedule(props, scene)
+
+        timings["playScheduleCompilation"] = _timeIt(_compilePlaySchedule, repeat)
+
+        def _stepShotsPlayMode():
+            schedule = play_schedule.getPlaySchedule(props, scene)
+            shotInd = shot_manager.get_first_shot_index(props, ignore_disabled=True)
+            for frame in range(scene.frame_start, scene.frame_end + 1):
+                jump = schedule.getJump(shotInd, frame)
+                if jump is not None:
+                    shotInd = jump[0]
+
+        timings["shotsPlayModeStepping"] = _timeIt(_stepShotsPlayMode, repeat)
+
+        currentTake = shot_manager.get_current_take(props)
+        timings["copyTake"] = _timeIt(lambda: shot_manager.copy_take(props, currentTake), repeat)
+
+        # shots are removed from the last copied take so that the other measures are not affected
+        copiedTakeInd = len(shot_manager.get_takes(props)) - 1
+        copiedShots = shot_manager.get_shots(props, take_index=copiedTakeInd)
+        numShotsToRemove = min(len(copiedShots) // max(1, repeat), 100)
+
+        def _removeShots():
+            for _i in range(numShotsToRemove):
+                if len(copiedShots):
+                    shot_manager.remove_shot(props, copiedShots[len(copiedShots) - 1])
+
+        timings["removeShot"] = _timeIt(_removeShots, repeat)
+        timings["removeShot"]["numShotsPerRun"] = numShotsToRemove
+
+    return timings
+
+
+def runBenchmark(numShotsList, numTakesList, repeat=3):
+    """Build the synthetic scenes and return the benchmark results as a dictionary"""
+    from shotmanager.config import config
+
+    props = config.getAddonProps(bpy.context.scene)
+    results = {
+        "shotManagerVersion": props.version()[0] if props.version() is not None else "",
+        "blenderVersion": bpy.app.version_string,
+        "repeat": repeat,
+        "results": [],
+    }
+
+    for numTakes in numTakesList:
+        for numShots in numShotsList:
+            print(f"Shot Manager benchmark: {numShots} shots x {numTakes} takes...")
+            startTime = time.perf_counter()
+            scene = _buildScene(numShots, numTakes)
+            buildDuration = (time.perf_counter() - startTime) * 1000.0
+
+            results["results"].append(
+                {
+                    "numShots": numShots,
+                    "numTakes": numTakes,
+                    "sceneBuild_ms": buildDuration,
+                    "timings": _benchmarkScene(scene, repeat),
+                }
+            )
+            bpy.data.scenes.remove(scene)
+
+    return results
+
+
+def main():
+    args = _parseArgs()
+
+    addon_utils.enable("shotmanager", default_set=True)
+
+    results = runBenchmark(args.shots, args.takes, repeat=args.repeat)
+    resultsStr = json.dumps(results, indent=4)
+    if "" == args.output:
+        print(resultsStr)
+    else:
+        with open(args.output, "w") as f:
+            f.write(resultsStr)
+        print(f"Shot Manager benchmark results written in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
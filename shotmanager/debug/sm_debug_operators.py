@@ -21,6 +21,9 @@ Shot Manager debug operators
 
 import bpy
 from bpy.types import Operator
+from bpy.props import StringProperty
+
+from shotmanager.utils import utils_profiling
 
 
 class UAS_compositeVideoInVSE(Operator):
@@ -95,7 +98,35 @@ class UAS_PrintDebugTextColor(Operator):
         return {"FINISHED"}
 
 
-_classes = (UAS_compositeVideoInVSE, UAS_PrintDebugTextColor)
+class UAS_ExportHandlersProfiling(Operator):
+    bl_idname = "uas.debug_export_handlers_profiling"
+    bl_label = "Export Handlers Profiling"
+    bl_description = "Export the latency statistics of the profiled handlers to a JSON file"
+
+    filepath: StringProperty(subtype="FILE_PATH", default="shotmanager_handlers_profiling.json")
+    filter_glob: StringProperty(default="*.json", options={"HIDDEN"})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        utils_profiling.exportProfilesToJson(bpy.path.abspath(self.filepath))
+        self.report({"INFO"}, f"Handlers profiling exported to {self.filepath}")
+        return {"FINISHED"}
+
+
+class UAS_ResetHandlersProfiling(Operator):
+    bl_idname = "uas.debug_reset_handlers_profiling"
+    bl_label = "Reset"
+    bl_description = "Clear the latency statistics of the profiled handlers"
+
+    def execute(self, context):
+        utils_profiling.resetProfiles()
+        return {"FINISHED"}
+
+
+_classes = (UAS_compositeVideoInVSE, UAS_PrintDebugTextColor, UAS_ExportHandlersProfiling, UAS_ResetHandlersProfiling)
 
 
 def register():
@@ -156,6 +156,12 @@ class UAS_PT_Shot_Manager_Debug(Panel):
         row = layout.row()
         row.operator("uas_debug.timeline_modal_rect")
 
+        layout.separator()
+        row = layout.row(align=True)
+        row.prop(context.window_manager, "UAS_shot_manager_profile_handlers")
+        row.operator("uas.debug_reset_handlers_profiling", text="", icon="TRASH")
+        row.operator("uas.debug_export_handlers_profiling", text="", icon="EXPORT")
+
         layout.separator()
 
         self.drawDebugAnim(layout)
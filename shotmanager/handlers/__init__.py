@@ -76,6 +76,12 @@ def register():
     bpy.app.handlers.load_pre.append(sm_handlers.shotMngHandler_load_pre)
     bpy.app.handlers.load_post.append(sm_handlers.shotMngHandler_load_post)
 
+    # save
+    bpy.app.handlers.save_post.append(sm_handlers.shotMngHandler_save_post)
+
+    # data changes
+    bpy.app.handlers.depsgraph_update_post.append(sm_handlers.shotMngHandler_depsgraph_update_post)
+
     # undo
     bpy.app.handlers.undo_pre.append(sm_handlers.shotMngHandler_undo_pre)
     bpy.app.handlers.undo_post.append(sm_handlers.shotMngHandler_undo_post)
@@ -140,6 +146,12 @@ def unregister():
     bpy.app.handlers.load_pre.remove(sm_handlers.shotMngHandler_load_pre)
     bpy.app.handlers.load_post.remove(sm_handlers.shotMngHandler_load_post)
 
+    # save
+    bpy.app.handlers.save_post.remove(sm_handlers.shotMngHandler_save_post)
+
+    # data changes
+    bpy.app.handlers.depsgraph_update_post.remove(sm_handlers.shotMngHandler_depsgraph_update_post)
+
     # if True:
     utils_handlers.removeAllHandlerOccurences(
         shotMngHandler_load_post_checkDataVersion, handlerCateg=bpy.app.handlers.load_post
@@ -56,6 +56,13 @@ def shotMngHandler_load_post_checkDataVersion(self, context):
         _logger.debug_ext("Before changes:", col="PINK")
         _logger.debug_ext(checkStr, col="PINK")
 
+        # resolving the missing parent scenes of all the Shot Manager instances, takes and shots at once
+        numParentScenesFixed, duration = utils_shot_manager.resolveMissingParentScenes()
+        if numParentScenesFixed:
+            _logger.info_ext(
+                f"Fixed {numParentScenesFixed} missing Shot Manager parent scene(s) in {duration:.3f} s", col="GREEN"
+            )
+
         numScenesToUpgrade = 0
         lowerSceneVersion = -1
 
@@ -105,13 +112,6 @@ def shotMngHandler_load_post_checkDataVersion(self, context):
                 # props.dataVersion = bpy.context.window_manager.UAS_shot_manager_version
                 # print("       Data upgraded to version V. ", props.dataVersion)
 
-            # fixing issues "on the fly"
-            if props.parentScene is None:
-                props.getParentScene()
-                _logger.info_ext(
-                    f"Fixed Shot Manager parent scene issue in the following scene: {scene.name}", col="GREEN"
-                )
-
             _logger.info_ext(f"{infoTxt}", col="GREEN")
 
         if numScenesToUpgrade:
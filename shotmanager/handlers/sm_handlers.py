@@ -23,6 +23,9 @@ import bpy
 from bpy.app.handlers import persistent
 
 from shotmanager.config import config
+from shotmanager.properties import edit_index
+from shotmanager.properties import play_schedule
+from shotmanager.warnings import warnings
 from shotmanager.config import sm_logging
 
 _logger = sm_logging.getLogger(__name__)
@@ -42,6 +45,10 @@ def shotMngHandler_undo_pre(self, context):
 def shotMngHandler_undo_post(self, context):
     _logger.debug_ext("Handler: Undo Post", col="GREEN_LIGHT", tag="HANDLER")
 
+    edit_index.clearAll()
+    play_schedule.clearAll()
+    warnings.invalidateWarnings()
+
 
 @persistent
 def shotMngHandler_redo_pre(self, context):
@@ -57,17 +64,28 @@ def shotMngHandler_redo_pre(self, context):
 def shotMngHandler_redo_post(self, context):
     _logger.debug_ext("Handler: Redo Post", col="GREEN_LIGHT", tag="HANDLER")
 
+    edit_index.clearAll()
+    play_schedule.clearAll()
+    warnings.invalidateWarnings()
+
 
 @persistent
 def shotMngHandler_load_pre(self, context):
     _logger.debug_ext("Handler: Load Pre", col="GREEN_LIGHT", tag="HANDLER")
     bpy.context.window_manager.UAS_shot_manager_display_overlay_tools = False
 
+    # done before the load so that the other load_post handlers don't use the indices of the previous file
+    edit_index.clearAll()
+    play_schedule.clearAll()
+    warnings.clearAll()
+
 
 @persistent
 def shotMngHandler_load_post(self, context):
     _logger.debug_ext("Handler: Load Post", col="GREEN_LIGHT", tag="HANDLER")
 
+    warnings.clearAll()
+
     # bpy.ops.uas_shot_manager.sequence_timeline.cancel(bpy.context)
 
     # bpy.context.window_manager.event_timer_remove(bpy.ops.uas_shot_manager.sequence_timeline.draw_event)
@@ -75,3 +93,17 @@ def shotMngHandler_load_post(self, context):
 
     # bpy.ops.uas_shot_manager.sequence_timeline.unregister_handlers(context)
     # bpy.context.window_manager.UAS_shot_manager_display_overlay_tools = False
+
+
+@persistent
+def shotMngHandler_depsgraph_update_post(scene, depsgraph):
+    # no log here, this handler is called at each modification of the data
+    warnings.invalidateWarnings()
+
+
+@persistent
+def shotMngHandler_save_post(self, context):
+    _logger.debug_ext("Handler: Save Post", col="GREEN_LIGHT", tag="HANDLER")
+
+    # the file path and the read-only state of the file may have changed
+    warnings.clearAll()
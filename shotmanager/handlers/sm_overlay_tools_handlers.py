@@ -22,6 +22,8 @@ Handlers specific to overlay tools
 import bpy
 
 from shotmanager.utils import utils_handlers
+from shotmanager.utils.utils_profiling import profiledHandler
+from shotmanager.properties import play_schedule
 
 
 from shotmanager.config import config
@@ -41,11 +43,9 @@ def install_handler_for_shot(self, context):
         self.UAS_shot_manager_shots_play_mode
         and shotMngHandler_frame_change_pre_jumpToShot not in bpy.app.handlers.frame_change_pre
     ):
-        shots = props.get_shots()
-        for i, shot in enumerate(shots):
-            if shot.start <= scene.frame_current <= shot.end:
-                props.current_shot_index = i
-                break
+        shotInd = props.getFirstShotIndexContainingFrame(scene.frame_current)
+        if -1 != shotInd:
+            props.current_shot_index = shotInd
         bpy.app.handlers.frame_change_pre.append(shotMngHandler_frame_change_pre_jumpToShot)
     #     bpy.app.handlers.frame_change_post.append(shotMngHandler_frame_change_pre_jumpToShot__frame_change_post)
 
@@ -101,78 +101,10 @@ def toggle_overlay_tools_display(context):
     # context.scene.frame_current = context.scene.frame_current
 
 
+@profiledHandler("frame_change_pre")
 def shotMngHandler_frame_change_pre_jumpToShot(scene):
     props = config.getAddonProps(scene)
 
-    def _get_range_start():
-        return scene.frame_preview_start if scene.use_preview_range else scene.frame_start
-
-    def _get_range_end():
-        return scene.frame_preview_end if scene.use_preview_range else scene.frame_end
-
-    def _get_previous_shot(shots, current_shot_index):
-        index = current_shot_index
-        if index > 0:
-            previous_shots = [s for s in shots[:index] if s.enabled]
-            if len(previous_shots):
-                return previous_shots[-1]
-
-        return None
-
-    def _get_next_shot(shots, current_shot_index):
-        """If next shot is out of the anim range then return None"""
-        index = current_shot_index + 1
-        # if index < len(shots) - 1:
-        #     next_shots = [s for s in shots[index + 1 :] if s.enabled]
-        #     if len(next_shots):
-        #         return next_shots[0]
-
-        while index < len(shots):
-            if shots[index].enabled:
-                if shots[index].start <= _get_range_end() and shots[index].start >= _get_range_start():
-                    return shots[index]
-                else:
-                    return None
-            else:
-                index += 1
-        return None
-
-    def _get_max_start_frame(shot):
-        """Return the max between the start of the shot and the start of the anim range"""
-        time = _get_range_start()
-        if shot.start >= _get_range_start() and shot.start <= _get_range_end():
-            time = shot.start
-        return time
-
-    def _get_first_continuous_shot_index(shots, current_shot_index):
-        """Return the index of the first enabled shot that is:
-            - before current_shot_index
-            - either completely in the anim range or has just its start out (not the end!)
-            - that can be reached by going back in the shot list from current_shot_index without meeting
-              a shot that has its end out
-        If no such shot is found them we use current shot
-        """
-
-        if shots[current_shot_index].start < _get_range_start():
-            return current_shot_index
-
-        lastValidShotInd = current_shot_index
-        i = current_shot_index - 1
-        while 0 <= i:
-            if shots[i].enabled:
-                if shots[i].end > _get_range_end():
-                    break
-                if shots[i].end < _get_range_start():
-                    break
-                if shots[i].start < _get_range_start():
-                    lastValidShotInd = i
-                    break
-                if shots[i].start >= _get_range_start():
-                    lastValidShotInd = i
-            i -= 1
-
-        return lastValidShotInd
-
     shotList = props.get_shots()
     if len(shotList) <= 0:
         return
@@ -183,10 +115,6 @@ def shotMngHandler_frame_change_pre_jumpToShot(scene):
     current_shot = shotList[current_shot_index]
     current_frame = scene.frame_current
 
-    # clip shot to scene timeframe. Might not be necessary
-    current_shot_start = current_shot.start
-    current_shot_end = current_shot.end
-
     if not bpy.context.screen.is_animation_playing:
         return
 
@@ -199,148 +127,27 @@ def shotMngHandler_frame_change_pre_jumpToShot(scene):
     ## animation is playing
     #########################################
     if not scrubbing:
-        # Order of if clauses is very important.
-
-        #   _logger.debug_ext("*** Not Scrubbing:", col="RED", tag="SHOTS_PLAY_MODE")
-
-        # messages for range start and end
-        inforStr = ""
-        if _get_range_start() == current_frame:
-            inforStr = "  ** Range Start **"
-        if _get_range_end() == current_frame:
-            inforStr = "  ** Range End **"
-
-        _logger.debug_ext(f"current_frame: {current_frame}  {inforStr}", col="YELLOW", tag="SHOTS_PLAY_MODE")
+        # the jumps are precomputed for each shot in the play schedule, compiled again only when the shots
+        # or the animation range change
+        schedule = play_schedule.getPlaySchedule(props, scene)
+        jump = schedule.getJump(current_shot_index, current_frame)
 
-        if current_frame == current_shot.start:
+        if jump is not None:
+            shotInd, frame = jump
             _logger.debug_ext(
-                f"   current frame is at start of current shot: {current_shot.name}",
-                col="GREEN_LIGHT",
+                "current_frame: %s, current shot: %s, jump to: %s at %s",
+                current_frame,
+                current_shot.name,
+                shotList[shotInd].name,
+                frame,
+                col="PURPLE",
                 tag="SHOTS_PLAY_MODE",
             )
-        elif current_frame == current_shot.end:
-            _logger.debug_ext(
-                f"   current frame is at end of current shot: {current_frame}", col="ORANGE", tag="SHOTS_PLAY_MODE"
-            )
-
-        if current_frame == _get_range_start():
-            # we are here when the play head reached the anim range end and has been put back by Blender
-            # to the start of the range
-
-            if current_frame == current_shot.start:
-                # case where the current shot is not the first one of the edit, starts at the same time as the first one and
-                # this time is also the anim range start. Then we want to preserve the current shot
-                _logger.debug_ext(
-                    f"1 current_frame == range start and current_frame == current_shot.start, current shot: {current_shot.name}",
-                    col="GREEN",
-                    tag="SHOTS_PLAY_MODE",
-                )
-                pass
-            else:
-                lookForFirstShot = True
-                if _get_range_end() == current_shot.end:
-                    next_shot = _get_next_shot(shotList, current_shot_index)
-                    if next_shot is not None:
-                        # next_shot_index = props.getShotIndex(next_shot)
-
-                        _logger.debug_ext(
-                            f"2 current_frame == range start, current shot: {current_shot.name}, next_shot: {next_shot.name}",
-                            col="GREEN",
-                            tag="SHOTS_PLAY_MODE",
-                        )
-
-                        props.setCurrentShot(next_shot, changeTime=False)
-                        scene.frame_current = next_shot.start
-
-                        lookForFirstShot = False
-
-                if lookForFirstShot:
-                    # if True:
-                    firstShotInd = _get_first_continuous_shot_index(shotList, current_shot_index)
-                    _logger.debug_ext(
-                        f"3 current_frame == range start, current shot: {current_shot.name}, first conti: {shotList[firstShotInd].name}",
-                        col="GREEN",
-                        tag="SHOTS_PLAY_MODE",
-                    )
-                    firstFrame = _get_max_start_frame(shotList[firstShotInd])
-                    if current_shot_index != firstShotInd:
-                        props.setCurrentShot(shotList[firstShotInd], changeTime=False)
-                    # if we put this condition we avoid the frame to be played 2 times but we don't see the new shot becoming current
-                    # if firstFrame != current_frame:
-                    scene.frame_current = firstFrame
-        elif (
-            current_frame == _get_range_end() and _get_previous_shot(shotList, current_shot_index) is None
-        ):  # While backward playing if we hit the last frame and we are playing the first shot jump to the last shot.
-            _logger.debug_ext("current_frame == _get_range_end()", col="PURPLE", tag="SHOTS_PLAY_MODE")
-            firstShotInd = _get_first_continuous_shot_index(shotList, current_shot_index)
-            firstFrame = _get_max_start_frame(shotList[firstShotInd])
-            if current_shot_index != firstShotInd:
-                props.setCurrentShot(shotList[firstShotInd], changeTime=False)
-            # if we put this condition we avoid the frame to be played 2 times but we don't see the new shot becoming current
-            # if firstFrame != current_frame:
-            scene.frame_current = firstFrame
-
-            # last_enabled = [s for s in shotList if s.enabled][-1]
-            # props.setCurrentShot(last_enabled, changeTime=False)
-            # scene.frame_current = last_enabled.end
-        elif current_frame > current_shot_end:
-            _logger.debug_ext("current_frame > current_shot_end", col="PURPLE", tag="SHOTS_PLAY_MODE")
-            disp = current_frame - current_shot_end
-            next_shot = _get_next_shot(shotList, current_shot_index)
-
-            if next_shot is None:
-                _logger.debug_ext("next shot is none", col="PURPLE", tag="SHOTS_PLAY_MODE")
-
-                firstShotInd = _get_first_continuous_shot_index(shotList, current_shot_index)
-                firstFrame = _get_max_start_frame(shotList[firstShotInd])
-                if current_shot_index != firstShotInd:
-                    props.setCurrentShot(shotList[firstShotInd], changeTime=False)
-                # if we put this condition we avoid the frame to be played 2 times but we don't see the new shot becoming current
-                # if firstFrame != current_frame:
-                scene.frame_current = firstFrame
-            else:
-                _logger.debug_ext("next shot is NOT none", col="PURPLE", tag="SHOTS_PLAY_MODE")
-                if current_shot != next_shot:
-                    _logger.debug_ext("   next shot is NOT none 01", col="PURPLE", tag="SHOTS_PLAY_MODE")
-                    props.setCurrentShot(next_shot, changeTime=False)
-                _logger.debug_ext(f"   next shot is {next_shot.name}", col="PURPLE", tag="SHOTS_PLAY_MODE")
-                scene.frame_current = next_shot.start
-
-            # while next_shot is not None:
-            #     if disp < next_shot.getDuration():
-            #         props.setCurrentShot(next_shot, changeTime=False)
-            #         scene.frame_current = next_shot.start + disp
-            #         break
-            #     disp -= next_shot.getDuration()
-            #     next_shot = _get_next_shot(shotList, current_shot_index)
-            # else:
-            #     # Scene end is farther than the last shot so loop back.
-            #     props.setCurrentShot([s for s in shotList if s.enabled][0], changeTime=False)
-        elif (
-            current_frame == _get_range_start() and _get_next_shot(shotList, current_shot_index) is None
-        ):  # While forward playing if we hit the first frame and we are playing the last shot jump to the first shot.
-            # Seems that the first frame is always hit even in frame dropping playblack
-            _logger.debug_ext("current_frame == _get_range_start()", col="PURPLE")
-            props.setCurrentShot([s for s in shotList if s.enabled][0], changeTime=False)
-        elif current_frame < current_shot_start:
-            _logger.debug_ext("current_frame < current_shot_start", col="ORANGE")
-            disp = current_shot_start - current_frame
-            previous_shot = _get_previous_shot(shotList, current_shot_index)
-            while previous_shot is not None:
-                if disp < previous_shot.getDuration():
-                    props.setCurrentShot(previous_shot, changeTime=False)
-                    scene.frame_current = previous_shot.end - disp
-                    break
-                disp -= previous_shot.getDuration()
-                previous_shot = _get_previous_shot(shotList, current_shot_index)
-            else:
-                # Scene end is farther than the first shot so loop back.
-                last_enabled = [s for s in shotList if s.enabled][-1]
-                props.setCurrentShot(last_enabled, changeTime=False)
-                scene.frame_current = last_enabled.end
-        else:
-            # _logger.debug_ext("current_frame Else", col="RED")
-            pass
+            if current_shot_index != shotInd:
+                props.setCurrentShot(shotList[shotInd], changeTime=False)
+            # if we checked that the frame is different from the current one we would avoid the frame to be played
+            # 2 times but we would not see the new shot becoming current
+            scene.frame_current = frame
 
     #########################################
     ## user is scrubbing
@@ -350,14 +157,10 @@ def shotMngHandler_frame_change_pre_jumpToShot(scene):
 
         # User is scrubbing in the timeline so try to guess a shot in the range of the timeline.
         if not (current_shot.start <= current_frame <= current_shot.end):
-            candidates = list()
-            for i, shot in enumerate(shotList):
-                # wk
-                if shot.enabled and shot.start <= current_frame <= shot.end:
-                    candidates.append((i, shot))
-
-            if 0 < len(candidates):
-                props.setCurrentShot(candidates[0][1], changeTime=False)
+            candidateInd = props.getFirstShotIndexContainingFrame(current_frame, ignoreDisabled=True)
+
+            if -1 != candidateInd:
+                props.setCurrentShot(shotList[candidateInd], changeTime=False)
                 scene.frame_current = current_frame
             else:
                 # case were the new current time is out of every shots
@@ -59,6 +59,7 @@ from ..ui import sm_ui
 
 from ..utils import utils
 from ..utils import utils_render
+from ..utils import utils_profiling
 from ..utils import utils_operators
 from ..utils import utils_operators_overlays
 from ..utils.utils_os import module_can_be_imported
@@ -295,6 +296,18 @@ def register():
         default=False,
     )
 
+    def _update_UAS_shot_manager_profile_handlers(self, context):
+        utils_profiling.setProfilingEnabled(self.UAS_shot_manager_profile_handlers)
+
+    bpy.types.WindowManager.UAS_shot_manager_profile_handlers = BoolProperty(
+        name="Profile Handlers",
+        description="Measure the duration of the frame change handlers and of the overlay tools draw handlers"
+        "\nand count the frames where they exceed the frame budget (1 / fps)."
+        "\nThe statistics are displayed in the target 3D viewport when the 3D viewports are identified",
+        update=_update_UAS_shot_manager_profile_handlers,
+        default=False,
+    )
+
     bpy.types.WindowManager.UAS_shot_manager_progressbar = FloatProperty(
         name="Progress Bbar",
         description="Value of the progress bar",
@@ -434,6 +447,8 @@ def unregister():
 
     del bpy.types.WindowManager.UAS_shot_manager_shots_play_mode
     del bpy.types.WindowManager.UAS_shot_manager_display_overlay_tools
+    del bpy.types.WindowManager.UAS_shot_manager_profile_handlers
+    utils_profiling.setProfilingEnabled(False)
 
     #   del bpy.types.WindowManager.UAS_shot_manager_isInitialized
     del bpy.types.WindowManager.UAS_shot_manager_version
@@ -1301,16 +1301,17 @@ class UAS_ShotManager_CreateShotsFromEachCamera(Operator):
         if len(cams):
             duration = scene.frame_end - scene.frame_start + 1
 
-            for i, cam in enumerate(cams):
-                shotName = props.getShotPrefix((i + 1) * 10)
-                props.addShot(
-                    atIndex=selectedShotInd + i + 1,
-                    camera=cam,
-                    name=shotName,
-                    start=scene.frame_start + i * int(duration / len(cams)),
-                    end=scene.frame_start + (i + 1) * int(duration / len(cams)) - 1,
-                    color=(uniform(0, 1), uniform(0, 1), uniform(0, 1), 1),
-                )
+            with props.batch_edit():
+                for i, cam in enumerate(cams):
+                    shotName = props.getShotPrefix((i + 1) * 10)
+                    props.addShot(
+                        atIndex=selectedShotInd + i + 1,
+                        camera=cam,
+                        name=shotName,
+                        start=scene.frame_start + i * int(duration / len(cams)),
+                        end=scene.frame_start + (i + 1) * int(duration / len(cams)) - 1,
+                        color=(uniform(0, 1), uniform(0, 1), uniform(0, 1), 1),
+                    )
 
             if -1 == currentShotInd:
                 props.setCurrentShotByIndex(0)
@@ -1432,26 +1433,30 @@ class UAS_ShotManager_CreateNShots(Operator):
                 col[1] = cam.color[1]
                 col[2] = cam.color[2]
 
-        for i in range(1, self.count + 1):
-            if props.use_project_settings:
-                newShotName = props.getUniqueShotName(props.getShotPrefix((len(props.getShotsList()) + 1) * 10))
-            else:
-                newShotName = props.getUniqueShotName(props._replaceHashByNumber(self.name, (i + 1) * 10))
-            startFrame = self.start + (i - 1) * (self.duration - 1 + self.offsetFromPrevious)
-            endFrame = startFrame + self.duration - 1
-
-            if "NEW_CAMERAS" == self.cameraName:
-                cam = utils.create_new_camera("Cam_" + newShotName)
-
-            props.addShot(
-                atIndex=newShotInd,
-                name=newShotName,
-                start=startFrame,
-                end=endFrame,
-                camera=cam,
-                color=cam.color,
-            )
-            newShotInd += 1
+        shotNamesAllocator = props.getShotNamesAllocator()
+        with props.batch_edit():
+            for i in range(1, self.count + 1):
+                if props.use_project_settings:
+                    newShotName = shotNamesAllocator.getUniqueName(
+                        props.getShotPrefix((len(props.get_shots()) + 1) * 10)
+                    )
+                else:
+                    newShotName = shotNamesAllocator.getUniqueName(props._replaceHashByNumber(self.name, (i + 1) * 10))
+                startFrame = self.start + (i - 1) * (self.duration - 1 + self.offsetFromPrevious)
+                endFrame = startFrame + self.duration - 1
+
+                if "NEW_CAMERAS" == self.cameraName:
+                    cam = utils.create_new_camera("Cam_" + newShotName)
+
+                props.addShot(
+                    atIndex=newShotInd,
+                    name=newShotName,
+                    start=startFrame,
+                    end=endFrame,
+                    camera=cam,
+                    color=cam.color,
+                )
+                newShotInd += 1
 
         props.setCurrentShotByIndex(newShotInd - 1)
         props.setSelectedShotByIndex(newShotInd - 1)
@@ -1575,11 +1580,9 @@ class UAS_ShotManager_DuplicateShotsToOtherTake(Operator):
         # print(f"insertAfterShot: {self.insertAfterShot}")
 
         insertAfterShotInd = int(self.insertAfterShot) + 1
-        insertAtInd = insertAfterShotInd
-        for shot in enabledShots:
-            # print(f"insertAtInd: {insertAtInd}")
-            props.copyShot(shot, atIndex=insertAtInd, copyCamera=self.duplicateCam, targetTakeIndex=targetTakeInd)
-            insertAtInd += 1
+        props.copyShots(
+            enabledShots, atIndex=insertAfterShotInd, copyCamera=self.duplicateCam, targetTakeIndex=targetTakeInd
+        )
 
         # delete source shots
         if "DUPLICATE" == self.mode:
@@ -24,6 +24,7 @@ from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty, IntProperty
 
 from shotmanager.config import config
+from shotmanager.properties import edit_index
 
 
 class UAS_ShotManager_TakeAdd(Operator):
@@ -212,6 +213,7 @@ class UAS_ShotManager_TakeRemove(Operator):
         else:
             props["current_take_name"] = currentTakeInd - 1
             props.takes.remove(currentTakeInd)
+        edit_index.invalidateTake(props)
 
         props.setCurrentShotByIndex(0)
 
@@ -361,6 +363,7 @@ class UAS_ShotManager_ResetTakesToDefault(Operator):
 
         for i in range(len(takes), -1, -1):
             takes.remove(i)
+        edit_index.invalidateTake(props)
 
         props.createDefaultTake()
 
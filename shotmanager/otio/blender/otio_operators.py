@@ -887,30 +887,31 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
             if config.devDebug:
                 bpy.ops.uasshotmanager.compare_otio_and_current_montage(sequenceName=selSeq.get_name())
 
-            textFile = conformToRefMontage(
-                scene,
-                config.gMontageOtio,
-                selSeq.get_name(),
-                mediaInEDLHaveHandles=self.mediaInEDLHaveHandles,
-                mediaInEDLHandlesDuration=self.mediaInEDLHandlesDuration,
-                clearVSE=self.clearVSE,
-                clearCameraBG=self.clearCameraBG,
-                changeShotsTiming=self.changeShotsTiming,
-                createMissingShots=self.createMissingShots,
-                createCameras=self.createCameras,
-                useMediaAsCameraBG=self.useMediaAsCameraBG,
-                videoShotsFolder=self.videoShotsFolder,
-                mediaHaveHandles=self.mediaHaveHandles,
-                mediaHandlesDuration=self.mediaHandlesDuration,
-                useMediaSoundtrackForCameraBG=self.useMediaSoundtrackForCameraBG,
-                #########
-                # VSE - No imports anymore
-                # importVideoInVSE=self.importVideoInVSE,
-                # importAudioInVSE=self.importAudioInVSE,
-                # videoTracksList=videoTracksToImport,
-                # audioTracksList=audioTracksToImport,
-                # animaticFile=self.animaticFile if self.importAnimaticInVSE else None,
-            )
+            with props.batch_edit():
+                textFile = conformToRefMontage(
+                    scene,
+                    config.gMontageOtio,
+                    selSeq.get_name(),
+                    mediaInEDLHaveHandles=self.mediaInEDLHaveHandles,
+                    mediaInEDLHandlesDuration=self.mediaInEDLHandlesDuration,
+                    clearVSE=self.clearVSE,
+                    clearCameraBG=self.clearCameraBG,
+                    changeShotsTiming=self.changeShotsTiming,
+                    createMissingShots=self.createMissingShots,
+                    createCameras=self.createCameras,
+                    useMediaAsCameraBG=self.useMediaAsCameraBG,
+                    videoShotsFolder=self.videoShotsFolder,
+                    mediaHaveHandles=self.mediaHaveHandles,
+                    mediaHandlesDuration=self.mediaHandlesDuration,
+                    useMediaSoundtrackForCameraBG=self.useMediaSoundtrackForCameraBG,
+                    #########
+                    # VSE - No imports anymore
+                    # importVideoInVSE=self.importVideoInVSE,
+                    # importAudioInVSE=self.importAudioInVSE,
+                    # videoTracksList=videoTracksToImport,
+                    # audioTracksList=audioTracksToImport,
+                    # animaticFile=self.animaticFile if self.importAnimaticInVSE else None,
+                )
             props.setCurrentShotByIndex(0)
             props.setSelectedShotByIndex(0)
             props.display_camerabgtools_in_properties = True
@@ -76,59 +76,61 @@ def createShotsFromOtio(
 
             shot_re = re.compile(r"sh_?(\d+)", re.IGNORECASE)
             atLeastOneVideoFailed = False
-            for i, clip in enumerate(track.each_clip()):
-                clipName = clip.name
-                if createCameras:
-                    if reformatShotNames:
-                        match = shot_re.search(clipName)
-                        if match:
-                            clipName = props.naming_shot_format + match.group(1)
-
-                    cam_ob = utils.create_new_camera("Cam_" + clipName, location=[0.0, i, 0.0])
-                    cam = cam_ob.data
-                    cam_ob.color = [uniform(0, 1), uniform(0, 1), uniform(0, 1), 1]
-                    cam_ob.rotation_euler = (radians(90), 0.0, radians(90))
-
-                    # add media as camera background
-                    if useMediaAsCameraBG:
-                        print("Import Otio clip.media_reference.target_url: ", clip.media_reference.target_url)
-                        media_path = Path(utils.file_path_from_url(clip.media_reference.target_url))
-                        print("Import Otio media_path: ", media_path)
-                        if not media_path.exists():
-                            # Lets find it inside next to the xml
-                            media_path = Path(otioFile).parent.joinpath(media_path.name)
-                            print("** not found, so Path(self.otioFile).parent: ", Path(otioFile).parent)
-                            print("   and new media_path: ", media_path)
-
-                        # start frame of the background video is not set here since it will be linked to the shot start frame
-                        videoAdded = utils.add_background_video_to_cam(
-                            cam, str(media_path), 0, alpha=props.shotsGlobalSettings.backgroundAlpha
-                        )
-                        if videoAdded is None:
-                            atLeastOneVideoFailed = True
-
-                shot = props.addShot(
-                    name=clipName,
-                    start=opentimelineio.opentime.to_frames(clip.range_in_parent().start_time) + importAtFrame,
-                    end=opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_inclusive()) + importAtFrame,
-                    camera=cam_ob,
-                    color=cam_ob.color,
-                )
-                # bpy.ops.uas_shot_manager.shot_add(
-                #     name=clipName,
-                #     start=opentimelineio.opentime.to_frames(clip.range_in_parent().start_time) + importAtFrame,
-                #     end=opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_inclusive()) + importAtFrame,
-                #     cameraName=cam.name,
-                #     color=(cam_ob.color[0], cam_ob.color[1], cam_ob.color[2]),
-                # )
-                shot.bgImages_linkToShotStart = True
-                shot.bgImages_offset = -1 * handlesDuration
-
-                # wkip maybe to remove
-                scene.frame_start = importAtFrame
-                scene.frame_end = (
-                    opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_inclusive()) + importAtFrame
-                )
+            with props.batch_edit():
+                for i, clip in enumerate(track.each_clip()):
+                    clipName = clip.name
+                    if createCameras:
+                        if reformatShotNames:
+                            match = shot_re.search(clipName)
+                            if match:
+                                clipName = props.naming_shot_format + match.group(1)
+
+                        cam_ob = utils.create_new_camera("Cam_" + clipName, location=[0.0, i, 0.0])
+                        cam = cam_ob.data
+                        cam_ob.color = [uniform(0, 1), uniform(0, 1), uniform(0, 1), 1]
+                        cam_ob.rotation_euler = (radians(90), 0.0, radians(90))
+
+                        # add media as camera background
+                        if useMediaAsCameraBG:
+                            print("Import Otio clip.media_reference.target_url: ", clip.media_reference.target_url)
+                            media_path = Path(utils.file_path_from_url(clip.media_reference.target_url))
+                            print("Import Otio media_path: ", media_path)
+                            if not media_path.exists():
+                                # Lets find it inside next to the xml
+                                media_path = Path(otioFile).parent.joinpath(media_path.name)
+                                print("** not found, so Path(self.otioFile).parent: ", Path(otioFile).parent)
+                                print("   and new media_path: ", media_path)
+
+                            # start frame of the background video is not set here since it will be linked to the shot start frame
+                            videoAdded = utils.add_background_video_to_cam(
+                                cam, str(media_path), 0, alpha=props.shotsGlobalSettings.backgroundAlpha
+                            )
+                            if videoAdded is None:
+                                atLeastOneVideoFailed = True
+
+                    shot = props.addShot(
+                        name=clipName,
+                        start=opentimelineio.opentime.to_frames(clip.range_in_parent().start_time) + importAtFrame,
+                        end=opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_inclusive())
+                        + importAtFrame,
+                        camera=cam_ob,
+                        color=cam_ob.color,
+                    )
+                    # bpy.ops.uas_shot_manager.shot_add(
+                    #     name=clipName,
+                    #     start=opentimelineio.opentime.to_frames(clip.range_in_parent().start_time) + importAtFrame,
+                    #     end=opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_inclusive()) + importAtFrame,
+                    #     cameraName=cam.name,
+                    #     color=(cam_ob.color[0], cam_ob.color[1], cam_ob.color[2]),
+                    # )
+                    shot.bgImages_linkToShotStart = True
+                    shot.bgImages_offset = -1 * handlesDuration
+
+                    # wkip maybe to remove
+                    scene.frame_start = importAtFrame
+                    scene.frame_end = (
+                        opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_inclusive()) + importAtFrame
+                    )
 
             if importAudioInVSE:
                 # creation VSE si existe pas
@@ -28,6 +28,7 @@ from bpy.types import Operator
 from shotmanager.utils.utils_ogl import get_region_at_xy
 
 
+from shotmanager.utils.utils_profiling import profiledHandler
 from shotmanager.config import config
 from shotmanager.config import sm_logging
 
@@ -271,6 +272,7 @@ class UAS_ShotManager_InteractiveShotsStack(Operator):
     def cancel(self, context):
         self.unregister_handlers(context)
 
+    @profiledHandler("draw")
     def draw_callback_px(self, op, context, widgets):
         """Draw handler to paint onto the screen"""
         # print(
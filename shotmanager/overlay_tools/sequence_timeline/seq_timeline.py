@@ -27,6 +27,7 @@ from bpy.types import Operator
 
 from .seq_timeline_widgets import BL_UI_Timeline
 
+from shotmanager.utils.utils_profiling import profiledHandler
 from shotmanager.config import config
 from shotmanager.config import sm_logging
 
@@ -202,6 +203,7 @@ class UAS_ShotManager_sequenceTimeline(Operator):
     def cancel(self, context):
         self.unregister_handlers(context)
 
+    @profiledHandler("draw")
     def draw_callback_px(self, op, context, widgets):
         """Draw handler to paint onto the screen"""
         # print(
@@ -757,8 +757,6 @@ class BL_UI_Timeline:
 
     def frame_cursor_moved(self):
         props = self.context.scene.UAS_shot_manager_props
-        # shots = props.getShotsList(ignoreDisabled=not props.seqTimeline_displayDisabledShots)
-        shots = props.get_shots()
 
         # get the right frame_cursor
         if self.context.window_manager.UAS_shot_manager_shots_play_mode:
@@ -777,15 +775,13 @@ class BL_UI_Timeline:
                 - 1,
             )
         )
-        sequence_current_frame = props.editStartFrame
-        for i, shot in enumerate(shots):
-            if shot.enabled or props.seqTimeline_displayDisabledShots:
-                if sequence_current_frame <= new_edit_frame < sequence_current_frame + shot.getDuration():
-                    props.setCurrentShotByIndex(i)
-                    props.setSelectedShotByIndex(i)
-                    self.context.scene.frame_current = shot.start + new_edit_frame - sequence_current_frame
-                    break
-                sequence_current_frame += shot.getDuration()
+        shotInd, frameIn3DTime = props.get3DTimeFromEditTime(
+            new_edit_frame, ignoreDisabled=not props.seqTimeline_displayDisabledShots
+        )
+        if -1 != shotInd:
+            props.setCurrentShotByIndex(shotInd)
+            props.setSelectedShotByIndex(shotInd)
+            self.context.scene.frame_current = frameIn3DTime
 
     def mouse_down(self, x, y):
         return False  # self.is_in_rect ( x, y )
@@ -23,6 +23,7 @@ import bpy
 
 from .camera_hud_bgl import draw_shots_names, draw_all_shots_names, drawShotName, view3d_camera_border, drawCameraPlane
 
+from shotmanager.utils.utils_profiling import profiledHandler
 from shotmanager.config import config
 
 
@@ -63,6 +64,7 @@ class UAS_ShotManager_DrawCameras_UI(bpy.types.Operator):
     def cancel(self, context):
         self.unregister_handlers(context)
 
+    @profiledHandler("draw")
     def draw(self, context):
         if not hasattr(context.scene, "UAS_shot_manager_props"):
             print("Error in UAS_ShotManager_DrawHudinViewport draw: no UAS_shot_manager_props defined")
@@ -117,6 +119,7 @@ class UAS_ShotManager_DrawHudOnCamPov(bpy.types.Operator):
     def cancel(self, context):
         self.unregister_handlers(context)
 
+    @profiledHandler("draw")
     def draw(self, context):
         if not hasattr(context.scene, "UAS_shot_manager_props"):
             print("Error in UAS_ShotManager_DrawHudOnCamPov draw: no UAS_shot_manager_props defined")
@@ -29,6 +29,8 @@ from mathutils import Vector
 from shotmanager.utils import utils
 from shotmanager.utils import utils_editors_dopesheet
 from shotmanager.utils.utils_editors_dopesheet import getLaneHeight
+from shotmanager.utils import utils_profiling
+from shotmanager.utils.utils_profiling import profiledHandler
 from shotmanager.config import config
 
 from shotmanager.gpu.gpu_2d.class_Mesh2D import build_rectangle_mesh
@@ -248,6 +250,7 @@ def draw_callback__dopesheet_size(self, context, callingArea):
     # blf.draw(0, heightStr)
 
 
+@profiledHandler("draw")
 def draw_callback__dopesheet_info(self, context, callingArea, targetDopesheetIndex):
     """Infos on dopesheet areas"""
     if not context.window_manager.UAS_shot_manager_identify_dopesheets:
@@ -278,6 +281,7 @@ def draw_callback__dopesheet_info(self, context, callingArea, targetDopesheetInd
 ###################
 
 
+@profiledHandler("draw")
 def draw_callback__viewport_info(self, context, callingArea, targetViewportIndex):
     """Infos on viewport areas"""
     if not context.window_manager.UAS_shot_manager_identify_3dViews:
@@ -326,12 +330,26 @@ def draw_callback__viewport_info(self, context, callingArea, targetViewportIndex
             position = Vector([70, posY])
             draw_typo_2d(color, f"{message}", position, size)
 
+            if utils_profiling.isProfilingEnabled():
+                draw_profiling_readout(context)
+
+
+def draw_profiling_readout(context):
+    """Display the latency statistics of the profiled handlers at the top of the area"""
+    color = (0.95, 0.75, 0.1, 1.0)
+    size = 12
+    posY = context.region.height - 60
+    for line in utils_profiling.getProfilesReadout():
+        draw_typo_2d(color, line, Vector([70, posY]), size)
+        posY -= 16
+
 
 ###################
 # Advanced infos and debug - common to all editors
 ###################
 
 
+@profiledHandler("draw")
 def draw_callback__area_advanced_info(self, context, callingArea, targetViewportIndex):
     """Advanced and debug infos on all areas
     context.area is the calling area, from where the initial message was sent (= the current area)
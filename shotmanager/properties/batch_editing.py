@@ -0,0 +1,163 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Batch editing of the shots
+
+When many shots are created or modified in a row, the side effects of the update functions of the shots
+(selection of the shot in the UI, update of the clips linked to the shot start, redraw of the tools...)
+and the update of the storyboard frames display are deferred until the end of the batch and applied once.
+The edit indices are still invalidated immediately so that the edit can be queried during the batch.
+
+Usage:
+    with props.batch_edit():
+        for ...:
+            props.addShot(...)
+"""
+
+from contextlib import contextmanager
+
+import bpy
+
+from shotmanager.config import config
+from shotmanager.config import sm_logging
+from shotmanager.utils.utils_python import UniqueNameAllocator
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# key: pointer of the Shot Manager properties, value: _BatchEdit instance
+_batchEdits = dict()
+
+
+class _BatchEdit:
+    """Deferred updates of a batch edit
+
+    Shots are refered to by their names since their Python instances can become invalid when
+    shots are added or moved in the collection
+    """
+
+    __slots__ = (
+        "depth",
+        "currentShotName",
+        "selectedShotName",
+        "clipLinksToUpdate",
+        "storyboardDisplayArgs",
+        "redrawShotStack",
+        "shotNamesAllocators",
+    )
+
+    def __init__(self):
+        self.depth = 0
+        self.currentShotName = None
+        self.selectedShotName = None
+        # shots whose start has changed, as tupples (take index, shot name)
+        self.clipLinksToUpdate = set()
+        self.storyboardDisplayArgs = None
+        self.redrawShotStack = False
+        # key: pointer of the take
+        self.shotNamesAllocators = dict()
+
+    def addClipLinkToUpdate(self, takeIndex, shotName):
+        self.clipLinksToUpdate.add((takeIndex, shotName))
+
+    def renameClipLinkToUpdate(self, takeIndex, previousName, newName):
+        """To call when a shot is renamed during the batch"""
+        if (takeIndex, previousName) in self.clipLinksToUpdate:
+            self.clipLinksToUpdate.discard((takeIndex, previousName))
+            self.clipLinksToUpdate.add((takeIndex, newName))
+
+    def getShotNamesAllocator(self, take):
+        """Return the allocator of the names of the shots of the specified take, created with the names of the
+        shots at the first call. It follows the rules of utils.findFirstUniqueName
+        """
+        nameAllocator = self.shotNamesAllocators.get(take.as_pointer(), None)
+        if nameAllocator is None:
+            nameAllocator = UniqueNameAllocator(usedNames=[shot.name for shot in take.shots])
+            self.shotNamesAllocators[take.as_pointer()] = nameAllocator
+        return nameAllocator
+
+
+def getBatchEdit(props):
+    """Return the current batch edit of the specified Shot Manager properties, None if no batch is open"""
+    return _batchEdits.get(props.as_pointer(), None)
+
+
+def isBatchEditing(props):
+    return props.as_pointer() in _batchEdits
+
+
+@contextmanager
+def batchEdit(props):
+    """Context manager deferring the updates of the shots until its exit. Batches can be nested, the
+    updates are then applied at the exit of the outermost one
+    """
+    propsPointer = props.as_pointer()
+    batch = _batchEdits.get(propsPointer, None)
+    if batch is None:
+        batch = _BatchEdit()
+        _batchEdits[propsPointer] = batch
+
+    batch.depth += 1
+    try:
+        yield batch
+    finally:
+        batch.depth -= 1
+        if 0 == batch.depth:
+            del _batchEdits[propsPointer]
+            _applyBatchEdit(props, batch)
+
+
+def _applyBatchEdit(props, batch):
+    """Apply at once the updates deferred during the batch"""
+    _logger.debug_ext("Applying batch edit", col="BLUE")
+
+    # only the shots whose start has changed are updated since the cameras, and then their background clips,
+    # can be shared by shots of several takes
+    if len(batch.clipLinksToUpdate):
+        takes = props.getTakes()
+        for takeInd, shotName in batch.clipLinksToUpdate:
+            if takeInd is None or takeInd >= len(takes):
+                continue
+            shot = takes[takeInd].shots.get(shotName, None)
+            if shot is not None:
+                shot.updateClipLinkToShotStart()
+
+    currentShotInd = -1
+    selectedShotInd = -1
+    currentTake = props.getCurrentTake()
+    if currentTake is not None:
+        for shotInd, shot in enumerate(currentTake.shots):
+            if shot.name == batch.currentShotName:
+                currentShotInd = shotInd
+            if shot.name == batch.selectedShotName:
+                selectedShotInd = shotInd
+
+    # setting the current shot also updates the storyboard frames display
+    if -1 != currentShotInd:
+        props.setCurrentShotByIndex(currentShotInd)
+    elif batch.storyboardDisplayArgs is not None:
+        props.updateStoryboardFramesDisplay(**batch.storyboardDisplayArgs)
+
+    if -1 != selectedShotInd:
+        props.setSelectedShotByIndex(selectedShotInd)
+
+    if batch.redrawShotStack:
+        config.gRedrawShotStack = True
+        if bpy.context.screen is not None:
+            for area in bpy.context.screen.areas:
+                area.tag_redraw()
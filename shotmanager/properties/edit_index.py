@@ -0,0 +1,388 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Lookup tables built on the shots of the takes, used to speed up the edit computations
+
+Shot Manager properties are Blender property groups, they cannot hold Python attributes. The tables
+are then stored here, for each instance of the properties, and rebuilt lazily once invalidated.
+They have to be invalidated each time a shot is added, removed, moved or retimed, and each time
+the Blender data is reloaded (file load, undo, redo).
+
+Each invalidation also bumps the edit generation counters. They never decrease and are not reset with
+the tables, so any other subsystem can memoize data derived from the shots and recompute it only when
+the generation it stored differs from the current one.
+"""
+
+import bpy
+
+from shotmanager.config import sm_logging
+
+from .edit_model import TakeEditIndex
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# key: pointer of the Shot Manager properties, value: _PropsEditIndices instance
+_propsEditIndices = dict()
+
+# incremented at each change of the shots of any instance of Shot Manager properties
+_globalGeneration = 0
+
+# key: pointer of the Shot Manager properties, value: _PropsGenerations instance
+_propsGenerations = dict()
+
+
+class CamerasIndex:
+    """Multimap of the cameras of an instance of Shot Manager properties to the shots using them, in all the takes
+
+    Cameras are refered to by their pointer, None for the shots without camera.
+    The shots are stored as tupples made of the take index, the shot index and the enabled state of the shot,
+    in the order of the takes and of the shots
+    """
+
+    __slots__ = ("numObjects", "shotsByCamera", "sharedCamerasInTakes")
+
+    def __init__(self, props):
+        # the cameras deleted from the scene are detected by the change of the number of objects
+        self.numObjects = len(bpy.data.objects)
+        self.shotsByCamera = dict()
+        # key: (take index, ignoreDisabled), computed on demand
+        self.sharedCamerasInTakes = dict()
+
+        for takeInd, take in enumerate(props.takes):
+            for shotInd, shot in enumerate(take.shots):
+                cam = shot.camera
+                camPointer = None if cam is None else cam.as_pointer()
+                shotsUsingCam = self.shotsByCamera.get(camPointer, None)
+                if shotsUsingCam is None:
+                    shotsUsingCam = list()
+                    self.shotsByCamera[camPointer] = shotsUsingCam
+                shotsUsingCam.append((takeInd, shotInd, shot.enabled))
+
+    def getShotLocations(self, cam, ignoreDisabled=False, takeIndex=-1):
+        """Return the list of the (take index, shot index) locations of the shots using the specified camera,
+        in the specified take or in all the takes if takeIndex is -1
+        """
+        camPointer = None if cam is None else cam.as_pointer()
+        return [
+            (takeInd, shotInd)
+            for takeInd, shotInd, enabled in self.shotsByCamera.get(camPointer, ())
+            if (-1 == takeIndex or takeInd == takeIndex) and (not ignoreDisabled or enabled)
+        ]
+
+    def getNumShotsUsingCamera(self, cam, ignoreDisabled=False, takeIndex=-1):
+        return len(self.getShotLocations(cam, ignoreDisabled=ignoreDisabled, takeIndex=takeIndex))
+
+    def isThereSharedCamerasInTake(self, takeIndex, ignoreDisabled=False):
+        """Return True if at least one of the shots of the specified take uses a camera used by another shot
+        of any take. The shots without camera don't share a camera, as props.getNumSharedCamera(None) is 0
+        """
+        key = (takeIndex, ignoreDisabled)
+        shared = self.sharedCamerasInTakes.get(key, None)
+        if shared is None:
+            shared = False
+            for camPointer, shotsUsingCam in self.shotsByCamera.items():
+                # shots without camera
+                if camPointer is None:
+                    continue
+                # filters are the ones historically used by props.isThereSharedCamerasInTake
+                numUsers = sum(1 for _t, _s, enabled in shotsUsingCam if not ignoreDisabled or enabled)
+                if 1 < numUsers and any(
+                    takeInd == takeIndex and (ignoreDisabled or enabled) for takeInd, _s, enabled in shotsUsingCam
+                ):
+                    shared = True
+                    break
+            self.sharedCamerasInTakes[key] = shared
+        return shared
+
+
+class _PropsEditIndices:
+    """Edit indices of the takes of an instance of Shot Manager properties
+
+    shotLocations is the identity map of all the shots of all the takes: its keys are the pointers of the
+    shots and its values tupples made of the index of the parent take and of the index of the shot in it
+    """
+
+    __slots__ = ("numTakes", "takeIndices", "shotLocations", "camerasIndex", "takeIndicesByName")
+
+    def __init__(self, numTakes):
+        self.numTakes = numTakes
+        self.takeIndices = dict()
+        self.shotLocations = None
+        self.camerasIndex = None
+        self.takeIndicesByName = None
+
+    def buildTakeIndicesByName(self, props):
+        # the first take wins when several takes share the same name, as in the former linear searches
+        self.takeIndicesByName = dict()
+        for takeInd, take in enumerate(props.takes):
+            self.takeIndicesByName.setdefault(take.name, takeInd)
+
+    def buildShotLocations(self, props):
+        self.shotLocations = dict()
+        for takeInd in range(len(props.takes)):
+            self.updateTakeShotLocations(props, takeInd)
+
+    def updateTakeShotLocations(self, props, takeIndex):
+        for shotInd, shot in enumerate(props.takes[takeIndex].shots):
+            self.shotLocations[shot.as_pointer()] = (takeIndex, shotInd)
+
+
+class _PropsGenerations:
+    """Edit generations of an instance of Shot Manager properties
+
+    Generations are values of the global generation counter, so they are unique. The takes that have not been
+    changed since the last change of all the takes have the generation of that change, resetGeneration
+    """
+
+    __slots__ = ("generation", "resetGeneration", "takeGenerations")
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.resetGeneration = generation
+        self.takeGenerations = dict()
+
+
+def _getPropsGenerations(props):
+    propsGenerations = _propsGenerations.get(props.as_pointer(), None)
+    if propsGenerations is None:
+        propsGenerations = _PropsGenerations(_globalGeneration)
+        _propsGenerations[props.as_pointer()] = propsGenerations
+    return propsGenerations
+
+
+def _bumpGeneration(props, takeIndex=-1):
+    """Increment the generation of the specified take, or of all the takes if takeIndex is -1"""
+    global _globalGeneration
+    _globalGeneration += 1
+
+    propsGenerations = _getPropsGenerations(props)
+    propsGenerations.generation = _globalGeneration
+    if -1 == takeIndex:
+        propsGenerations.resetGeneration = _globalGeneration
+        propsGenerations.takeGenerations.clear()
+    else:
+        propsGenerations.takeGenerations[takeIndex] = _globalGeneration
+
+
+def _getShotTakeIndexIfKnown(propsIndices, shot):
+    """Return the index of the parent take of the shot if it can be found in the current tables without
+    building them, -1 otherwise
+    """
+    if propsIndices is None:
+        return -1
+    shotPointer = shot.as_pointer()
+    if propsIndices.shotLocations is not None and shotPointer in propsIndices.shotLocations:
+        return propsIndices.shotLocations[shotPointer][0]
+    for takeInd, takeEditIndex in propsIndices.takeIndices.items():
+        if shotPointer in takeEditIndex.shotPointers:
+            return takeInd
+    return -1
+
+
+def getGlobalGeneration():
+    """Return the generation of the edits of all the scenes, incremented at each change of any of them"""
+    return _globalGeneration
+
+
+def getGeneration(props):
+    """Return the generation of the edit of the specified Shot Manager properties, all takes included"""
+    return _getPropsGenerations(props).generation
+
+
+def getTakeGeneration(props, takeIndex):
+    """Return the generation of the edit of the take at the specified index"""
+    propsGenerations = _getPropsGenerations(props)
+    return propsGenerations.takeGenerations.get(takeIndex, propsGenerations.resetGeneration)
+
+
+def bumpShotGeneration(props, shot):
+    """Increment the generation of the take containing the specified shot.
+    To call when a property of the shot not used by the edit indices, such as its color, is changed
+    """
+    _bumpGeneration(props, _getShotTakeIndexIfKnown(_propsEditIndices.get(props.as_pointer(), None), shot))
+
+
+def _getPropsEditIndices(props):
+    propsPointer = props.as_pointer()
+    numTakes = len(props.takes)
+    propsIndices = _propsEditIndices.get(propsPointer, None)
+    if propsIndices is None or propsIndices.numTakes != numTakes:
+        propsIndices = _PropsEditIndices(numTakes)
+        _propsEditIndices[propsPointer] = propsIndices
+    return propsIndices
+
+
+def getTakeEditIndex(props, takeIndex):
+    """Return the edit index of the take at the specified index, built if needed.
+    Return None if the take index is not valid
+    """
+    if not 0 <= takeIndex < len(props.takes):
+        return None
+
+    propsIndices = _getPropsEditIndices(props)
+    shots = props.takes[takeIndex].shots
+    takeEditIndex = propsIndices.takeIndices.get(takeIndex, None)
+
+    # the number of shots is checked as a safety in case an invalidation has been missed
+    if takeEditIndex is None or takeEditIndex.numShots != len(shots):
+        takeEditIndex = TakeEditIndex(shots)
+        propsIndices.takeIndices[takeIndex] = takeEditIndex
+
+    return takeEditIndex
+
+
+def getCamerasIndex(props):
+    """Return the cameras index of the specified Shot Manager properties, built if needed"""
+    propsIndices = _getPropsEditIndices(props)
+    camerasIndex = propsIndices.camerasIndex
+    if camerasIndex is None or camerasIndex.numObjects != len(bpy.data.objects):
+        camerasIndex = CamerasIndex(props)
+        propsIndices.camerasIndex = camerasIndex
+    return camerasIndex
+
+
+def getTakeIndexByName(props, takeName):
+    """Return the index of the first take with the specified name, -1 if not found"""
+    propsIndices = _getPropsEditIndices(props)
+    freshRegistry = propsIndices.takeIndicesByName is None
+    if freshRegistry:
+        propsIndices.buildTakeIndicesByName(props)
+
+    takeInd = propsIndices.takeIndicesByName.get(takeName, -1)
+    if -1 != takeInd and props.takes[takeInd].name == takeName:
+        return takeInd
+
+    if freshRegistry:
+        return -1
+
+    # the registry may be outdated (take renamed), it is rebuilt once
+    propsIndices.takeIndicesByName = None
+    return getTakeIndexByName(props, takeName)
+
+
+def findShot(props, shot):
+    """Return a tupple made of the index of the parent take of the shot and the index of the shot in this take,
+    (-1, -1) if not found
+    """
+    if shot is None:
+        return (-1, -1)
+
+    propsIndices = _getPropsEditIndices(props)
+    justBuilt = propsIndices.shotLocations is None
+    if justBuilt:
+        propsIndices.buildShotLocations(props)
+
+    shotPointer = shot.as_pointer()
+    location = propsIndices.shotLocations.get(shotPointer, None)
+    if location is not None:
+        shots = props.takes[location[0]].shots
+        if location[1] < len(shots) and shots[location[1]].as_pointer() == shotPointer:
+            return location
+
+    if justBuilt:
+        return (-1, -1)
+
+    # the shot is not where expected, or not found, if an invalidation has been missed. The map
+    # is then rebuilt, which makes it exact, so this cannot happen twice
+    _logger.debug_ext(f"Shot locations out of date for shot {shot.name}, rebuilding them", col="RED")
+    propsIndices.shotLocations = None
+    return findShot(props, shot)
+
+
+def invalidateTake(props, takeIndex=-1):
+    """Invalidate the edit index of the specified take, or of all the takes if takeIndex is -1"""
+    _bumpGeneration(props, takeIndex)
+
+    propsIndices = _propsEditIndices.get(props.as_pointer(), None)
+    if propsIndices is None:
+        return
+
+    if -1 == takeIndex:
+        del _propsEditIndices[props.as_pointer()]
+    else:
+        propsIndices.takeIndices.pop(takeIndex, None)
+        # the indices of the shots may have changed
+        propsIndices.shotLocations = None
+        propsIndices.camerasIndex = None
+        propsIndices.takeIndicesByName = None
+
+
+def invalidateTakeShots(props, takeIndex, shotAppended=False):
+    """Invalidate the edit index of the specified take after shots have been added to it or moved in it.
+    Unlike invalidateTake the identity map of the shots is updated for this take only instead of being dropped,
+    and only for the new shot when it has been appended at the end of the take, so that adding shots in bulk
+    doesn't rebuild the map of all the takes at each add
+    """
+    _bumpGeneration(props, takeIndex)
+
+    propsIndices = _propsEditIndices.get(props.as_pointer(), None)
+    if propsIndices is None:
+        return
+
+    propsIndices.takeIndices.pop(takeIndex, None)
+    propsIndices.camerasIndex = None
+    if propsIndices.shotLocations is None:
+        return
+
+    shots = props.takes[takeIndex].shots
+    # the shots of the take are reallocated when their collection grows, their pointers then change
+    shotsMoved = 1 < len(shots) and (takeIndex, 0) != propsIndices.shotLocations.get(shots[0].as_pointer(), None)
+    if shotAppended and not shotsMoved:
+        propsIndices.shotLocations[shots[len(shots) - 1].as_pointer()] = (takeIndex, len(shots) - 1)
+    else:
+        propsIndices.updateTakeShotLocations(props, takeIndex)
+
+
+def invalidateShot(props, shot):
+    """Invalidate the edit index of the take containing the specified shot.
+    The location of the shot is not affected, use invalidateTake if the shot has been added, removed or moved
+    """
+    propsIndices = _propsEditIndices.get(props.as_pointer(), None)
+    takeInd = _getShotTakeIndexIfKnown(propsIndices, shot)
+    _bumpGeneration(props, takeInd)
+
+    # if the shot is not found in the tables then none of them is out of date
+    if propsIndices is not None and -1 != takeInd:
+        propsIndices.takeIndices.pop(takeInd, None)
+
+
+def invalidateTakeNames(props):
+    """Invalidate the registry of the take names. To call each time a take is renamed"""
+    _bumpGeneration(props)
+    propsIndices = _propsEditIndices.get(props.as_pointer(), None)
+    if propsIndices is not None:
+        propsIndices.takeIndicesByName = None
+
+
+def invalidateCameras(props, shot=None):
+    """Invalidate the cameras index. To call each time the camera or the enabled state of a shot is changed"""
+    propsIndices = _propsEditIndices.get(props.as_pointer(), None)
+    _bumpGeneration(props, -1 if shot is None else _getShotTakeIndexIfKnown(propsIndices, shot))
+    if propsIndices is not None:
+        propsIndices.camerasIndex = None
+
+
+def clearAll():
+    """Clear the edit indices of all the scenes. To be called when the Blender data is reloaded"""
+    global _globalGeneration
+    _propsEditIndices.clear()
+
+    # the generations are not reset to 0 so that the data memoized before the reload is seen as out of date
+    _globalGeneration += 1
+    _propsGenerations.clear()
@@ -0,0 +1,463 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+In-memory edit model, independent from Blender
+
+This module must not import bpy nor any other module of the add-on, so that the edit computations can be
+run, tested and benchmarked in a plain Python interpreter, for example by loading this file directly with
+importlib.
+
+It contains:
+    - the timing tables used to compute the edit, TakeEditIndex and ShotsIntervalIndex. They are built
+      from any list of objects having the attributes start, end and enabled and the method as_pointer(),
+      so either from the shots of the Shot Manager properties (see edit_index.py) or from the model below
+    - Shot and Take, a lightweight copy of the shots and takes of the Shot Manager properties. They can be
+      synced from and back to the properties
+    - the computation of the order of the versions of the shots, used by sortShotsVersions
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+# names of the shots that can have versions, based on the name template Shxxxx
+SHOT_VERSION_NAME_RE = re.compile(r"^Sh\d\d\d\d")
+SHOT_VERSION_BASE_NAME_LENGTH = 6
+
+
+class TakeEditIndex:
+    """Timing of the shots of a take, with their cumulated durations in the edit
+
+    editStarts[i] is the edit time of the start of the shot i, relatively to the start of the take edit,
+    when all the shots are used. editStartsEnabled[i] is the same when the disabled shots are ignored.
+    Both lists have one item more than the shots list, the last one being the duration of the edit.
+
+    enabledShotIndices is the list of the indices of the enabled shots in the whole shots list, and
+    enabledRanks[i] the number of enabled shots before the shot i. They are used to convert shot indices
+    between the whole shots list and the enabled shots list.
+    """
+
+    __slots__ = (
+        "numShots",
+        "shotPointers",
+        "starts",
+        "ends",
+        "enabled",
+        "editStarts",
+        "editStartsEnabled",
+        "enabledShotIndices",
+        "enabledRanks",
+        "intervalIndices",
+    )
+
+    def __init__(self, shots):
+        self.numShots = len(shots)
+        self.shotPointers = dict()
+        self.starts = list()
+        self.ends = list()
+        self.enabled = list()
+        self.editStarts = [0]
+        self.editStartsEnabled = [0]
+        self.enabledShotIndices = list()
+        self.enabledRanks = [0]
+        # built on demand, key: ignoreDisabled
+        self.intervalIndices = dict()
+
+        editStart = 0
+        editStartEnabled = 0
+        for i, shot in enumerate(shots):
+            start = shot.start
+            end = shot.end
+            enabled = shot.enabled
+            duration = end - start + 1
+
+            self.shotPointers[shot.as_pointer()] = i
+            self.starts.append(start)
+            self.ends.append(end)
+            self.enabled.append(enabled)
+
+            editStart += duration
+            if enabled:
+                editStartEnabled += duration
+                self.enabledShotIndices.append(i)
+            self.editStarts.append(editStart)
+            self.editStartsEnabled.append(editStartEnabled)
+            self.enabledRanks.append(len(self.enabledShotIndices))
+
+    def getNumShots(self, ignoreDisabled=False):
+        if ignoreDisabled:
+            return len(self.enabledShotIndices)
+        return self.numShots
+
+    def getNumEnabledShotsBefore(self, shotIndex):
+        """Return the number of enabled shots placed before the specified shot in the whole shots list"""
+        return self.enabledRanks[max(0, min(shotIndex, self.numShots))]
+
+    def getIndexInEnabledList(self, shotIndex):
+        """Return the index in the enabled shots list of the shot at the specified index in the whole shots list,
+        -1 if the shot is disabled
+        """
+        if not self.enabled[shotIndex]:
+            return -1
+        return self.enabledRanks[shotIndex]
+
+    def getIndexInWholeList(self, enabledShotIndex):
+        """Return the index in the whole shots list of the shot at the specified index in the enabled shots list,
+        -1 if the index is not valid
+        """
+        if 0 <= enabledShotIndex < len(self.enabledShotIndices):
+            return self.enabledShotIndices[enabledShotIndex]
+        return -1
+
+    def getPreviousEnabledShotIndex(self, shotIndex):
+        """Return the index, in the whole shots list, of the last enabled shot placed before the specified shot,
+        -1 if none
+        """
+        rank = self.getNumEnabledShotsBefore(shotIndex)
+        return self.enabledShotIndices[rank - 1] if 0 < rank else -1
+
+    def getNextEnabledShotIndex(self, shotIndex):
+        """Return the index, in the whole shots list, of the first enabled shot placed after the specified shot,
+        -1 if none
+        """
+        rank = self.getNumEnabledShotsBefore(shotIndex + 1)
+        return self.enabledShotIndices[rank] if rank < len(self.enabledShotIndices) else -1
+
+    def getEditDuration(self, ignoreDisabled=True):
+        """Return the duration of the edit made by the shots, -1 if there is no shots"""
+        editStarts = self.editStartsEnabled if ignoreDisabled else self.editStarts
+        if 0 == editStarts[-1]:
+            return -1
+        return editStarts[-1]
+
+    def getEditStart(self, shotIndex, ignoreDisabled=True):
+        """Return the edit time of the start of the specified shot, relatively to the start of the take edit"""
+        editStarts = self.editStartsEnabled if ignoreDisabled else self.editStarts
+        return editStarts[shotIndex]
+
+    def getShotIndexAtEditTime(self, editTime, ignoreDisabled=True):
+        """Return the index, in the whole shots list, of the shot displayed at the specified edit time,
+        -1 if the time is out of the edit.
+        editTime is relative to the start of the take edit
+        """
+        editStarts = self.editStartsEnabled if ignoreDisabled else self.editStarts
+        if editTime < 0 or editTime >= editStarts[-1]:
+            return -1
+
+        # disabled shots have a null duration when they are ignored, the last index having the
+        # found edit start is then the one of an enabled shot
+        return bisect_right(editStarts, editTime) - 1
+
+    def getIntervalIndex(self, ignoreDisabled=False):
+        """Return the interval index of the frame ranges of the shots, built if needed"""
+        intervalIndex = self.intervalIndices.get(ignoreDisabled, None)
+        if intervalIndex is None:
+            if ignoreDisabled:
+                shotIndices = [i for i in range(self.numShots) if self.enabled[i]]
+            else:
+                shotIndices = list(range(self.numShots))
+            intervalIndex = ShotsIntervalIndex(shotIndices, self.starts, self.ends)
+            self.intervalIndices[ignoreDisabled] = intervalIndex
+        return intervalIndex
+
+
+class ShotsIntervalIndex:
+    """Static index on the frame ranges of a set of shots, answering frame queries in logarithmic time.
+    Shots are refered to by their index in the whole shots list of the take, and all the frames are inclusive.
+
+    The shots are sorted by start, and a max-tree on their ends allows to report the ones overlapping
+    a range without visiting the others
+    """
+
+    __slots__ = ("numShots", "sortedStarts", "byStart", "minIndexFromStart", "sortedEnds", "maxIndexToEnd", "tree")
+
+    def __init__(self, shotIndices, starts, ends):
+        self.numShots = len(shotIndices)
+
+        byStart = sorted(shotIndices, key=lambda i: starts[i])
+        self.byStart = byStart
+        self.sortedStarts = [starts[i] for i in byStart]
+
+        # minimum shot index of the shots starting at or after the one at the same position in byStart
+        self.minIndexFromStart = list(byStart)
+        for j in range(self.numShots - 2, -1, -1):
+            self.minIndexFromStart[j] = min(self.minIndexFromStart[j], self.minIndexFromStart[j + 1])
+
+        # maximum shot index of the shots ending at or before the one at the same position in sortedEnds
+        byEnd = sorted(shotIndices, key=lambda i: ends[i])
+        self.sortedEnds = [ends[i] for i in byEnd]
+        self.maxIndexToEnd = list(byEnd)
+        for j in range(1, self.numShots):
+            self.maxIndexToEnd[j] = max(self.maxIndexToEnd[j], self.maxIndexToEnd[j - 1])
+
+        # implicit binary tree, leaves are the ends of the shots in start order, nodes their maximum
+        treeSize = 1
+        while treeSize < self.numShots:
+            treeSize *= 2
+        self.tree = [float("-inf")] * (2 * treeSize)
+        for j, shotInd in enumerate(byStart):
+            self.tree[treeSize + j] = ends[shotInd]
+        for node in range(treeSize - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def getShotIndicesOverlappingRange(self, rangeStart, rangeEnd):
+        """Return the sorted list of the indices of the shots having at least one frame in [rangeStart, rangeEnd]"""
+        # only the shots starting before the end of the range can overlap it, they are a prefix of byStart
+        numCandidates = bisect_right(self.sortedStarts, rangeEnd)
+        if 0 == numCandidates:
+            return []
+
+        tree = self.tree
+        treeSize = len(tree) // 2
+        overlapping = list()
+        stack = [(1, 0, treeSize)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= numCandidates or tree[node] < rangeStart:
+                continue
+            if 1 == hi - lo:
+                overlapping.append(self.byStart[lo])
+            else:
+                mid = (lo + hi) // 2
+                stack.append((2 * node + 1, mid, hi))
+                stack.append((2 * node, lo, mid))
+
+        overlapping.sort()
+        return overlapping
+
+    def getShotIndicesContainingFrame(self, frame):
+        """Return the sorted list of the indices of the shots containing the specified frame"""
+        return self.getShotIndicesOverlappingRange(frame, frame)
+
+    def getLastShotIndexEndingBefore(self, frame):
+        """Return the highest index of the shots ending strictly before the specified frame, -1 if none"""
+        numEndingBefore = bisect_left(self.sortedEnds, frame)
+        if 0 == numEndingBefore:
+            return -1
+        return self.maxIndexToEnd[numEndingBefore - 1]
+
+    def getFirstShotIndexStartingAfter(self, frame):
+        """Return the lowest index of the shots starting strictly after the specified frame, -1 if none"""
+        firstStartingAfter = bisect_right(self.sortedStarts, frame)
+        if firstStartingAfter >= self.numShots:
+            return -1
+        return self.minIndexFromStart[firstStartingAfter]
+
+
+###################
+# edit model
+###################
+
+
+@dataclass(slots=True)
+class Shot:
+    """Copy of the edit data of a shot
+
+    camera is the name of the camera object, empty if the shot has no camera. pointer is the pointer of
+    the Blender shot it has been synced from, 0 if it has been created from scratch
+    """
+
+    name: str
+    start: int
+    end: int
+    enabled: bool = True
+    durationLocked: bool = False
+    camera: str = ""
+    color: tuple = (1.0, 1.0, 1.0, 1.0)
+    pointer: int = 0
+
+    @classmethod
+    def fromShot(cls, shot):
+        """Return a model of the specified Shot Manager shot"""
+        return cls(
+            name=shot.name,
+            start=shot.start,
+            end=shot.end,
+            enabled=shot.enabled,
+            durationLocked=shot.durationLocked,
+            camera=shot.camera.name if shot.camera is not None else "",
+            color=tuple(shot.color),
+            pointer=shot.as_pointer(),
+        )
+
+    def as_pointer(self):
+        """Same role as the function of the Blender structs: return a unique identifier of the shot"""
+        return self.pointer if self.pointer else id(self)
+
+    def getDuration(self):
+        """Returns the shot duration in frames
+        in Blender - and in Shot Manager - the last frame of the shot is included in the rendered images
+        """
+        return self.end - self.start + 1
+
+
+@dataclass(slots=True)
+class Take:
+    """Copy of the edit data of a take, and edit computations on it
+
+    The timing tables of the take are built on demand. invalidateEditIndex() has to be called after any
+    modification of the shots list or of the start, end or enabled state of a shot
+    """
+
+    name: str
+    shots: list = field(default_factory=list)
+    startInGlobalEdit: int = 0
+    _editIndex: TakeEditIndex = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def fromTake(cls, take):
+        """Return a model of the specified Shot Manager take and of its shots"""
+        return cls(
+            name=take.name,
+            shots=[Shot.fromShot(shot) for shot in take.shots],
+            startInGlobalEdit=take.startInGlobalEdit,
+        )
+
+    def syncToTake(self, take):
+        """Write the start, end and enabled values of the shots of the model to the specified Shot Manager take.
+        The take must have the same number of shots as the model, in the same order
+        """
+        take.from_array({"start": [shot.start for shot in self.shots], "end": [shot.end for shot in self.shots]})
+        for shot, modelShot in zip(take.shots, self.shots):
+            if shot.enabled != modelShot.enabled:
+                shot.enabled = modelShot.enabled
+
+    def invalidateEditIndex(self):
+        self._editIndex = None
+
+    def getEditIndex(self):
+        if self._editIndex is None or self._editIndex.numShots != len(self.shots):
+            self._editIndex = TakeEditIndex(self.shots)
+        return self._editIndex
+
+    def getNumShots(self, ignoreDisabled=False):
+        return self.getEditIndex().getNumShots(ignoreDisabled=ignoreDisabled)
+
+    def getEditDuration(self, ignoreDisabled=True):
+        """Return the duration of the edit made by the shots, -1 if there is no shots"""
+        return self.getEditIndex().getEditDuration(ignoreDisabled=ignoreDisabled)
+
+    def getEditTime(self, shotIndex, frameIndexIn3DTime, ignoreDisabled=True, editStartFrame=0):
+        """Return the edit time corresponding to the specified frame of the specified shot, -1 if the frame
+        is not in the shot range or if the shot is disabled and ignoreDisabled is True
+        """
+        shot = self.shots[shotIndex]
+        if ignoreDisabled and not shot.enabled:
+            return -1
+        if not (shot.start <= frameIndexIn3DTime and frameIndexIn3DTime <= shot.end):
+            return -1
+
+        editStart = self.getEditIndex().getEditStart(shotIndex, ignoreDisabled=ignoreDisabled)
+        return editStart + frameIndexIn3DTime - shot.start + editStartFrame
+
+    def get3DTimeFromEditTime(self, frameIndexInEdit, ignoreDisabled=True, editStartFrame=0):
+        """Reverse of getEditTime: return a tupple made of the index of the shot displayed at the specified edit time
+        and of the corresponding frame in 3D time, (-1, -1) if the edit time is out of the edit
+        """
+        editIndex = self.getEditIndex()
+        editTime = frameIndexInEdit - editStartFrame
+        shotInd = editIndex.getShotIndexAtEditTime(editTime, ignoreDisabled=ignoreDisabled)
+        if -1 == shotInd:
+            return (-1, -1)
+        return (shotInd, editIndex.starts[shotInd] + editTime - editIndex.getEditStart(shotInd, ignoreDisabled))
+
+    def getFirstShotIndexContainingFrame(self, frameIndex, ignoreDisabled=False):
+        """Return the index of the first shot containing the specified frame, -1 if none"""
+        shotIndices = self.getShotIndicesContainingFrame(frameIndex, ignoreDisabled=ignoreDisabled)
+        return shotIndices[0] if len(shotIndices) else -1
+
+    def getFirstShotIndexBeforeFrame(self, frameIndex, ignoreDisabled=False):
+        """Return the index of the last shot ending strictly before the specified frame, -1 if none"""
+        intervalIndex = self.getEditIndex().getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getLastShotIndexEndingBefore(frameIndex)
+
+    def getFirstShotIndexAfterFrame(self, frameIndex, ignoreDisabled=False):
+        """Return the index of the first shot starting strictly after the specified frame, -1 if none"""
+        intervalIndex = self.getEditIndex().getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getFirstShotIndexStartingAfter(frameIndex)
+
+    def getShotIndicesContainingFrame(self, frameIndex, ignoreDisabled=False):
+        """Return the sorted list of the indices of the shots containing the specified frame"""
+        intervalIndex = self.getEditIndex().getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getShotIndicesContainingFrame(frameIndex)
+
+    def getShotIndicesOverlappingRange(self, rangeStart, rangeEnd, ignoreDisabled=False):
+        """Return the sorted list of the indices of the shots having at least one frame in the specified range.
+        rangeStart and rangeEnd are inclusive
+        """
+        intervalIndex = self.getEditIndex().getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getShotIndicesOverlappingRange(rangeStart, rangeEnd)
+
+    def getPreviousEnabledShotIndex(self, shotIndex):
+        """Return the index of the last enabled shot placed before the specified shot, -1 if none"""
+        return self.getEditIndex().getPreviousEnabledShotIndex(shotIndex)
+
+    def getNextEnabledShotIndex(self, shotIndex):
+        """Return the index of the first enabled shot placed after the specified shot, -1 if none"""
+        return self.getEditIndex().getNextEnabledShotIndex(shotIndex)
+
+
+def getShotsVersionsOrder(names, enabledStates):
+    """Return the new order of the shots, as the list of their current indices, so that the disabled shots with a
+    name following the template Shxxxx are placed among the other shots with the same base name (eg: "Sh0010_a"
+    after "Sh0010"), ordered by name. The other shots keep their relative order.
+    Disabled shots without other shots sharing their base name are not moved.
+    """
+    numShots = len(names)
+    baseNames = [name[:SHOT_VERSION_BASE_NAME_LENGTH] if SHOT_VERSION_NAME_RE.match(name) else None for name in names]
+
+    # key: base name, value: list of the indices of the shots with this base name, in their current order
+    groups = dict()
+    for i, baseName in enumerate(baseNames):
+        if baseName is not None:
+            groups.setdefault(baseName, []).append(i)
+
+    isMoved = [
+        not enabledStates[i] and baseNames[i] is not None and 1 < len(groups[baseNames[i]]) for i in range(numShots)
+    ]
+
+    # rank of each shot that is not moved among the shots that are not moved, and number of such shots before each shot
+    fixedRanks = [0] * numShots
+    numFixedShots = 0
+    for i in range(numShots):
+        fixedRanks[i] = numFixedShots
+        if not isMoved[i]:
+            numFixedShots += 1
+
+    # the shots that are not moved have the keys (rank, 0), the moved shots are placed just before the first shot
+    # of their group that is not moved and has a greater name (rank, -1), or after the last one (rank, 1).
+    # If all the shots of the group are moved they are placed at the location of the first of them
+    keys = [None] * numShots
+    for i in range(numShots):
+        if not isMoved[i]:
+            keys[i] = (fixedRanks[i], 0, "", i)
+            continue
+
+        group = groups[baseNames[i]]
+        fixedGroupShots = [j for j in group if not isMoved[j]]
+        if not len(fixedGroupShots):
+            keys[i] = (fixedRanks[group[0]], -1, names[i], i)
+            continue
+
+        keys[i] = (fixedRanks[fixedGroupShots[-1]], 1, names[i], i)
+        for j in fixedGroupShots:
+            if names[i] < names[j]:
+                keys[i] = (fixedRanks[j], -1, names[i], i)
+                break
+
+    return sorted(range(numShots), key=keys.__getitem__)
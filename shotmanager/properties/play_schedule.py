@@ -0,0 +1,183 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Play schedule of the shots play mode
+
+The play schedule is compiled from the shots of a take and the animation range of the scene. For each
+shot it stores the shots and frames to jump to when the play head leaves it, so that the frame change
+handler of the shots play mode does a constant amount of work per frame.
+It is rebuilt only when the edit generation of the take or the animation range changes.
+"""
+
+from shotmanager.config import sm_logging
+
+from . import edit_index
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# key: pointer of the Shot Manager properties, value: PlaySchedule instance
+_playSchedules = dict()
+
+
+class PlaySchedule:
+    """Jump table of the shots play mode for a take and an animation range
+
+    Shot indices are -1 when there is no such shot
+    """
+
+    __slots__ = (
+        "key",
+        "rangeStart",
+        "rangeEnd",
+        "starts",
+        "ends",
+        "previousEnabledShotIndices",
+        "nextShotInRangeIndices",
+        "firstContinuousShotIndices",
+        "maxStartFrames",
+        "firstEnabledShotIndex",
+        "lastEnabledShotIndex",
+    )
+
+    def __init__(self, shots, rangeStart, rangeEnd, key=None):
+        self.key = key
+        self.rangeStart = rangeStart
+        self.rangeEnd = rangeEnd
+
+        numShots = len(shots)
+        self.starts = starts = [shot.start for shot in shots]
+        self.ends = ends = [shot.end for shot in shots]
+        enabled = [shot.enabled for shot in shots]
+
+        self.maxStartFrames = [start if rangeStart <= start <= rangeEnd else rangeStart for start in starts]
+
+        # last enabled shot before each shot
+        self.previousEnabledShotIndices = [-1] * numShots
+        lastEnabledInd = -1
+        for i in range(numShots):
+            self.previousEnabledShotIndices[i] = lastEnabledInd
+            if enabled[i]:
+                lastEnabledInd = i
+        self.lastEnabledShotIndex = lastEnabledInd
+
+        # next enabled shot after each shot, only if it starts in the animation range
+        self.nextShotInRangeIndices = [-1] * numShots
+        nextEnabledInd = -1
+        for i in range(numShots - 1, -1, -1):
+            if -1 != nextEnabledInd and rangeStart <= starts[nextEnabledInd] <= rangeEnd:
+                self.nextShotInRangeIndices[i] = nextEnabledInd
+            if enabled[i]:
+                nextEnabledInd = i
+        self.firstEnabledShotIndex = nextEnabledInd
+
+        # first shot of the continuous sequence of enabled shots in the range ending at each shot.
+        # continuousStarts[j] is the result of the backward scan from j, -1 if no valid shot is met
+        self.firstContinuousShotIndices = [-1] * numShots
+        continuousStarts = [-1] * numShots
+        for i in range(numShots):
+            previousStart = continuousStarts[i - 1] if 0 < i else -1
+            if starts[i] < rangeStart:
+                self.firstContinuousShotIndices[i] = i
+            else:
+                self.firstContinuousShotIndices[i] = i if -1 == previousStart else previousStart
+
+            if not enabled[i]:
+                continuousStarts[i] = previousStart
+            elif ends[i] > rangeEnd or ends[i] < rangeStart:
+                continuousStarts[i] = -1
+            elif starts[i] < rangeStart:
+                continuousStarts[i] = i
+            else:
+                continuousStarts[i] = i if -1 == previousStart else previousStart
+
+    def _getJumpToFirstContinuousShot(self, shotIndex):
+        firstShotInd = self.firstContinuousShotIndices[shotIndex]
+        return (firstShotInd, self.maxStartFrames[firstShotInd])
+
+    def getJump(self, shotIndex, frame):
+        """Return the tupple (shot index, frame) to jump to when the animation is played and the play head
+        reaches the specified frame while the shot at shotIndex is current.
+        Return None if the play head has to stay in the current shot
+        """
+        start = self.starts[shotIndex]
+        end = self.ends[shotIndex]
+
+        # order of the tests is very important
+        if frame == self.rangeStart:
+            # the play head reached the anim range end and has been put back by Blender to the range start
+            if frame == start:
+                # the current shot starts at the range start, it is preserved
+                return None
+            nextShotInd = self.nextShotInRangeIndices[shotIndex]
+            if end == self.rangeEnd and -1 != nextShotInd:
+                return (nextShotInd, self.starts[nextShotInd])
+            return self._getJumpToFirstContinuousShot(shotIndex)
+
+        if frame == self.rangeEnd and -1 == self.previousEnabledShotIndices[shotIndex]:
+            # backward playing, the play head reached the range end while playing the first shot
+            return self._getJumpToFirstContinuousShot(shotIndex)
+
+        if frame > end:
+            nextShotInd = self.nextShotInRangeIndices[shotIndex]
+            if -1 == nextShotInd:
+                return self._getJumpToFirstContinuousShot(shotIndex)
+            return (nextShotInd, self.starts[nextShotInd])
+
+        if frame < start:
+            previousShotInd = self.previousEnabledShotIndices[shotIndex]
+            if -1 == previousShotInd:
+                # the range end is farther than the first shot so loop back to the last one
+                if -1 == self.lastEnabledShotIndex:
+                    return None
+                return (self.lastEnabledShotIndex, self.ends[self.lastEnabledShotIndex])
+            previousShotDuration = self.ends[previousShotInd] - self.starts[previousShotInd] + 1
+            disp = start - frame
+            if 0 < previousShotDuration:
+                disp %= previousShotDuration
+            return (previousShotInd, self.ends[previousShotInd] - disp)
+
+        return None
+
+
+def getPlaySchedule(props, scene, takeIndex=-1):
+    """Return the play schedule of the specified take for the animation range of the scene, compiled if
+    the shots or the range have changed since the last call
+    """
+    takeInd = props.getCurrentTakeIndex() if -1 == takeIndex else takeIndex
+    if scene.use_preview_range:
+        rangeStart, rangeEnd = scene.frame_preview_start, scene.frame_preview_end
+    else:
+        rangeStart, rangeEnd = scene.frame_start, scene.frame_end
+
+    # the number of shots is checked as a safety in case an invalidation has been missed
+    shots = props.get_shots(takeIndex=takeInd)
+    key = (takeInd, edit_index.getTakeGeneration(props, takeInd), len(shots), rangeStart, rangeEnd)
+
+    playSchedule = _playSchedules.get(props.as_pointer(), None)
+    if playSchedule is None or playSchedule.key != key:
+        _logger.debug_ext(f"Compiling play schedule of take {takeInd}", col="BLUE", tag="SHOTS_PLAY_MODE")
+        playSchedule = PlaySchedule(shots, rangeStart, rangeEnd, key=key)
+        _playSchedules[props.as_pointer()] = playSchedule
+
+    return playSchedule
+
+
+def clearAll():
+    """Clear the play schedules of all the scenes. To be called when the Blender data is reloaded"""
+    _playSchedules.clear()
@@ -19,7 +19,6 @@
 Shot Manager properties
 """
 
-import re
 import sys
 from pathlib import Path, PurePath
 
@@ -37,6 +36,9 @@ from bpy.props import (
 )
 
 from .montage_interface import MontageInterface
+from . import edit_index
+from . import edit_model
+from . import batch_editing
 
 from shotmanager.rendering.rendering_settings_props import UAS_ShotManager_RenderSettings
 from shotmanager.rendering.rendering_global_props import UAS_ShotManager_RenderGlobalContext
@@ -55,6 +57,7 @@ from shotmanager.feature_panels.greasepencil_25D.greasepencil_25D_props import U
 
 from shotmanager.utils import utils
 from shotmanager.utils import utils_os
+from shotmanager.utils.utils_python import UniqueNameAllocator, getMovesToReorder
 from shotmanager.utils.utils_shot_manager import getStampInfo
 from shotmanager.utils import utils_greasepencil
 
@@ -298,6 +301,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
     def getWarnings(self, scene):
         """Check if some warnings are to be mentioned to the user/
         A warning message can be on several lines when the separator \n is used.
+        The warnings are memoized, the returned list must not be modified.
 
         Return:
             An array of tupples made of the warning message and the warning index
@@ -1234,6 +1238,16 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
             See the Visibility rules in the documentation: storyboard-frames-visibility.rst
         """
+        batch = batch_editing.getBatchEdit(self)
+        if batch is not None:
+            batch.storyboardDisplayArgs = {
+                "forceHide": forceHide,
+                "alsoForceHideAlwaysVisible": alsoForceHideAlwaysVisible,
+                "alsoForceHideCurrent": alsoForceHideCurrent,
+                "takeIndex": takeIndex,
+            }
+            return ()
+
         takeInd = (
             self.getCurrentTakeIndex()
             if -1 == takeIndex
@@ -2360,6 +2374,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
     def _update_current_take_name(self, context):
         # print(f"_update_current_take_name: {self.getCurrentTakeIndex()}, {self.getCurrentTakeName()}")
         # _logger.debug("Change current take")
+        edit_index.invalidateTakeNames(self)
 
         self.setResolutionToScene()
         self.setCurrentShotByIndex(0)
@@ -2380,17 +2395,10 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
     # wkip deprecated
     def getUniqueTakeName(self, nameToMakeUnique):
-        uniqueName = nameToMakeUnique
-        takes = self.getTakes()
-
-        dup_name = False
-        for take in takes:
-            if uniqueName == take.name:
-                dup_name = True
-        if dup_name:
-            uniqueName = f"{uniqueName}_1"
-
-        return uniqueName
+        nameAllocator = UniqueNameAllocator(
+            usedNames=[take.name for take in self.getTakes()], suffixFormat="_{}", firstIndex=1
+        )
+        return nameAllocator.getUniqueName(nameToMakeUnique)
 
     def getTakes(self):
         return self.takes
@@ -2408,10 +2416,10 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
     def getTakeByName(self, takeName):
         """Return the first take with the specified name, None if not found"""
-        for t in self.takes:
-            if t.name == takeName:
-                return t
-        return None
+        takeInd = edit_index.getTakeIndexByName(self, takeName)
+        if -1 == takeInd:
+            return None
+        return self.takes[takeInd]
 
     def getTakeIndex(self, take):
         takeInd = -1
@@ -2427,23 +2435,19 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
     def getTakeIndexByName(self, takeName):
         """Return the index of the first take with the specified name, -1 if not found"""
-        if len(self.takes):
-            for i in range(0, len(self.takes) + 1):
-                if self.takes[i].name == takeName:
-                    return i
-        return -1
+        return edit_index.getTakeIndexByName(self, takeName)
 
     def getCurrentTakeIndex(self):
         takeInd = -1
-        if 0 < len(self.takes):
-            takeInd = 0
-            #      print(" self.takes[0]: " + str(self.takes[takeInd].name) + ", type: " + str(type(self.takes[takeInd])) )
-            #     print(" self.current_take_name: " + str(self.current_take_name) + ", type: " + str(type(self.current_take_name)) )
-            while takeInd < len(self.takes) and self.takes[takeInd].name != self.current_take_name:
-                takeInd += 1
-            if takeInd >= len(self.takes):
-                takeInd = -1
-        #    self.current_take_name = self.takes[takeInd].name
+        numTakes = len(self.takes)
+        if 0 < numTakes:
+            # current_take_name is a dynamic enum whose values are the take indices: its raw value is read
+            # directly, the enum getter would build the whole list of the takes at each call
+            rawValue = self.get("current_take_name", 0)
+            if 0 <= rawValue < numTakes:
+                takeInd = edit_index.getTakeIndexByName(self, self.takes[rawValue].name)
+            else:
+                takeInd = edit_index.getTakeIndexByName(self, self.current_take_name)
 
         return takeInd
 
@@ -2500,6 +2504,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             if self.use_project_settings:
                 defaultName = self.project_default_take_name
             defaultTake.initialize(self, name=defaultName)
+            edit_index.invalidateTake(self)
             self.setCurrentTakeByIndex(0)
             # self.setCurrentShotByIndex(-1)
             # self.setSelectedShotByIndex(-1)
@@ -2523,6 +2528,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             # important note: newTake points to the slot in takes array, not to the take itself
             newTake = takes.add()
             newTake.initialize(self, name="" + newTakeName)
+            edit_index.invalidateTake(self)
 
         # self.current_take_name = newTake.name
         # print(f"new added take name: {newTake.name}")
@@ -2534,6 +2540,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             atValidIndex = min(atValidIndex, len(takes) - 1)
             takes.move(len(takes) - 1, atValidIndex)
             newTake = takes[atValidIndex]
+            edit_index.invalidateTake(self)
 
         # after a move newTake is different!
         # print(f"new added take name02: {newTake.name}")
@@ -2552,8 +2559,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         newTakeInd = self.getTakeIndex(newTake)
 
         shots = take.getShotsList(ignoreDisabled=ignoreDisabled)
-        for shot in shots:
-            self.copyShot(shot, targetTakeIndex=newTakeInd, copyCamera=copyCamera, copyGreasePencil=True)
+        self.copyShots(shots, targetTakeIndex=newTakeInd, copyCamera=copyCamera, copyGreasePencil=True)
 
         return newTake
 
@@ -2573,6 +2579,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
                 return -1
 
         self.takes.move(takeInd, newInd)
+        edit_index.invalidateTake(self)
         self.setCurrentTakeByIndex(newInd)
 
         return newInd
@@ -2622,11 +2629,15 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
         self.createRenderSettings()
 
+    def _update_renderRootPath(self, context):
+        warnings.invalidateWarnings()
+
     renderRootPath: StringProperty(
         name="Render Root Path",
         description="Directory where the rendered files will be placed.\n"
         "Relative path must be set directly in the text field and must start with ''//''",
         default="//",
+        update=_update_renderRootPath,
     )
 
     def isRenderRootPathValid(self, renderRootFilePath=None, ignoreRelativePathIfFileNotSaved=True):
@@ -2801,6 +2812,47 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
     # editing
     ####################
 
+    def batch_edit(self):
+        """Return a context manager deferring the updates triggered by the modifications of the shots
+        (selection, storyboard frames display, redraw...) until its exit, where they are applied once.
+        To use when many shots are created or modified, eg:
+            with props.batch_edit():
+                for i in range(100):
+                    props.addShot(name=f"Sh{i:03}", start=i * 10, end=i * 10 + 9)
+        """
+        return batch_editing.batchEdit(self)
+
+    def getEditModel(self, takeIndex=-1):
+        """Return a copy of the specified take and of its shots as an edit_model.Take instance, independent from
+        Blender, None if the take is not valid.
+        The model can be modified then written back to the take with its function syncToTake()
+        """
+        takeInd = (
+            self.getCurrentTakeIndex()
+            if -1 == takeIndex
+            else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
+        )
+        if -1 == takeInd:
+            return None
+
+        return edit_model.Take.fromTake(self.takes[takeInd])
+
+    def getEditGeneration(self, takeIndex=None):
+        """Return the generation counter of the edit, incremented each time a shot or a take is changed.
+        Data computed from the shots can be kept as long as the generation does not change.
+        If takeIndex is None the generation covers all the takes, otherwise only the specified take (-1 for the
+        current take)
+        """
+        if takeIndex is None:
+            return edit_index.getGeneration(self)
+
+        takeInd = (
+            self.getCurrentTakeIndex()
+            if -1 == takeIndex
+            else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
+        )
+        return edit_index.getTakeGeneration(self, takeInd)
+
     def getEditDuration(self, ignoreDisabled=True, takeIndex=-1):
         """Return edit duration in frames"""
         takeInd = (
@@ -2808,18 +2860,10 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             if -1 == takeIndex
             else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
         )
-        duration = -1
         if -1 == takeInd:
             return -1
 
-        shotList = self.getShotsList(ignoreDisabled=ignoreDisabled, takeIndex=takeIndex)
-
-        if 0 < len(shotList):
-            duration = 0
-            for sh in shotList:
-                duration += sh.getDuration()
-
-        return duration
+        return edit_index.getTakeEditIndex(self, takeInd).getEditDuration(ignoreDisabled=ignoreDisabled)
 
     def getEditTime(self, referenceShot, frameIndexIn3DTime, referenceLevel="TAKE", ignoreDisabled=True):
         """Return edit current time in frames, -1 if no shots or if current shot is disabled
@@ -2832,38 +2876,62 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if referenceShot is None:
             return frameIndInEdit
 
-        takeInd = referenceShot.getParentTakeIndex()
-        # ignoreDisabled = True
-
         # case where specified shot is disabled -- current shot may not be in the shot list if shotList is not the whole list
         if ignoreDisabled and not referenceShot.enabled:
             return -1
 
         # specified time must be in the range of the specifed shot!!!
-        # get the whole shots list
-        shotList = self.getShotsList(ignoreDisabled=ignoreDisabled, takeIndex=takeInd)
+        if not (referenceShot.start <= frameIndexIn3DTime and frameIndexIn3DTime <= referenceShot.end):
+            return -1
 
-        if 0 < len(shotList):
-            if referenceShot.start <= frameIndexIn3DTime and frameIndexIn3DTime <= referenceShot.end:
-                frameIndInEdit = 0
-                shotInd = 0
-                while shotInd < len(shotList) and referenceShot != shotList[shotInd]:
-                    #         print("    While: shotInd: " + str(shotInd) + ", referenceShot: " + str(referenceShot) + ", shotList[shotInd]: " + str(shots[shotInd]))
-                    #         print("    frameIndInEdit: ", frameIndInEdit)
-                    if not ignoreDisabled or shotList[shotInd].enabled:
-                        frameIndInEdit += shotList[shotInd].getDuration()
-                    shotInd += 1
-
-                frameIndInEdit += frameIndexIn3DTime - referenceShot.start
-
-                if "GLOBAL_EDIT" == referenceLevel:
-                    frameIndInEdit += referenceShot.getParentTake().startInGlobalEdit
-                else:
-                    # at take level
-                    frameIndInEdit += self.editStartFrame  # at project level
+        takeInd, shotInd = edit_index.findShot(self, referenceShot)
+        if -1 == takeInd:
+            return -1
+
+        # the cumulated durations of the previous shots are given by the edit index of the take
+        takeEditIndex = edit_index.getTakeEditIndex(self, takeInd)
+        frameIndInEdit = takeEditIndex.getEditStart(shotInd, ignoreDisabled=ignoreDisabled)
+        frameIndInEdit += frameIndexIn3DTime - referenceShot.start
+
+        if "GLOBAL_EDIT" == referenceLevel:
+            frameIndInEdit += self.takes[takeInd].startInGlobalEdit
+        else:
+            # at take level
+            frameIndInEdit += self.editStartFrame  # at project level
 
         return frameIndInEdit
 
+    def get3DTimeFromEditTime(self, frameIndexInEdit, referenceLevel="TAKE", ignoreDisabled=True, takeIndex=-1):
+        """Reverse of getEditTime: return a tupple made of the index of the shot displayed at the specified edit time,
+        in the whole shots list of the take, and of the corresponding frame in 3D time.
+        Return (-1, -1) if the edit time is out of the edit.
+        referenceLevel can be "TAKE" or "GLOBAL_EDIT"
+        """
+        takeInd = (
+            self.getCurrentTakeIndex()
+            if -1 == takeIndex
+            else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
+        )
+        if -1 == takeInd:
+            return (-1, -1)
+
+        if "GLOBAL_EDIT" == referenceLevel:
+            editTime = frameIndexInEdit - self.takes[takeInd].startInGlobalEdit
+        else:
+            editTime = frameIndexInEdit - self.editStartFrame
+
+        takeEditIndex = edit_index.getTakeEditIndex(self, takeInd)
+        shotInd = takeEditIndex.getShotIndexAtEditTime(editTime, ignoreDisabled=ignoreDisabled)
+        if -1 == shotInd:
+            return (-1, -1)
+
+        frameIndIn3DTime = (
+            takeEditIndex.starts[shotInd]
+            + editTime
+            - takeEditIndex.getEditStart(shotInd, ignoreDisabled=ignoreDisabled)
+        )
+        return (shotInd, frameIndIn3DTime)
+
     def getEditCurrentTime(self, referenceLevel="TAKE", ignoreDisabled=True):
         """Return edit current time in frames, -1 if no shots or if current shot is disabled and ignoreDisabled is True
         works only on current take
@@ -2942,36 +3010,36 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
     # shots
     ####################
 
-    def getUniqueShotName(self, nameToMakeUnique, takeIndex=-1):
+    def getShotNamesAllocator(self, takeIndex=-1):
+        """Return a name allocator initialized with the names of the shots of the specified take, None if the take
+        is not valid. Names are compared without case and made unique with a suffix starting at ".001".
+        Use it to get many unique shot names in a row, for example before a bulk creation of shots, the names
+        it gives are registered as used
+        """
         takeInd = (
             self.getCurrentTakeIndex()
             if -1 == takeIndex
             else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
         )
         if -1 == takeInd:
-            return uniqueName
-
-        shotList = self.getShotsList(ignoreDisabled=False, takeIndex=takeIndex)
-        uniqueName = nameToMakeUnique
-        ind = 1
-        restartLoop = True
-        while restartLoop:
-            restartLoop = False
-            for s in shotList:
-                if uniqueName.lower() == s.name.lower():
-                    uniqueName = f"{nameToMakeUnique}.{ind:03}"
-                    ind += 1
-                    restartLoop = True
-                    break
+            return None
 
-        # dup_name = False
-        # for shot in shotList:
-        #     if uniqueName == shot.name:
-        #         dup_name = True
-        # if dup_name:
-        #     uniqueName = f"{uniqueName}_1"
+        return UniqueNameAllocator(
+            usedNames=[shot.name for shot in self.takes[takeInd].shots], firstIndex=1, caseSensitive=False
+        )
 
-        return uniqueName
+    def getUniqueShotName(self, nameToMakeUnique, takeIndex=-1):
+        nameAllocator = self.getShotNamesAllocator(takeIndex=takeIndex)
+        if nameAllocator is None:
+            return nameToMakeUnique
+        return nameAllocator.getUniqueName(nameToMakeUnique)
+
+    def reserveUniqueShotNames(self, nameToMakeUnique, count, takeIndex=-1):
+        """Return a list of count unique shot names based on the specified name, for a bulk creation of shots"""
+        nameAllocator = self.getShotNamesAllocator(takeIndex=takeIndex)
+        if nameAllocator is None:
+            return [nameToMakeUnique] * count
+        return nameAllocator.reserveNames(nameToMakeUnique, count)
 
     def addShot(
         self,
@@ -3007,11 +3075,13 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         shots = self.get_shots(takeIndex=takeInd)
 
         newShot = shots.add()  # shot is added at the end
+        edit_index.invalidateTakeShots(self, takeInd, shotAppended=True)
         newShot.parentScene = self.getParentScene()
         # newShot.parentTakeIndex = takeInd
         newShot.shotType = shotType
         newShot.initialize(self.getTakeByIndex(currentTakeInd))
-        newShot.name = name
+        # the take is known, it is not searched again to make the name unique
+        newShot.setNameInTake(name, takeInd)
         newShot.enabled = enabled
         newShot.end = 9999999  # mandatory cause start is clamped by end
         newShot.start = start
@@ -3027,6 +3097,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             atValidIndex = max(atIndex, 0)
             atValidIndex = min(atValidIndex, len(shots) - 1)
             shots.move(len(shots) - 1, atValidIndex)
+            edit_index.invalidateTakeShots(self, takeInd)
             newShot = shots[atValidIndex]
             newShotInd = atValidIndex
 
@@ -3036,8 +3107,13 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
         # update the current take if needed
         if takeInd == currentTakeInd:
-            self.setCurrentShotByIndex(newShotInd)
-            self.setSelectedShotByIndex(newShotInd)
+            batch = batch_editing.getBatchEdit(self)
+            if batch is not None:
+                batch.currentShotName = newShot.name
+                batch.selectedShotName = newShot.name
+            else:
+                self.setCurrentShotByIndex(newShotInd)
+                self.setSelectedShotByIndex(newShotInd)
 
         # warning: by reordering the shots it looks like newShot is not pointing anymore on the new shot
         # we then get it again
@@ -3175,6 +3251,132 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
         return newShot
 
+    def copyShots(self, shots, atIndex=-1, targetTakeIndex=-1, copyCamera=False, copyGreasePencil=False):
+        """Copy in bulk the specified shots, all belonging to the same take, at the end of the shot list of the target
+        take or at atIndex if specified
+        Return the list of the newly added shots
+        Much faster than copyShot on many shots: the stored values of the properties of the shots are copied directly,
+        without their setters and update functions, the names are made unique with a single allocator and the edit
+        indices are invalidated once. Same naming rules as copyShot.
+
+        Args:
+            copyCamera: when True each camera is duplicated once, the copied shots then share the copied cameras the
+                        same way the source shots share theirs. When False the copied shots share the source cameras
+            copyGreasePencil: when false then an empty grease pencil will be created. When true the GP will be copied too
+        """
+        if not len(shots):
+            return []
+
+        sourceTakeInd = edit_index.findShot(self, shots[0])[0]
+        takeInd = (
+            sourceTakeInd
+            if -1 == targetTakeIndex
+            else (targetTakeIndex if 0 <= targetTakeIndex and targetTakeIndex < len(self.getTakes()) else -1)
+        )
+        if -1 == takeInd or -1 == sourceTakeInd:
+            return []
+
+        nameSuffix = "_copy" if takeInd == sourceTakeInd else ""
+        nameAllocator = self.getShotNamesAllocator(takeIndex=takeInd)
+
+        # properties copied with their stored values
+        copiedPropNames = (
+            "shotType",
+            "start",
+            "end",
+            "enabled",
+            "durationLocked",
+            "color",
+            "bgImages_linkToShotStart",
+            "bgImages_offset",
+            "note01",
+            "note02",
+            "note03",
+        )
+
+        # all the data of the source shots are read before adding new shots since adding shots to the take
+        # of the source shots invalidates the references to them
+        sourceShotsData = list()
+        copiedCameras = dict()
+        for shot in shots:
+            values = dict()
+            for propName in copiedPropNames:
+                if propName in shot:
+                    val = shot[propName]
+                    values[propName] = val.to_list() if hasattr(val, "to_list") else val
+
+            cam = shot.camera
+            newCam = None
+            if copyCamera and shot.isCameraValid():
+                newCam = copiedCameras.get(cam.as_pointer(), None)
+                if newCam is None:
+                    newCam = self.copyCameraFromShot(shot, duplicateHierarchy=copyGreasePencil)
+                    copiedCameras[cam.as_pointer()] = newCam
+                cam = newCam
+
+            sourceShotsData.append(
+                (
+                    nameAllocator.getUniqueName(shot.name + nameSuffix),
+                    values,
+                    cam,
+                    newCam is not None,
+                    0 < len(shot.greasePencils),
+                    edit_index.findShot(self, shot)[1],
+                )
+            )
+
+        parentScene = self.getParentScene()
+        targetShots = self.takes[takeInd].shots
+        firstNewShotInd = len(targetShots)
+        for name, values, cam, _cameraCopied, _hasGreasePencil, _sourceShotInd in sourceShotsData:
+            newShot = targetShots.add()
+            newShot.parentScene = parentScene
+            newShot["name"] = name
+            for propName, val in values.items():
+                newShot[propName] = val
+            newShot.camera = cam
+
+        # grease pencils are added once all the shots are created, the source shots are then got again from their indices
+        sourceShots = self.takes[sourceTakeInd].shots
+        for i, (_name, _values, _cam, cameraCopied, hasGreasePencil, sourceShotInd) in enumerate(sourceShotsData):
+            if not hasGreasePencil:
+                continue
+            newShot = targetShots[firstNewShotInd + i]
+
+            # if the source has a gp then the new shot will have one
+            gpProps = newShot.greasePencils.add()
+            # initialize do not create a new gp object if it exits, in this case it will just update
+            gpProps.initialize(newShot, "STORYBOARD")
+
+            # the new gp is a copy of the source gp only if copyGreasePencil is true
+            if copyGreasePencil and cameraCopied:
+                sourceGpProps = sourceShots[sourceShotInd].getGreasePencilProps("STORYBOARD")
+                if sourceGpProps is not None:
+                    gpProps.copyPropertiesFrom(sourceGpProps)
+
+        # move the shots at the specified index
+        newShotsInd = firstNewShotInd
+        if -1 != atIndex:
+            newShotsInd = min(max(atIndex, 0), firstNewShotInd)
+            if newShotsInd != firstNewShotInd:
+                for i in range(len(sourceShotsData)):
+                    targetShots.move(firstNewShotInd + i, newShotsInd + i)
+
+        edit_index.invalidateTake(self, takeInd)
+
+        # update the current take if needed
+        lastNewShotInd = newShotsInd + len(sourceShotsData) - 1
+        if takeInd == self.getCurrentTakeIndex():
+            batch = batch_editing.getBatchEdit(self)
+            if batch is not None:
+                batch.currentShotName = targetShots[lastNewShotInd].name
+                batch.selectedShotName = targetShots[lastNewShotInd].name
+            else:
+                self.setCurrentShotByIndex(lastNewShotInd)
+                self.setSelectedShotByIndex(lastNewShotInd)
+
+        return [targetShots[i] for i in range(newShotsInd, lastNewShotInd + 1)]
+
     def removeShotByIndex(self, shotIndex, deleteCamera=False, takeIndex=-1):
         """Remove the shot at the specified index from the specifed take
         If deleteCamera is True the camera is deleted only if it is not shared with any other shots
@@ -3193,6 +3395,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             if deleteCamera:
                 self.deleteShotCamera(shots[shotIndex])
             shots.remove(shotIndex)
+            edit_index.invalidateTake(self, takeInd)
 
     def removeShot(self, shot, deleteCamera=False):
         """Remove the shot from its parent take
@@ -3255,6 +3458,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             # print(f"La: takeInd: {takeInd}, currentTakeInd: {currentTakeInd}, shot Ind: {shotInd}")
             self.removeShot(shot, deleteCamera=deleteCamera)
             shots.remove(shotInd)
+            edit_index.invalidateTake(self, takeInd)
 
     def moveShotToIndex(self, shot, newIndex):
         """
@@ -3285,6 +3489,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         newInd = min(newInd, len(shots) - 1)
 
         shots.move(shotInd, newInd)
+        edit_index.invalidateTake(self, takeInd)
 
         # wkipwkipwkip test if shot and current shot are from the same take!!
         # if currentShotInd == shotInd:
@@ -3293,40 +3498,18 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
 
         return self.getShotByIndex(newInd, takeIndex=takeInd)
 
+    # the location of the shots is given by the identity map maintained in edit_index
     def getShotParentTakeIndex(self, shot):
-        for i, take in enumerate(self.takes):
-            for j, sh in enumerate(take.shots):
-                if sh == shot:
-                    return i
-        return None
+        takeInd = edit_index.findShot(self, shot)[0]
+        return None if -1 == takeInd else takeInd
 
     def getShotParentTake(self, shot):
-        for i, take in enumerate(self.takes):
-            for j, sh in enumerate(take.shots):
-                if sh == shot:
-                    return take
-        return -1
+        takeInd = edit_index.findShot(self, shot)[0]
+        return -1 if -1 == takeInd else self.takes[takeInd]
 
     def getShotIndex(self, shot):
         """Return the shot index in its parent take"""
-        # takeInd = shot.getParentTakeIndex()
-        # shotInd = -1
-
-        # # wkip a optimiser
-        # shotList = self.getShotsList(ignoreDisabled=False, takeIndex=takeInd)
-
-        # shotInd = 0
-        # while shotInd < len(shotList) and shot != shotList[shotInd]:  # wkip mettre shotList[shotInd].name?
-        #     shotInd += 1
-        # if shotInd == len(shotList):
-        #     shotInd = -1
-
-        # return shotInd
-        for i, take in enumerate(self.takes):
-            for j, sh in enumerate(take.shots):
-                if sh == shot:
-                    return j
-        return -1
+        return edit_index.findShot(self, shot)[1]
 
     def getShotByIndex(self, shotIndex, ignoreDisabled=False, takeIndex=-1):
         takeInd = (
@@ -3338,16 +3521,13 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return None
 
-        shotList = self.getShotsList(ignoreDisabled=ignoreDisabled, takeIndex=takeIndex)
-
-        # if ignoreDisabled:
-        #     if 0 < len(shotList) and shotIndex < len(shotList):
-        #         shot = shotList[shotIndex]
-        # else if 0 < shotNumber and shotIndex < shotNumber:
-        #     shot = self.takes[takeIndex].shots[shotIndex]
-
-        if 0 < len(shotList) and shotIndex < len(shotList):
-            shot = shotList[shotIndex]
+        shots = self.takes[takeInd].shots
+        if ignoreDisabled:
+            enabledShotIndices = edit_index.getTakeEditIndex(self, takeInd).enabledShotIndices
+            if 0 < len(enabledShotIndices) and shotIndex < len(enabledShotIndices):
+                shot = shots[enabledShotIndices[shotIndex]]
+        elif 0 < len(shots) and shotIndex < len(shots):
+            shot = shots[shotIndex]
 
         return shot
 
@@ -3411,7 +3591,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return 0
 
-        return self.takes[takeInd].getNumShots(ignoreDisabled=ignoreDisabled)
+        return edit_index.getTakeEditIndex(self, takeInd).getNumShots(ignoreDisabled=ignoreDisabled)
 
     def getCurrentShotIndex(self, ignoreDisabled=False, takeIndex=-1):
         """Return the index of the current shot in the enabled shot list of the current take
@@ -3439,11 +3619,9 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             return -1
 
         if ignoreDisabled and 0 < len(self.takes[takeInd].shots):
-            # for i, shot in enumerate ( self.context.scene.UAS_shot_manager_props.takes[self.context.scene.UAS_shot_manager_props.current_take_name].shots ):
-            currentShotInd = self.current_shot_index
-            for i in range(self.current_shot_index + 1):
-                if not self.takes[takeInd].shots[i].enabled:
-                    currentShotInd -= 1
+            # a disabled current shot gives the index of the previous enabled shot in the enabled list
+            takeEditIndex = edit_index.getTakeEditIndex(self, takeInd)
+            currentShotInd = takeEditIndex.getNumEnabledShotsBefore(self.current_shot_index + 1) - 1
         #      print("  in ignoreDisabled, currentShotInd: ", currentShotInd)
         else:
             if 0 < len(self.takes[takeInd].shots):
@@ -3704,13 +3882,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return previousShotInd
 
-        shotList = self.getShotsList(takeIndex=takeIndex)
-
-        previousShotInd = currentShotIndex - 1
-        isPreviousFound = shotList[previousShotInd].enabled
-        while 0 <= previousShotInd and not isPreviousFound:
-            previousShotInd -= 1
-            isPreviousFound = shotList[previousShotInd].enabled
+        previousShotInd = edit_index.getTakeEditIndex(self, takeInd).getPreviousEnabledShotIndex(currentShotIndex)
 
         return previousShotInd
 
@@ -3726,93 +3898,66 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return nextShotInd
 
-        shotList = self.getShotsList(takeIndex=takeIndex)
-
-        nextShotInd = currentShotIndex + 1
-        if len(shotList) > nextShotInd:
-            isNextFound = shotList[nextShotInd].enabled
-            while len(shotList) > nextShotInd and not isNextFound:
-                nextShotInd += 1
-                if len(shotList) > nextShotInd:
-                    isNextFound = shotList[nextShotInd].enabled
-
-        if len(shotList) <= nextShotInd:
-            nextShotInd = -1
+        nextShotInd = edit_index.getTakeEditIndex(self, takeInd).getNextEnabledShotIndex(currentShotIndex)
 
         return nextShotInd
 
-    # works only on current take
-    # TODO make this function work for any take
-    def getFirstShotIndexContainingFrame(self, frameIndex, ignoreDisabled=False):
+    # frame queries are done on the interval index of the take, see edit_model.ShotsIntervalIndex
+    def getFirstShotIndexContainingFrame(self, frameIndex, ignoreDisabled=False, takeIndex=-1):
         """Return the first shot containing the specifed frame, -1 if not found"""
-        firstShotInd = -1
-
-        shotList = self.get_shots()
-        shotFound = False
-
-        if len(shotList):
-            firstShotInd = 0
-            while firstShotInd < len(shotList) and not shotFound:
-                if not ignoreDisabled or shotList[firstShotInd].enabled:
-                    shotFound = shotList[firstShotInd].start <= frameIndex and frameIndex <= shotList[firstShotInd].end
-                firstShotInd += 1
+        shotIndices = self.getShotIndicesContainingFrame(frameIndex, ignoreDisabled=ignoreDisabled, takeIndex=takeIndex)
+        return shotIndices[0] if len(shotIndices) else -1
 
-        if shotFound:
-            firstShotInd = firstShotInd - 1
-        else:
-            firstShotInd = -1
-
-        return firstShotInd
-
-    # works only on current take
-    # TODO make this function work for any take
-    def getFirstShotIndexBeforeFrame(self, frameIndex, ignoreDisabled=False):
+    def getFirstShotIndexBeforeFrame(self, frameIndex, ignoreDisabled=False, takeIndex=-1):
         """Return the first shot before the specifed frame (supposing thanks to getFirstShotIndexContainingFrame than
         frameIndex is not in a shot), -1 if not found
         """
-        firstShotInd = -1
-
-        shotList = self.get_shots()
-        shotFound = False
-
-        if len(shotList):
-            firstShotInd = len(shotList) - 1
-            while 0 <= firstShotInd and not shotFound:
-                if not ignoreDisabled or shotList[firstShotInd].enabled:
-                    shotFound = shotList[firstShotInd].end < frameIndex
-                firstShotInd -= 1
-
-        if shotFound:
-            firstShotInd = firstShotInd + 1
-        else:
-            firstShotInd = -1
+        takeInd = (
+            self.getCurrentTakeIndex()
+            if -1 == takeIndex
+            else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
+        )
+        if -1 == takeInd:
+            return -1
 
-        return firstShotInd
+        intervalIndex = edit_index.getTakeEditIndex(self, takeInd).getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getLastShotIndexEndingBefore(frameIndex)
 
-    # works only on current take
-    # TODO make this function work for any take
-    def getFirstShotIndexAfterFrame(self, frameIndex, ignoreDisabled=False):
+    def getFirstShotIndexAfterFrame(self, frameIndex, ignoreDisabled=False, takeIndex=-1):
         """Return the first shot after the specifed frame (supposing thanks to getFirstShotIndexContainingFrame than
         frameIndex is not in a shot), -1 if not found
         """
-        firstShotInd = -1
+        takeInd = (
+            self.getCurrentTakeIndex()
+            if -1 == takeIndex
+            else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
+        )
+        if -1 == takeInd:
+            return -1
 
-        shotList = self.get_shots()
-        shotFound = False
+        intervalIndex = edit_index.getTakeEditIndex(self, takeInd).getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getFirstShotIndexStartingAfter(frameIndex)
 
-        if len(shotList):
-            firstShotInd = 0
-            while firstShotInd < len(shotList) and not shotFound:
-                if not ignoreDisabled or shotList[firstShotInd].enabled:
-                    shotFound = frameIndex < shotList[firstShotInd].start
-                firstShotInd += 1
+    def getShotIndicesContainingFrame(self, frameIndex, ignoreDisabled=False, takeIndex=-1):
+        """Return the sorted list of the indices of the shots containing the specified frame"""
+        return self.getShotIndicesOverlappingRange(
+            frameIndex, frameIndex, ignoreDisabled=ignoreDisabled, takeIndex=takeIndex
+        )
 
-        if shotFound:
-            firstShotInd = firstShotInd - 1
-        else:
-            firstShotInd = -1
+    def getShotIndicesOverlappingRange(self, rangeStart, rangeEnd, ignoreDisabled=False, takeIndex=-1):
+        """Return the sorted list of the indices of the shots having at least one frame in the specified range.
+        rangeStart and rangeEnd are inclusive
+        """
+        takeInd = (
+            self.getCurrentTakeIndex()
+            if -1 == takeIndex
+            else (takeIndex if 0 <= takeIndex and takeIndex < len(self.getTakes()) else -1)
+        )
+        if -1 == takeInd:
+            return []
 
-        return firstShotInd
+        intervalIndex = edit_index.getTakeEditIndex(self, takeInd).getIntervalIndex(ignoreDisabled=ignoreDisabled)
+        return intervalIndex.getShotIndicesOverlappingRange(rangeStart, rangeEnd)
 
     #############################################
     # shot cameras
@@ -3858,7 +4003,12 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return shotList
 
-        return self.takes[takeInd].getShotsUsingCamera(cam, ignoreDisabled=ignoreDisabled)
+        shots = self.takes[takeInd].shots
+        camerasIndex = edit_index.getCamerasIndex(self)
+        for _takeInd, shotInd in camerasIndex.getShotLocations(cam, ignoreDisabled=ignoreDisabled, takeIndex=takeInd):
+            shotList.append(shots[shotInd])
+
+        return shotList
 
     def getShotsSharingCamera(self, cam, ignoreDisabled=False, takeIndex=-1, inAllTakes=True):
         """Return a dictionary with all the shots using the specified camera in the specified takes
@@ -3877,18 +4027,17 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             )
             if -1 == takeInd:
                 return shotsDict
-
-            shotList = self.takes[takeInd].getShotsUsingCamera(cam, ignoreDisabled=ignoreDisabled)
-            if len(shotList):
-                shotsDict[self.takes[takeInd].getName_PathCompliant()] = shotList
-
         else:
-            if len(self.takes):
-                for take in self.takes:
-                    shotList = []
-                    shotList = take.getShotsUsingCamera(cam, ignoreDisabled=ignoreDisabled)
-                    if len(shotList):
-                        shotsDict[take.getName_PathCompliant()] = shotList
+            takeInd = -1
+
+        # the shots locations are ordered by take, the dictionary keeps the order of the takes
+        camerasIndex = edit_index.getCamerasIndex(self)
+        for locTakeInd, shotInd in camerasIndex.getShotLocations(cam, ignoreDisabled=ignoreDisabled, takeIndex=takeInd):
+            take = self.takes[locTakeInd]
+            takeName = take.getName_PathCompliant()
+            if takeName not in shotsDict:
+                shotsDict[takeName] = list()
+            shotsDict[takeName].append(take.shots[shotInd])
 
         return shotsDict
 
@@ -3896,15 +4045,19 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         """Return a tupple made by the number of shots, in all takes, using the camera and the number
         of takes that have at least one shot using this camera
         """
-        sharedCams = self.getShotsSharingCamera(cam, ignoreDisabled=ignoreDisabled, inAllTakes=True)
-        numSharedCams = 0
-        for k in sharedCams:
-            numSharedCams += len(sharedCams[k])
+        if cam is None:
+            return (0, 0)
+
+        camerasIndex = edit_index.getCamerasIndex(self)
+        shotLocations = camerasIndex.getShotLocations(cam, ignoreDisabled=ignoreDisabled)
+        numTakes = len({self.takes[takeInd].getName_PathCompliant() for takeInd, _shotInd in shotLocations})
 
-        return (numSharedCams, len(sharedCams))
+        return (len(shotLocations), numTakes)
 
     def isThereSharedCamerasInTake(self, ignoreDisabled=False, takeIndex=-1, inAllTakes=True):
-        """Return True if there is at least 1 camera shared in the specified take, False otherwise"""
+        """Return True if there is at least 1 camera shared in the specified take, False otherwise
+        The shots without camera are not considered as sharing a camera
+        """
         takeInd = (
             self.getCurrentTakeIndex()
             if -1 == takeIndex
@@ -3913,15 +4066,12 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return -1
 
-        for shot in self.takes[takeInd].shots:
-            if ignoreDisabled or shot.enabled:
-                if 1 < self.getNumSharedCamera(shot.camera, ignoreDisabled=ignoreDisabled, takeIndex=takeInd):
-                    return True
-        return False
+        return edit_index.getCamerasIndex(self).isThereSharedCamerasInTake(takeInd, ignoreDisabled=ignoreDisabled)
 
     def getNumSharedCamera(self, cam, ignoreDisabled=False, takeIndex=-1, inAllTakes=True):
         """Return the number of times the specified camera is used by the shots of the specified takes
-        0 means the camera is not used at all, -1 that the specified take is not valid
+        0 means the camera is not used at all, -1 that the specified take is not valid.
+        0 is also returned for a None camera: the shots without camera are not considered as sharing a camera
         """
         if not inAllTakes:
             takeInd = (
@@ -3931,15 +4081,14 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
             )
             if -1 == takeInd:
                 return -1
+        else:
+            takeInd = -1
 
-        sharedCams = self.getShotsSharingCamera(
-            cam, ignoreDisabled=ignoreDisabled, takeIndex=takeIndex, inAllTakes=inAllTakes
-        )
-        numSharedCams = 0
-        for k in sharedCams:
-            numSharedCams += len(sharedCams[k])
+        if cam is None:
+            return 0
 
-        return numSharedCams
+        camerasIndex = edit_index.getCamerasIndex(self)
+        return camerasIndex.getNumShotsUsingCamera(cam, ignoreDisabled=ignoreDisabled, takeIndex=takeInd)
 
     def deleteShotCamera(self, shot):
         """Check in all takes if the camera is used by another shot and if not then delete it"""
@@ -3949,10 +4098,8 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if not shot.isCameraValid():
             return False
 
-        for t in self.takes:
-            for s in t.shots:
-                if shot != s and s.camera is not None and shot.camera == s.camera:
-                    return False
+        if 1 < edit_index.getCamerasIndex(self).getNumShotsUsingCamera(shot.camera):
+            return False
 
         # bpy.ops.object.select_all(action="DESELECT")
         cam = shot.camera
@@ -4170,7 +4317,8 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         """
         # print(" ** -- ** goToPreviousShotBoundary")
 
-        if not len(self.get_shots()):
+        shots = self.get_shots()
+        if not len(shots):
             return ()
 
         previousShotInd = -1
@@ -4181,14 +4329,14 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if "ANY" == boundaryMode:
             # get current shot in the WHOLE list (= even disabled)
             currentShotInd = self.getCurrentShotIndex()
-            currentShot = self.getShotByIndex(currentShotInd)
+            currentShot = shots[currentShotInd]
             # _logger.debug_ext(f"    current Shot: {currentShotInd}")
             if not currentShot.enabled:
                 print("    current Shot is disabled")
                 previousShotInd = self.getPreviousEnabledShotIndex(currentShotInd)
                 if -1 < previousShotInd:
                     #        print("    previous Shot ind is ", previousShotInd)
-                    newFrame = self.getShotByIndex(previousShotInd).end
+                    newFrame = shots[previousShotInd].end
             else:
                 #    print("    current Shot is ENabled")
                 if currentFrame == currentShot.start:
@@ -4196,7 +4344,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
                     previousShotInd = self.getPreviousEnabledShotIndex(currentShotInd)
                     if -1 < previousShotInd:
                         #            print("      previous Shot ind is ", previousShotInd)
-                        newFrame = self.getShotByIndex(previousShotInd).end
+                        newFrame = shots[previousShotInd].end
                     else:  # case of the very first shot
                         previousShotInd = currentShotInd
                         newFrame = currentFrame
@@ -4210,21 +4358,21 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         elif "START" == boundaryMode:
             # get current shot in the WHOLE list (= even disabled)
             currentShotInd = self.getCurrentShotIndex()
-            currentShot = self.getShotByIndex(currentShotInd)
+            currentShot = shots[currentShotInd]
             # print("    current Shot: ", currentShotInd)
             if not currentShot.enabled:
                 # print("    current Shot is disabled")
                 previousShotInd = self.getPreviousEnabledShotIndex(currentShotInd)
                 if -1 < previousShotInd:
                     #     print("    previous Shot ind is ", previousShotInd)
-                    newFrame = self.getShotByIndex(previousShotInd).start
+                    newFrame = shots[previousShotInd].start
             else:
                 # print("    current Shot is ENabled")
 
                 previousShotInd = self.getPreviousEnabledShotIndex(currentShotInd)
                 if -1 < previousShotInd:
                     #   print("      previous Shot ind is ", previousShotInd)
-                    newFrame = self.getShotByIndex(previousShotInd).start
+                    newFrame = shots[previousShotInd].start
                 else:  # case of the very first shot
                     previousShotInd = currentShotInd
                     newFrame = currentFrame
@@ -4232,14 +4380,14 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         elif "END" == boundaryMode:
             # get current shot in the WHOLE list (= even disabled)
             currentShotInd = self.getCurrentShotIndex()
-            currentShot = self.getShotByIndex(currentShotInd)
+            currentShot = shots[currentShotInd]
             #  print("    current Shot: ", currentShotInd)
             if not currentShot.enabled:
                 #     print("    current Shot is disabled")
                 previousShotInd = self.getPreviousEnabledShotIndex(currentShotInd)
                 if -1 < previousShotInd:
                     #        print("    previous Shot ind is ", previousShotInd)
-                    newFrame = self.getShotByIndex(previousShotInd).end
+                    newFrame = shots[previousShotInd].end
             else:
                 #   print("    current Shot is ENabled")
                 # if currentFrame == currentShot.start:
@@ -4247,7 +4395,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
                 previousShotInd = self.getPreviousEnabledShotIndex(currentShotInd)
                 if -1 < previousShotInd:
                     #     print("      previous Shot ind is ", previousShotInd)
-                    newFrame = self.getShotByIndex(previousShotInd).end
+                    newFrame = shots[previousShotInd].end
                 else:  # case of the very first shot
                     previousShotInd = currentShotInd
                     newFrame = currentFrame
@@ -4267,7 +4415,8 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
     # works only on current take
     def goToNextShotBoundary(self, currentFrame, ignoreDisabled=False, boundaryMode="ANY"):
         # print(" ** -- ** goToNextShotBoundary")
-        if not len(self.get_shots()):
+        shots = self.get_shots()
+        if not len(shots):
             return ()
 
         #   nextShot = None
@@ -4280,14 +4429,14 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if "ANY" == boundaryMode:
             # get current shot in the WHOLE list (= even disabled)
             currentShotInd = self.getCurrentShotIndex()
-            currentShot = self.getShotByIndex(currentShotInd)
+            currentShot = shots[currentShotInd]
             #    print("    current Shot: ", currentShotInd)
             if not currentShot.enabled:
                 #       print("    current Shot is disabled")
                 nextShotInd = self.getNextEnabledShotIndex(currentShotInd)
                 if -1 < nextShotInd:
                     #          print("    next Shot ind is ", nextShotInd)
-                    newFrame = self.getShotByIndex(nextShotInd).start
+                    newFrame = shots[nextShotInd].start
             else:
                 #     print("    current Shot is ENabled")
                 if currentFrame == currentShot.end:
@@ -4295,7 +4444,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
                     nextShotInd = self.getNextEnabledShotIndex(currentShotInd)
                     if -1 < nextShotInd:
                         #         print("      next Shot ind is ", nextShotInd)
-                        newFrame = self.getShotByIndex(nextShotInd).start
+                        newFrame = shots[nextShotInd].start
                     else:  # case of the very last shot
                         nextShotInd = currentShotInd
                         newFrame = currentFrame
@@ -4309,14 +4458,14 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         elif "START" == boundaryMode:
             # get current shot in the WHOLE list (= even disabled)
             currentShotInd = self.getCurrentShotIndex()
-            currentShot = self.getShotByIndex(currentShotInd)
+            currentShot = shots[currentShotInd]
             #    print("    current Shot: ", currentShotInd)
             if not currentShot.enabled:
                 #        print("    current Shot is disabled")
                 nextShotInd = self.getNextEnabledShotIndex(currentShotInd)
                 if -1 < nextShotInd:
                     #           print("    next Shot ind is ", nextShotInd)
-                    newFrame = self.getShotByIndex(nextShotInd).start
+                    newFrame = shots[nextShotInd].start
             else:
                 #      print("    current Shot is ENabled")
                 # if currentFrame == currentShot.end:
@@ -4324,7 +4473,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
                 nextShotInd = self.getNextEnabledShotIndex(currentShotInd)
                 if -1 < nextShotInd:
                     #         print("      next Shot ind is ", nextShotInd)
-                    newFrame = self.getShotByIndex(nextShotInd).start
+                    newFrame = shots[nextShotInd].start
                 else:  # case of the very last shot
                     nextShotInd = currentShotInd
                     newFrame = currentFrame
@@ -4332,14 +4481,14 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         elif "END" == boundaryMode:
             # get current shot in the WHOLE list (= even disabled)
             currentShotInd = self.getCurrentShotIndex()
-            currentShot = self.getShotByIndex(currentShotInd)
+            currentShot = shots[currentShotInd]
             # print("    current Shot: ", currentShotInd)
             if not currentShot.enabled:
                 #    print("    current Shot is disabled")
                 nextShotInd = self.getNextEnabledShotIndex(currentShotInd)
                 if -1 < nextShotInd:
                     #       print("    next Shot ind is ", nextShotInd)
-                    newFrame = self.getShotByIndex(nextShotInd).end
+                    newFrame = shots[nextShotInd].end
             else:
                 #    print("    current Shot is ENabled")
                 if currentFrame == currentShot.end:
@@ -4347,7 +4496,7 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
                     nextShotInd = self.getNextEnabledShotIndex(currentShotInd)
                     if -1 < nextShotInd:
                         #          print("      next Shot ind is ", nextShotInd)
-                        newFrame = self.getShotByIndex(nextShotInd).end
+                        newFrame = shots[nextShotInd].end
                     else:  # case of the very last shot
                         nextShotInd = currentShotInd
                         newFrame = currentFrame
@@ -5187,77 +5336,18 @@ class UAS_ShotManager_Props(MontageInterface, PropertyGroup):
         if -1 == takeInd:
             return ()
 
-        # get the disabled shots
         shotList = self.takes[takeInd].shots
+        names = [shot.name for shot in shotList]
+        enabledStates = [shot.enabled for shot in shotList]
 
-        disabledShotNames = list()
-        for i in range(0, len(shotList)):
-            if not shotList[i].enabled:
-                disabledShotNames.append(shotList[i].name)
-
-        # sort the list
-        disabledShotNames.sort()
-
-        # print("\nSorted list:")
-        # for nam in disabledShotNames:
-        #     print(f"  {nam}")
-
-        # shot_re = re.compile(r"sh_?(\d+)", re.IGNORECASE)
-        # shot_re = re.compile(r"Sh_?(\d+)")
-        shot_re = re.compile(r"^Sh\d\d\d\d")
-
-        def _baseName(name):
-            """We are based on the name template Shxxxx"""
-            return name[:6]
-
-        def _isValidShotName(name):
-            res = False
-            match = shot_re.search(name)
-            if match:
-                res = True
-            return res
-
-        #  print("\nTreated list:")
-        for shName in disabledShotNames:
-            # if it is a basename or a version name
-            if _isValidShotName(shName):
-                #         print(f"\n - {shName}, basename: {_baseName(shName)}")
-
-                # check the shots list from begining and insert at first place where names are matching
-                for i in range(0, len(shotList)):
-                    # ignore self
-                    shotFromName = self.getShotByName(shName)
-                    shotFromNameInd = self.getShotIndex(shotFromName)
-
-                    #       print(f"  i:{i} ")
-                    if shotList[i].name == shName:
-                        pass
-                    elif (shotList[i].name).startswith(_baseName(shName)):
-                        #  print(f"   ici:  shotList[i].name: {shotList[i].name}")
-
-                        if shName < shotList[i].name:
-                            #       print(f"     before, i:{i}, shotFromName:{shotFromName}")
-                            #       self.takes[takeInd].debugDisplayShots()
-                            if shotFromNameInd < i:
-                                if 0 < i:
-                                    self.moveShotToIndex(shotFromName, i - 1)
-                            else:
-                                self.moveShotToIndex(shotFromName, i)
-                            #       self.takes[takeInd].debugDisplayShots()
-                            break
-                        else:
-                            #    print(f"   lu")
-                            if len(shotList) > i + 1:
-                                #        print(f"   lulu")
-                                if (shotList[i + 1].name).startswith(_baseName(shName)):
-                                    if shName < shotList[i + 1].name:
-                                        #                print(f"     lu")
-                                        self.moveShotToIndex(shotFromName, i + 1)
-                                        break
-                                else:
-                                    #            print("lo")
-                                    self.moveShotToIndex(shotFromName, i + 1)
-                                    break
+        # the new order is computed at once and applied with the minimum number of moves
+        newOrder = edit_model.getShotsVersionsOrder(names, enabledStates)
+        moves = getMovesToReorder(newOrder)
+        for fromInd, toInd in moves:
+            shotList.move(fromInd, toInd)
+
+        if len(moves):
+            edit_index.invalidateTake(self, takeInd)
 
 
 ###########################
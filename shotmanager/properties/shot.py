@@ -40,7 +40,10 @@ from shotmanager.features.greasepencil.greasepencil_props import GreasePencilPro
 from shotmanager.features.greasepencil import greasepencil as gp
 from shotmanager.utils import utils
 from shotmanager.utils import utils_greasepencil
+from shotmanager.utils import utils_shot_manager
 from .montage_interface import ShotInterface
+from . import edit_index
+from . import batch_editing
 
 from shotmanager.config import config
 from shotmanager.config import sm_logging
@@ -100,17 +103,9 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
         if self.parentScene is not None:
             return self.parentScene
 
-        for scene in bpy.data.scenes:
-            if "UAS_shot_manager_props" in scene:
-                props = config.getAddonProps(scene)
-                for take in props.takes:
-                    #    print("Take name: ", take.name)
-                    for shot in take.shots:
-                        #        print("  Shot name: ", shot.name)
-                        if shot.name == self.name:
-                            self.parentScene = scene
-                            return scene
-        return None
+        # resolves the parent scene of all the shots at once so that the next calls don't have to scan the file
+        utils_shot_manager.resolveMissingParentScenes()
+        return self.parentScene
 
     # gpStoryboard: PointerProperty(type=GreasePencilStoryboard)
 
@@ -154,14 +149,28 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
 
     def _set_name(self, value):
         """Set a unique name to the shot"""
+        self.setNameInTake(value, self.getParentTakeIndex())
+
+    def setNameInTake(self, value, takeInd):
+        """Set a unique name to the shot, the index of its parent take being known"""
         props = config.getAddonProps(self.parentScene)
-        shots = props.getShotsList(takeIndex=self.getParentTakeIndex())
-        newName = utils.findFirstUniqueName(self, value, shots)
+        batch = batch_editing.getBatchEdit(props)
+        if batch is not None and takeInd is not None:
+            # during a batch edit the names are allocated without scanning all the shots of the take each time
+            nameAllocator = batch.getShotNamesAllocator(props.takes[takeInd])
+            nameAllocator.removeName(self.name)
+            newName = nameAllocator.getUniqueName(value)
+            batch.renameClipLinkToUpdate(takeInd, self.name, newName)
+        else:
+            shots = props.getShotsList(takeIndex=takeInd)
+            newName = utils.findFirstUniqueName(self, value, shots)
         self["name"] = newName
 
     name: StringProperty(name="Name", get=_get_name, set=_set_name)
 
     def _update_enabled(self, context):
+        self.invalidateEditIndex()
+        self.invalidateCamerasIndex()
         self.selectShotInUI()
 
     enabled: BoolProperty(
@@ -172,8 +181,22 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
         options=set(),
     )
 
+    def invalidateEditIndex(self):
+        """To call each time the timing of the shot in the edit is changed"""
+        props = config.getAddonProps(self.parentScene)
+        edit_index.invalidateShot(props, self)
+
+    def invalidateCamerasIndex(self):
+        """To call each time the camera of the shot is changed"""
+        props = config.getAddonProps(self.parentScene)
+        edit_index.invalidateCameras(props, self)
+
     def selectShotInUI(self):
         props = config.getAddonProps(self.parentScene)
+        # during a batch edit the selection is not changed for each modified shot, the shots added to the
+        # current take are selected at the end of the batch
+        if batch_editing.isBatchEditing(props):
+            return
         currentTakeInd = props.getCurrentTakeIndex()
         if currentTakeInd == self.getParentTakeIndex():
             props.setSelectedShot(self)
@@ -209,9 +232,15 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
                 self["start"] = self.end
 
     def _update_start(self, context):
+        self.invalidateEditIndex()
         self.selectShotInUI()
-        self.updateClipLinkToShotStart()
-        config.gRedrawShotStack = True
+        batch = batch_editing.getBatchEdit(config.getAddonProps(self.parentScene))
+        if batch is not None:
+            batch.addClipLinkToUpdate(self.getParentTakeIndex(), self.name)
+            batch.redrawShotStack = True
+        else:
+            self.updateClipLinkToShotStart()
+            config.gRedrawShotStack = True
 
     start: IntProperty(
         name="Shot Start",
@@ -245,8 +274,13 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
                 self["end"] = self.start
 
     def _update_end(self, context):
+        self.invalidateEditIndex()
         self.selectShotInUI()
-        config.gRedrawShotStack = True
+        batch = batch_editing.getBatchEdit(config.getAddonProps(self.parentScene))
+        if batch is not None:
+            batch.redrawShotStack = True
+        else:
+            config.gRedrawShotStack = True
 
     end: IntProperty(
         name="Shot End",
@@ -334,12 +368,16 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
         else:
             return False
 
+    def _update_camera(self, context):
+        self.invalidateCamerasIndex()
+
     camera: PointerProperty(
         name="Camera",
         description="Select a Camera",
         type=bpy.types.Object,
         # poll=lambda self, obj: True if obj.type == "CAMERA" else False,
         poll=_filter_cameras,
+        update=_update_camera,
     )
 
     def setCamera(self, newCamera):
@@ -426,6 +464,8 @@ class UAS_ShotManager_Shot(ShotInterface, PropertyGroup):
             self.camera.color[3] = self["color"][3]
 
     def _update_color(self, context):
+        props = config.getAddonProps(self.parentScene)
+        edit_index.bumpShotGeneration(props, self)
         self.selectShotInUI()
 
     color: FloatVectorProperty(
@@ -27,8 +27,10 @@ from bpy.props import StringProperty, CollectionProperty, PointerProperty, BoolP
 
 from .shot import UAS_ShotManager_Shot
 from .montage_interface import SequenceInterface
+from . import edit_index
 
 from shotmanager.utils.utils import findFirstUniqueName
+from shotmanager.utils import utils_shot_manager
 
 from shotmanager.properties.output_params import UAS_ShotManager_OutputParams_Resolution
 
@@ -60,25 +62,8 @@ class UAS_ShotManager_Take(SequenceInterface, PropertyGroup):
     # For general purpose use the property self.parentScene
     def getParentScene(self):
         if self.parentScene is None:
-            # matches = [
-            #     s
-            #     for s in bpy.data.scenes
-            #     if "UAS_shot_manager_props" in s and self in s["UAS_shot_manager_props"].takes
-            # ]
-            # self.parentScene = matches[0] if len(matches) > 0 else None
-
-            for scn in bpy.data.scenes:
-                if "UAS_shot_manager_props" in scn:
-                    # print("scn.UAS_shot_manager_props:", scn.UAS_shot_manager_props)
-                    # takes = scn.UAS_shot_manager_props.getTakes()
-                    # print("scn.UAS_shot_manager_props.takes:", scn.UAS_shot_manager_props.takes)
-                    scn_props = config.getAddonProps(scn)
-                    for t in scn_props.takes:
-                        # print("t.name: ", t.name)
-                        # print("self.name: ", self.name)
-                        if self == t:
-                            #    print("Found!")
-                            self.parentScene = scn
+            # resolves the parent scene of all the takes and shots at once
+            utils_shot_manager.resolveMissingParentScenes()
 
         return self.parentScene
 
@@ -148,6 +133,7 @@ class UAS_ShotManager_Take(SequenceInterface, PropertyGroup):
         takes = props.getTakes()
         newName = findFirstUniqueName(self, value, takes)
         self["name"] = newName
+        edit_index.invalidateTakeNames(props)
 
     """ Take name is always unique in a scene
     """
@@ -182,6 +168,91 @@ class UAS_ShotManager_Take(SequenceInterface, PropertyGroup):
 
         return shotList
 
+    def to_array(self):
+        """Return a snapshot of the timing data of the shots as a NumPy structured array, with one record per shot
+        and the fields: name, start, end, duration, enabled, durationLocked, camera (name of the camera, empty if
+        the shot has no camera) and color (RGBA)
+        The numerical fields are read in bulk with foreach_get
+        """
+        import numpy as np
+
+        shots = self.shots
+        numShots = len(shots)
+
+        # strings and pointers cannot be read with foreach_get
+        # the string fields are sized from the longest value so that no name is truncated
+        names = [shot.name for shot in shots]
+        cameraNames = [shot.camera.name if shot.camera is not None else "" for shot in shots]
+        nameLength = max((len(name) for name in names), default=0)
+        cameraNameLength = max((len(name) for name in cameraNames), default=0)
+
+        table = np.zeros(
+            numShots,
+            dtype=[
+                ("name", f"U{max(1, nameLength)}"),
+                ("start", np.int32),
+                ("end", np.int32),
+                ("duration", np.int32),
+                ("enabled", np.bool_),
+                ("durationLocked", np.bool_),
+                ("camera", f"U{max(1, cameraNameLength)}"),
+                ("color", np.float32, 4),
+            ],
+        )
+        if 0 == numShots:
+            return table
+
+        for field, dtype in (
+            ("start", np.int32),
+            ("end", np.int32),
+            ("enabled", np.bool_),
+            ("durationLocked", np.bool_),
+        ):
+            values = np.empty(numShots, dtype=dtype)
+            shots.foreach_get(field, values)
+            table[field] = values
+
+        colors = np.empty(numShots * 4, dtype=np.float32)
+        shots.foreach_get("color", colors)
+        table["color"] = colors.reshape(numShots, 4)
+
+        table["duration"] = table["end"] - table["start"] + 1
+
+        table["name"] = names
+        table["camera"] = cameraNames
+
+        return table
+
+    def from_array(self, table):
+        """Set the start and end values of the shots from the specified table, typically returned by to_array()
+        and modified. It can also be a dictionary of arrays with the keys "start" and "end".
+        The values are written in bulk, the shots being neither clamped nor affected by their duration lock,
+        and the edit is updated once at the end
+        Raise a ValueError if the table length differs from the number of shots or if a start is greater than its end
+        """
+        shots = self.shots
+        starts = [int(v) for v in table["start"]]
+        ends = [int(v) for v in table["end"]]
+        if len(starts) != len(shots) or len(ends) != len(shots):
+            raise ValueError(f"Table length does not match the number of shots of take {self.name} ({len(shots)})")
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            if start > end:
+                raise ValueError(f"Start {start} of shot {shots[i].name} is greater than its end {end}")
+
+        props = config.getAddonProps(self.parentScene)
+        startChanged = list()
+        for shot, start, end in zip(shots, starts, ends):
+            # written as raw values to bypass the setters and the update functions of each property
+            startChanged.append(shot.get("start", None) != start)
+            shot["start"] = start
+            shot["end"] = end
+
+        edit_index.invalidateTake(props, props.getTakeIndex(self))
+        for shot, changed in zip(shots, startChanged):
+            if changed:
+                shot.updateClipLinkToShotStart()
+        config.gRedrawShotStack = True
+
     def getShotsUsingCamera(self, cam, ignoreDisabled=False):
         """Return the list of all the shots used by the specified camera"""
         shotList = []
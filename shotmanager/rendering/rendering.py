@@ -26,11 +26,19 @@ from stat import S_IMODE, S_IWRITE
 import json
 from tabnanny import verbose
 import time
+import shutil
+import tempfile
+from functools import partial
 
 import bpy
 
 from shotmanager.rendering.rendering_stampinfo import setStampInfoSettings, renderStampedInfoForShot
 from shotmanager.rendering import rendering_functions
+from shotmanager.rendering import rendering_ffmpeg
+from shotmanager.rendering import rendering_fingerprints
+from shotmanager.rendering import rendering_journal
+from shotmanager.rendering import rendering_scheduler
+from shotmanager.rendering import rendering_workers
 
 from shotmanager.utils import utils
 from shotmanager.utils import utils_editors_3dview
@@ -61,6 +69,11 @@ def launchRenderWithVSEComposite(
     area=None,
     override_all_viewports=False,
     fileListOnly=False,
+    numWorkers=1,
+    resume=False,
+    journal=None,
+    compositeInBackground=False,
+    fileIsSavedForWorkers=None,
 ):
     """Generate the media for the specified takes
     Return a dictionary with a list of all the created files and a list of failed ones.
@@ -72,6 +85,18 @@ def launchRenderWithVSEComposite(
         specificFrame (int): When specified, only this frame is rendered. Handles are ignored and the resulting media in an image, not a video
         fileListOnly (bool):    When set to True, no rendering nor change in the scene are done, the function just
                                 returns the list of the files to generate
+        numWorkers (int):   When higher than 1, the shots are rendered in parallel by this number of background
+                            instances of Blender opening the saved file. See rendering_workers.py
+        resume (bool):  When set to True, the rendering continues from the last unit completed in the journal of the
+                        previous rendering of the take. The existing intermediate frames are checked and kept
+        journal (RenderJournal):    Journal in which the state of the rendering is written. If None, the journal
+                                    of the take is opened in the render root folder. See rendering_journal.py
+        compositeInBackground (bool):   When set to True, the composite of each shot is made by a background instance
+                                        of Blender while the next shot is rendered. See rendering_scheduler.py
+                                        Only the composites are run in background: the 3D, Stamp Info and sound
+                                        renderings of the shots stay sequential
+        fileIsSavedForWorkers (bool):   Result of rendering_workers.isFileSavedForWorkers() called by the caller right
+                                        after saving the file, before rendering several takes. Checked here if None
     """
 
     def _deleteTempFiles(dirPath):
@@ -157,8 +182,19 @@ def launchRenderWithVSEComposite(
             shotList.append(shot)
 
     newMediaFiles = []
+    failedFiles = []
     sequenceFiles = []  # only enabled shots
 
+    # done before any change in the scene since the workers require the file to be saved
+    useWorkers = (
+        not fileListOnly
+        and specificFrame is None
+        and rendering_workers.canRenderInWorkers(numWorkers, len(shotList), fileIsSaved=fileIsSavedForWorkers)
+    )
+    # shots rendered by the workers, as tupples (shot name, duration)
+    workersShotsDurations = []
+    workersExpectedFiles = dict()
+
     rootPath = filePath if "" != filePath else os.path.dirname(bpy.data.filepath)
     # use absolute path
     rootPath = bpy.path.abspath(rootPath)
@@ -388,441 +424,756 @@ def launchRenderWithVSEComposite(
     startFrameInEdit = -1
     startShot = None
 
-    for i, shot in enumerate(shotList):
-        if 0 == i:
-            startFrameIn3D = shot.start
-            startFrameInEdit = shot.getEditStart(referenceLevel="GLOBAL_EDIT")
-            startShot = shot
-            textInfo = f"  *** Playblast Start Time: 3D: {startFrameIn3D}, Edit: {startFrameInEdit}"
-            print(f"{textInfo}")
+    if journal is None:
+        if fileListOnly:
+            journal = rendering_journal.RenderJournal()
+        else:
+            journal = rendering_journal.openJournal(rootPath, scene, take, renderMode, resume=resume)
+    # number of shots rendered by this call, used to know if the edit video has to be generated again
+    numRenderedShots = 0
 
-        # context.window_manager.UAS_shot_manager_progressbar = (i + 1) / len(shotList) * 100.0
-        # bpy.ops.wm.redraw_timer(type="DRAW_WIN_SWAP", iterations=2)
+    # the composites of the shots are made in background instances of Blender while the next shots are rendered
+    useBackgroundCompositing = (
+        compositeInBackground and generateShotVideos and specificFrame is None and not fileListOnly
+    )
+    scheduler = None
+    compositeTaskNames = []
+    if useBackgroundCompositing:
+        scheduler = rendering_scheduler.RenderScheduler()
+        compositeJobsDir = tempfile.mkdtemp(prefix="shotmanager_composite_")
+
+    # the playblast frames are streamed to ffmpeg instead of being written in image sequences
+    useFfmpegPipe = (
+        "PLAYBLAST" == renderMode
+        and getattr(renderPreset, "streamToFfmpeg", False)
+        and generateSequenceVideo
+        and not generateShotVideos
+        and specificFrame is None
+        and not fileListOnly
+    )
+    if useFfmpegPipe:
+        if props.use_project_settings:
+            keepIntermediateFiles = (
+                renderPreset.bypass_rendering_project_settings and renderPreset.keepIntermediateFiles
+            )
+        else:
+            keepIntermediateFiles = renderPreset.keepIntermediateFiles
+        ffmpegPath = rendering_ffmpeg.getFfmpegPath()
+
+        if keepIntermediateFiles:
+            _logger.info_ext("Intermediate files are kept - Playblast rendered in image sequences")
+            useFfmpegPipe = False
+        elif ffmpegPath is None:
+            _logger.warning_ext("FFmpeg executable not found - Playblast rendered in image sequences")
+            useFfmpegPipe = False
+        elif viewportArea is None or "VIEW_3D" != viewportArea.type:
+            _logger.warning_ext("Direct encoding requires a 3D viewport - Playblast rendered in image sequences")
+            useFfmpegPipe = False
+
+    if useFfmpegPipe:
+        playblastVideoPath = props.getOutputMediaPath("TK_PLAYBLAST", take, rootPath=props.renderRootPath)
+        streamedVideoPath = playblastVideoPath
+        if renderSound:
+            # the sound of the shots is added once all the frames are encoded
+            streamedVideoPath = f"{os.path.splitext(playblastVideoPath)[0]}_noSound.mp4"
+        streamedAudioFiles = []
+        streamResolution = renderResolutionFramed if preset_useStampInfo else renderResolution
+        ffmpegEncoder = None
+        frameGrabber = None
+        try:
+            ffmpegEncoder = rendering_ffmpeg.FfmpegPipeEncoder(
+                ffmpegPath, streamedVideoPath, streamResolution, projectFps
+            )
+            frameGrabber = rendering_ffmpeg.ViewportFrameGrabber(viewportArea, renderResolution)
+        except Exception as e:
+            _logger.error_ext(f"Direct encoding failed to start: {e} - Playblast rendered in image sequences")
+            if ffmpegEncoder is not None:
+                ffmpegEncoder.abort()
+                Path(streamedVideoPath).unlink(missing_ok=True)
+            useFfmpegPipe = False
+
+    streamingFailed = False
+
+    def _streamFrame(currentFrame, stampImage=None):
+        frame = rendering_ffmpeg.compositeFrame(frameGrabber.grab(context, scene), stampImage, streamResolution)
+        ffmpegEncoder.writeFrame(frame)
+
+    def _stopStreaming():
+        """Stop the encoder and release the viewport grabber. Can be called several times"""
+        frameGrabber.free()
+        ffmpegEncoder.abort()
+
+    def _onShotCompositeComplete(task, mediaPath, fingerprint):
+        """Called in the main thread when the background composite of a shot is finished"""
+        if rendering_scheduler.DONE == task.status:
+            journal.complete(task.name)
+            rendering_fingerprints.writeFingerprint(mediaPath, fingerprint)
+            _logger.info_ext(f"Shot composited in background: {Path(mediaPath).name}", col="GREEN")
+        else:
+            failedFiles.append(mediaPath)
+
+    # the fingerprints of the shots are written next to their media to know if they have to be rendered again
+    sceneAnimationDigest = None
+    if not fileListOnly and getattr(renderPreset, "fingerprintSceneAnimation", False):
+        sceneAnimationDigest = rendering_fingerprints.getSceneAnimationDigest(scene)
+
+    shotsLoopDone = False
+    try:
+        for i, shot in enumerate(shotList):
+            if 0 == i:
+                startFrameIn3D = shot.start
+                startFrameInEdit = shot.getEditStart(referenceLevel="GLOBAL_EDIT")
+                startShot = shot
+                textInfo = f"  *** Playblast Start Time: 3D: {startFrameIn3D}, Edit: {startFrameInEdit}"
+                print(f"{textInfo}")
+
+            # context.window_manager.UAS_shot_manager_progressbar = (i + 1) / len(shotList) * 100.0
+            # bpy.ops.wm.redraw_timer(type="DRAW_WIN_SWAP", iterations=2)
+
+            # newTempRenderPath = shot.getOutputMediaPath(rootPath=rootPath, insertTempFolder=True, provideName=False)
+            newTempRenderPath = shot.getOutputMediaPath(
+                "SH_INTERM_IMAGE_SEQ" + playblastSuffix, rootPath=rootPath, provideName=False
+            )
 
-        # newTempRenderPath = shot.getOutputMediaPath(rootPath=rootPath, insertTempFolder=True, provideName=False)
-        newTempRenderPath = shot.getOutputMediaPath(
-            "SH_INTERM_IMAGE_SEQ" + playblastSuffix, rootPath=rootPath, provideName=False
-        )
+            compositedMediaPath = shot.getOutputMediaPath(
+                "SH_VIDEO", rootPath=rootPath, insertSeqPrefix=True, specificFrame=specificFrame
+            )
 
-        compositedMediaPath = shot.getOutputMediaPath(
-            "SH_VIDEO", rootPath=rootPath, insertSeqPrefix=True, specificFrame=specificFrame
-        )
+            newMediaFiles.append(compositedMediaPath)
+            if shot.enabled:
+                sequenceFiles.append(compositedMediaPath)
 
-        newMediaFiles.append(compositedMediaPath)
-        if shot.enabled:
-            sequenceFiles.append(compositedMediaPath)
+            shotFingerprint = None
+            if not fileListOnly:
+                usedStampInfoSettings = stampInfoSettings
+                if stampInfoSettings is not None and not stampInfoSettings.stampInfoUsed:
+                    usedStampInfoSettings = None
+                shotFingerprint = rendering_fingerprints.getShotFingerprint(
+                    scene,
+                    props,
+                    take,
+                    shot,
+                    renderPreset,
+                    handles if renderHandles else 0,
+                    stampInfoSettings=usedStampInfoSettings,
+                    stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
+                    sceneAnimationDigest=sceneAnimationDigest,
+                    specificFrame=specificFrame,
+                )
 
-        if not rerenderExistingShotVideos:
-            if Path(compositedMediaPath).exists():
-                print(f" - File {Path(compositedMediaPath).name} already computed")
+            if not rerenderExistingShotVideos:
+                if fileListOnly:
+                    mediaIsUpToDate = Path(compositedMediaPath).exists()
+                else:
+                    mediaIsUpToDate = rendering_fingerprints.isMediaUpToDate(compositedMediaPath, shotFingerprint)
+                if mediaIsUpToDate:
+                    print(f" - File {Path(compositedMediaPath).name} already computed and unchanged")
+                    continue
+
+            if resume and generateShotVideos and journal.isDone(f"{shot.name}/composite"):
+                if Path(compositedMediaPath).exists():
+                    print(f" - File {Path(compositedMediaPath).name} already computed before the interruption")
+                    continue
+
+            if useWorkers:
+                # the shot is rendered by the workers once all the shots are listed
+                workersShotsDurations.append((shot.name, shot.getDuration()))
+                workersExpectedFiles[shot.name] = compositedMediaPath
                 continue
 
-        if not fileListOnly:
-            startShotRenderTime = time.monotonic()
-            infoStr = "\n----------------------------------------------------"
-            infoStr += f"\n\nRendering Shot:  {shot.getName_PathCompliant(withPrefix=True)} - {shot.getDuration()} fr."
-            infoStr += "\n---------------"
-            _logger.info_ext(infoStr, col="GREEN_LIGHT")
+            if not fileListOnly:
+                numRenderedShots += 1
+                startShotRenderTime = time.monotonic()
+                infoStr = "\n----------------------------------------------------"
+                infoStr += (
+                    f"\n\nRendering Shot:  {shot.getName_PathCompliant(withPrefix=True)} - {shot.getDuration()} fr."
+                )
+                infoStr += "\n---------------"
+                _logger.info_ext(infoStr, col="GREEN_LIGHT")
 
-            infoStr = "   Renderer: "
+                infoStr = "   Renderer: "
 
-            if "PLAYBLAST" == renderMode:
-                infoStr += "PLAYBLAST: "
-                if renderWithOpengl:
-                    infoStr += "OpenGl - "
-                else:
-                    infoStr += "Engine - "
-                if renderFrameByFrame:
-                    infoStr += "Frame by Frame Mode"
-                else:
-                    infoStr += "Loop Mode"
-            else:
-                if renderWithOpengl:
-                    infoStr += f"{props.renderContext.renderEngineOpengl} - "
+                if "PLAYBLAST" == renderMode:
+                    infoStr += "PLAYBLAST: "
+                    if renderWithOpengl:
+                        infoStr += "OpenGl - "
+                    else:
+                        infoStr += "Engine - "
+                    if renderFrameByFrame:
+                        infoStr += "Frame by Frame Mode"
+                    else:
+                        infoStr += "Loop Mode"
                 else:
-                    infoStr += f"{props.renderContext.renderEngine} - "
-                infoStr += f"{props.renderContext.renderHardwareMode} - {props.renderContext.renderFrameIterationMode}"
+                    if renderWithOpengl:
+                        infoStr += f"{props.renderContext.renderEngineOpengl} - "
+                    else:
+                        infoStr += f"{props.renderContext.renderEngine} - "
+                    infoStr += (
+                        f"{props.renderContext.renderHardwareMode} - {props.renderContext.renderFrameIterationMode}"
+                    )
 
-            infoStr += "\n"
+                infoStr += "\n"
 
-            _logger.info_ext(infoStr, col="GREEN")
+                _logger.info_ext(infoStr, col="GREEN")
 
-            # if False:  # debug
-            _deleteTempFiles(newTempRenderPath)
+                # when resuming, the intermediate images of the shots that were started are kept and checked
+                framesUnit = f"{shot.name}/frames"
+                stampInfoUnit = f"{shot.name}/stamp_info"
+                resumeShot = resume and (journal.isInProgress(framesUnit) or journal.isDone(framesUnit))
 
-            # wkip if bg sounds used
-            #  props.enableBGSoundForShot()
+                # if False:  # debug
+                if not resumeShot:
+                    _deleteTempFiles(newTempRenderPath)
+                rendering_fingerprints.deleteFingerprint(compositedMediaPath)
 
-            # set scene as current
-            context.window.scene = scene
+                # wkip if bg sounds used
+                #  props.enableBGSoundForShot()
 
-            # NOTE: inside setCurrentShot there is a call to updateStoryboardFramesDisplay, but not forced
-            props.setCurrentShot(shot)
-            props.updateStoryboardFramesDisplay(forceHide=True)
-            shot.showGreasePencil()
+                # set scene as current
+                context.window.scene = scene
 
-            # scene.camera = shot.camera
-            if override_all_viewports:
-                for area in context.screen.areas:
-                    utils.setCurrentCameraToViewport2(context, area)
-            else:
-                utils.setCurrentCameraToViewport2(context, viewportArea)
+                # NOTE: inside setCurrentShot there is a call to updateStoryboardFramesDisplay, but not forced
+                props.setCurrentShot(shot)
+                props.updateStoryboardFramesDisplay(forceHide=True)
+                shot.showGreasePencil()
 
-            numFramesInShot = scene.frame_end - scene.frame_start + 1
-            previousFrameRenderTime = time.monotonic()
-            currentFrameRenderTime = previousFrameRenderTime
+                # scene.camera = shot.camera
+                if override_all_viewports:
+                    for area in context.screen.areas:
+                        utils.setCurrentCameraToViewport2(context, area)
+                else:
+                    utils.setCurrentCameraToViewport2(context, viewportArea)
 
-            scene.frame_step = 1
-            if specificFrame is None:
-                if renderHandles:
-                    scene.frame_start = shot.start - handles
-                    scene.frame_end = shot.end + handles
+                numFramesInShot = scene.frame_end - scene.frame_start + 1
+                previousFrameRenderTime = time.monotonic()
+                currentFrameRenderTime = previousFrameRenderTime
+
+                scene.frame_step = 1
+                if specificFrame is None:
+                    if renderHandles:
+                        scene.frame_start = shot.start - handles
+                        scene.frame_end = shot.end + handles
+                    else:
+                        scene.frame_start = shot.start
+                        scene.frame_end = shot.end
                 else:
-                    scene.frame_start = shot.start
-                    scene.frame_end = shot.end
-            else:
-                scene.frame_start = specificFrame
-                scene.frame_end = specificFrame
+                    scene.frame_start = specificFrame
+                    scene.frame_end = specificFrame
 
-            #######################
-            # render 3D images from scene
-            #######################
+                #######################
+                # stream the images to ffmpeg
+                #######################
+
+                if useFfmpegPipe and not streamingFailed:
+                    _logger.info_ext(f"Streaming the frames of shot {shot.name} to ffmpeg", col="GREEN")
+                    try:
+                        if preset_useStampInfo:
+                            renderStampedInfoForShot(
+                                stampInfoSettings,
+                                props,
+                                take,
+                                shot,
+                                rootPath,
+                                newTempRenderPath,
+                                renderResolution,
+                                renderResolutionFramed,
+                                handles,
+                                render_handles=renderHandles,
+                                stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
+                                frameCallback=_streamFrame,
+                            )
+                        else:
+                            for currentFrame in range(scene.frame_start, scene.frame_end + 1):
+                                scene.frame_set(currentFrame)
+                                _streamFrame(currentFrame)
+                    except Exception as e:
+                        # the next shots are not streamed, the playblast is reported as failed
+                        _logger.error_ext(f"Streaming of shot {shot.name} to ffmpeg failed: {e}")
+                        streamingFailed = True
+                        _stopStreaming()
 
-            renderShotContent = True
-            if renderShotContent and not fileListOnly:
+                #######################
+                # render 3D images from scene
+                #######################
 
-                if renderFrameByFrame:
-                    for f, currentFrame in enumerate(range(scene.frame_start, scene.frame_end + 1)):
-                        # scene.frame_current = currentFrame
-                        scene.frame_set(currentFrame)
+                renderShotContent = not useFfmpegPipe and not (resumeShot and journal.isDone(framesUnit))
+                if renderShotContent and not fileListOnly:
+                    journal.start(framesUnit)
+
+                    if renderFrameByFrame:
+                        for f, currentFrame in enumerate(range(scene.frame_start, scene.frame_end + 1)):
+                            if resumeShot and rendering_journal.isImageFileComplete(
+                                shot.getOutputMediaPath(
+                                    "SH_INTERM_IMAGE_SEQ" + playblastSuffix,
+                                    rootPath=rootPath,
+                                    specificFrame=currentFrame,
+                                )
+                            ):
+                                continue
+
+                            # scene.frame_current = currentFrame
+                            scene.frame_set(currentFrame)
+
+                            # scene.render.filepath = shot.getOutputMediaPath(
+                            #     rootPath=rootPath, insertTempFolder=True, specificFrame=scene.frame_current
+                            # )
+                            scene.render.filepath = shot.getOutputMediaPath(
+                                "SH_INTERM_IMAGE_SEQ" + playblastSuffix,
+                                rootPath=rootPath,
+                                specificFrame=scene.frame_current,
+                            )
 
-                        # scene.render.filepath = shot.getOutputMediaPath(
-                        #     rootPath=rootPath, insertTempFolder=True, specificFrame=scene.frame_current
-                        # )
+                            print("      \n")
+                            textInfo = f"Frame: {currentFrame}  ( {f + 1} / {numFramesInShot} )"
+                            textInfo02 = f"Shot: {shot.name}"
+                            print("      ------------------------------------------")
+                            print("      \n" + textInfo + "  -  " + textInfo02)
+
+                            if "PLAYBLAST" == renderMode:
+                                if renderPreset.stampRenderInfo and not preset_useStampInfo:
+                                    scene.render.use_stamp_frame = False
+                                    scene.render.use_stamp_note = True
+                                    scene.render.stamp_note_text += textInfo02 + "\\n" + textInfo
+
+                            if renderWithOpengl:
+                                #     _logger.debug("ici loop playblast")
+
+                                bpy.ops.render.opengl(animation=False, write_still=True)
+
+                            else:
+                                #     _logger.debug("ici loop pas playblast")
+                                bpy.ops.render.render(animation=False, write_still=True)
+                                # bpy.ops.render.render(animation=False, write_still=True)
+
+                                currentFrameRenderTime = time.monotonic()
+                                print(
+                                    f"      \nFrame render time: {(currentFrameRenderTime - previousFrameRenderTime):0.2f} sec."
+                                )
+                                previousFrameRenderTime = currentFrameRenderTime
+
+                            # currentFrameRenderTime = time.monotonic()
+                            # print(
+                            #     f"      \nFrame render time: {(currentFrameRenderTime - previousFrameRenderTime):0.2f} sec."
+                            # )
+                            # previousFrameRenderTime = currentFrameRenderTime
+
+                    # render all in one anim pass
+                    else:
                         scene.render.filepath = shot.getOutputMediaPath(
                             "SH_INTERM_IMAGE_SEQ" + playblastSuffix,
                             rootPath=rootPath,
-                            specificFrame=scene.frame_current,
+                            provideExtension=False,
+                            genericFrame=True,
                         )
 
-                        print("      \n")
-                        textInfo = f"Frame: {currentFrame}  ( {f + 1} / {numFramesInShot} )"
-                        textInfo02 = f"Shot: {shot.name}"
-                        print("      ------------------------------------------")
-                        print("      \n" + textInfo + "  -  " + textInfo02)
-
-                        if "PLAYBLAST" == renderMode:
-                            if renderPreset.stampRenderInfo and not preset_useStampInfo:
-                                scene.render.use_stamp_frame = False
-                                scene.render.use_stamp_note = True
-                                scene.render.stamp_note_text += textInfo02 + "\\n" + textInfo
+                        #   _logger.debug("ici PAS loop")
+
+                        if "PLAYBLAST" == renderMode and not preset_useStampInfo:
+                            textInfo02 = f"Shot: {shot.name}"
+                            textInfo02 += f"  *** Playblast Start Time: 3D: {startFrameIn3D}, Edit: {startFrameInEdit}"
+                            _logger.debug(f"TextInfo02: {textInfo02}")
+                            scene.render.use_stamp_note = True
+                            scene.render.stamp_note_text = textInfo02
+
+                        # the complete frames are kept and not rendered again, the incomplete ones are removed
+                        userUseOverwrite = scene.render.use_overwrite
+                        if resumeShot:
+                            for currentFrame in range(scene.frame_start, scene.frame_end + 1):
+                                framePath = shot.getOutputMediaPath(
+                                    "SH_INTERM_IMAGE_SEQ" + playblastSuffix,
+                                    rootPath=rootPath,
+                                    specificFrame=currentFrame,
+                                )
+                                if Path(framePath).exists() and not rendering_journal.isImageFileComplete(framePath):
+                                    os.remove(framePath)
+                            scene.render.use_overwrite = False
 
                         if renderWithOpengl:
-                            #     _logger.debug("ici loop playblast")
+                            #    _logger.debug("ici PAS loop Playblast opengl")
+                            # print(f"scene.frame_start: {scene.frame_start}")
+                            # print(f"scene.frame_end: {scene.frame_end}")
 
-                            bpy.ops.render.opengl(animation=False, write_still=True)
+                            bpy.ops.render.opengl(animation=True, write_still=False)
 
+                        # _logger.debug("Render Opengl done")
                         else:
-                            #     _logger.debug("ici loop pas playblast")
-                            bpy.ops.render.render(animation=False, write_still=True)
-                            # bpy.ops.render.render(animation=False, write_still=True)
+                            # _logger.debug("ici PAS loop pas playblast")
+                            bpy.ops.render.render(animation=True, write_still=False)
 
-                            currentFrameRenderTime = time.monotonic()
-                            print(
-                                f"      \nFrame render time: {(currentFrameRenderTime - previousFrameRenderTime):0.2f} sec."
-                            )
-                            previousFrameRenderTime = currentFrameRenderTime
+                        scene.render.use_overwrite = userUseOverwrite
 
-                        # currentFrameRenderTime = time.monotonic()
-                        # print(
-                        #     f"      \nFrame render time: {(currentFrameRenderTime - previousFrameRenderTime):0.2f} sec."
-                        # )
-                        # previousFrameRenderTime = currentFrameRenderTime
+                    journal.complete(framesUnit)
 
-                # render all in one anim pass
-                else:
-                    scene.render.filepath = shot.getOutputMediaPath(
-                        "SH_INTERM_IMAGE_SEQ" + playblastSuffix,
-                        rootPath=rootPath,
-                        provideExtension=False,
-                        genericFrame=True,
-                    )
-
-                    #   _logger.debug("ici PAS loop")
-
-                    if "PLAYBLAST" == renderMode and not preset_useStampInfo:
-                        textInfo02 = f"Shot: {shot.name}"
-                        textInfo02 += f"  *** Playblast Start Time: 3D: {startFrameIn3D}, Edit: {startFrameInEdit}"
-                        _logger.debug(f"TextInfo02: {textInfo02}")
-                        scene.render.use_stamp_note = True
-                        scene.render.stamp_note_text = textInfo02
+                renderedImgSeq_resolution = renderResolution
 
-                    if renderWithOpengl:
-                        #    _logger.debug("ici PAS loop Playblast opengl")
-                        # print(f"scene.frame_start: {scene.frame_start}")
-                        # print(f"scene.frame_end: {scene.frame_end}")
+                #######################
+                # render stamped info
+                #######################
+                infoImgSeq = None
+                infoImgSeq_resolution = renderedImgSeq_resolution
+                if preset_useStampInfo:
+                    # returns "#####" if specificFrame is None, a formated frame otherwise
+                    # frameIndStr = props.getFramePadding(frame=specificFrame)
+                    # _logger.debug(f"\n - specificFrame: {specificFrame}")
+                    #    infoImgSeq = newTempRenderPath + "_tmp_StampInfo." + frameIndStr + ".png"
+                    # infoImgSeq = newTempRenderPath + shot.getOutputMediaPath(
+                    #     providePath=False, insertStampInfoPrefix=True, genericFrame=True
+                    # )
+                    infoImgSeq = newTempRenderPath + shot.getOutputMediaPath(
+                        "SH_INTERM_STAMPINFO_SEQ" + playblastSuffix, providePath=False, genericFrame=True
+                    )
+                    infoImgSeq_resolution = renderResolutionFramed
+
+                    if not useFfmpegPipe and not (resumeShot and journal.isDone(stampInfoUnit)):
+                        journal.start(stampInfoUnit)
+                        renderStampedInfoForShot(
+                            stampInfoSettings,
+                            props,
+                            take,
+                            shot,
+                            rootPath,
+                            newTempRenderPath,
+                            renderResolution,
+                            infoImgSeq_resolution,
+                            handles,
+                            render_handles=renderHandles,
+                            specificFrame=specificFrame,
+                            stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
+                            verbose=True,
+                        )
+                        journal.complete(stampInfoUnit)
 
-                        bpy.ops.render.opengl(animation=True, write_still=False)
+                # print render time
+                #######################
 
-                    # _logger.debug("Render Opengl done")
-                    else:
-                        # _logger.debug("ici PAS loop pas playblast")
-                        bpy.ops.render.render(animation=True, write_still=False)
+                deltaTime = time.monotonic() - startShotRenderTime
+                _logger.info_ext(
+                    f"Shot render time (images only): {deltaTime:0.2f} sec.",
+                    tag="RENDERTIME",
+                    display=displayRenderTimes,
+                    col=colorRenderTimes,
+                )
 
-            renderedImgSeq_resolution = renderResolution
+                allRenderTimes[shot.name + "_" + "images"] = deltaTime
 
-            #######################
-            # render stamped info
-            #######################
-            infoImgSeq = None
-            infoImgSeq_resolution = renderedImgSeq_resolution
-            if preset_useStampInfo:
-                # returns "#####" if specificFrame is None, a formated frame otherwise
-                # frameIndStr = props.getFramePadding(frame=specificFrame)
-                # _logger.debug(f"\n - specificFrame: {specificFrame}")
-                #    infoImgSeq = newTempRenderPath + "_tmp_StampInfo." + frameIndStr + ".png"
-                # infoImgSeq = newTempRenderPath + shot.getOutputMediaPath(
-                #     providePath=False, insertStampInfoPrefix=True, genericFrame=True
-                # )
-                infoImgSeq = newTempRenderPath + shot.getOutputMediaPath(
-                    "SH_INTERM_STAMPINFO_SEQ" + playblastSuffix, providePath=False, genericFrame=True
-                )
-                infoImgSeq_resolution = renderResolutionFramed
+                #######################
+                # render sound
+                #######################
 
-                renderStampedInfoForShot(
-                    stampInfoSettings,
-                    props,
-                    take,
-                    shot,
-                    rootPath,
-                    newTempRenderPath,
-                    renderResolution,
-                    infoImgSeq_resolution,
-                    handles,
-                    render_handles=renderHandles,
-                    specificFrame=specificFrame,
-                    stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
-                    verbose=True,
-                )
+                audioFilePath = None
+                if specificFrame is None and renderSound:
+                    # render sound
+                    # audioFilePath = (
+                    #     newTempRenderPath + f"{props.getRenderShotPrefix()}_{shot.getName_PathCompliant()}" + ".wav"
+                    # )
+                    audioFilePath = (
+                        newTempRenderPath
+                        # + shot.getOutputMediaPath(providePath=False, insertSeqPrefix=True, provideExtension=False)
+                        + shot.getOutputMediaPath(
+                            "SH_AUDIO", providePath=False, insertSeqPrefix=True, provideExtension=False
+                        )
+                        + ".wav"
+                    )
+                    _logger.debug(f"\n Sound for shot {shot.name}:  {audioFilePath}")
+
+                    if Path(audioFilePath).exists():
+                        print(" *** Sound file still exists... Should have been deleted ***")
+                        try:
+                            os.remove(audioFilePath)
+                            if Path(audioFilePath).exists():
+                                print(f"\n*** File locked (by system?): {audioFilePath}")
+                        except Exception:
+                            _logger.exception(f"\n*** File locked (by system?): {audioFilePath}")
+                            print(f"\n*** Exception : File locked (by system?): {audioFilePath}")
+                            audioFilePath = (
+                                str(Path(audioFilePath).parent)
+                                + "/"
+                                + str(Path(audioFilePath).stem)
+                                + "1"
+                                # + "."
+                                + str(Path(audioFilePath).suffix)
+                            )
 
-            # print render time
-            #######################
+                    #     import os.path
+                    # os.path.exists(file_path)
 
-            deltaTime = time.monotonic() - startShotRenderTime
-            _logger.info_ext(
-                f"Shot render time (images only): {deltaTime:0.2f} sec.",
-                tag="RENDERTIME",
-                display=displayRenderTimes,
-                col=colorRenderTimes,
-            )
+                    # crash ici lorsqu'on est en rendu frame per frame
 
-            allRenderTimes[shot.name + "_" + "images"] = deltaTime
+                    # wkip pour que ca marche, mettre les render settings en mode video ??
+                    # scene.render.filepath = "//"
+                    # scene.frame_start = 0
+                    # scene.frame_end = 50
+                    # bpy.ops.render.opengl(animation=True, write_still=False)
+                    # https://blenderartists.org/t/scripterror-mixdown-operstor/548056/4
+                    bpy.ops.sound.mixdown(filepath=audioFilePath, relative_path=False, container="WAV", codec="PCM")
+                    # bpy.ops.sound.mixdown(filepath=audioFilePath, relative_path=False, container="MP3", codec="MP3")
 
-            #######################
-            # render sound
-            #######################
+                # renderedImgSeq = newTempRenderPath + shot.getOutputMediaPath(providePath=False, genericFrame=True)
 
-            audioFilePath = None
-            if specificFrame is None and renderSound:
-                # render sound
-                # audioFilePath = (
-                #     newTempRenderPath + f"{props.getRenderShotPrefix()}_{shot.getName_PathCompliant()}" + ".wav"
-                # )
-                audioFilePath = (
-                    newTempRenderPath
-                    # + shot.getOutputMediaPath(providePath=False, insertSeqPrefix=True, provideExtension=False)
-                    + shot.getOutputMediaPath(
-                        "SH_AUDIO", providePath=False, insertSeqPrefix=True, provideExtension=False
-                    )
-                    + ".wav"
+                # wkip \\ pb
+                renderedImgSeq = newTempRenderPath + shot.getOutputMediaPath(
+                    "SH_IMAGE_SEQ" + playblastSuffix, providePath=False, genericFrame=True
                 )
-                _logger.debug(f"\n Sound for shot {shot.name}:  {audioFilePath}")
-
-                if Path(audioFilePath).exists():
-                    print(" *** Sound file still exists... Should have been deleted ***")
-                    try:
-                        os.remove(audioFilePath)
-                        if Path(audioFilePath).exists():
-                            print(f"\n*** File locked (by system?): {audioFilePath}")
-                    except Exception:
-                        _logger.exception(f"\n*** File locked (by system?): {audioFilePath}")
-                        print(f"\n*** Exception : File locked (by system?): {audioFilePath}")
-                        audioFilePath = (
-                            str(Path(audioFilePath).parent)
-                            + "/"
-                            + str(Path(audioFilePath).stem)
-                            + "1"
-                            # + "."
-                            + str(Path(audioFilePath).suffix)
-                        )
 
-                #     import os.path
-                # os.path.exists(file_path)
+                if generateShotVideos:
 
-                # crash ici lorsqu'on est en rendu frame per frame
+                    #######################
+                    # Generate shot video
+                    #######################
 
-                # wkip pour que ca marche, mettre les render settings en mode video ??
-                # scene.render.filepath = "//"
-                # scene.frame_start = 0
-                # scene.frame_end = 50
-                # bpy.ops.render.opengl(animation=True, write_still=False)
-                # https://blenderartists.org/t/scripterror-mixdown-operstor/548056/4
-                bpy.ops.sound.mixdown(filepath=audioFilePath, relative_path=False, container="WAV", codec="PCM")
-                # bpy.ops.sound.mixdown(filepath=audioFilePath, relative_path=False, container="MP3", codec="MP3")
+                    # use vse_render to store all the elements to composite
 
-            # renderedImgSeq = newTempRenderPath + shot.getOutputMediaPath(providePath=False, genericFrame=True)
+                    vse_render.clearMedia()
+                    if specificFrame is None:
+                        vse_render.inputBGMediaPath = renderedImgSeq
+                    else:
+                        # vse_render.inputBGMediaPath = newTempRenderPath + shot.getOutputMediaPath(
+                        #     providePath=False, specificFrame=specificFrame
+                        # )
+                        vse_render.inputBGMediaPath = newTempRenderPath + shot.getOutputMediaPath(
+                            "SH_IMAGE_SEQ" + playblastSuffix, providePath=False, specificFrame=specificFrame
+                        )
 
-            # wkip \\ pb
-            renderedImgSeq = newTempRenderPath + shot.getOutputMediaPath(
-                "SH_IMAGE_SEQ" + playblastSuffix, providePath=False, genericFrame=True
-            )
+                    _logger.debug(f"\n - BGMediaPath: {vse_render.inputBGMediaPath}")
+                    vse_render.inputBGResolution = renderedImgSeq_resolution
+                    vse_render.outputResolution = vse_render.inputBGResolution
 
-            if generateShotVideos:
+                    if preset_useStampInfo:
+                        _logger.debug(f"\n - specificFrame: {specificFrame}")
+                        vse_render.inputOverMediaPath = infoImgSeq
+                        _logger.debug(f"\n - OverMediaPath: {vse_render.inputOverMediaPath}")
+                        vse_render.inputOverResolution = infoImgSeq_resolution
+                        vse_render.outputResolution = vse_render.inputOverResolution
 
-                #######################
-                # Generate shot video
-                #######################
+                    if specificFrame is None and renderSound:
+                        vse_render.inputAudioMediaPath = audioFilePath
 
-                # use vse_render to store all the elements to composite
+                    padding = (
+                        props.project_img_name_digits_padding
+                        if props.use_project_settings
+                        else prefs.img_name_digits_padding
+                    )
 
-                vse_render.clearMedia()
-                if specificFrame is None:
-                    vse_render.inputBGMediaPath = renderedImgSeq
-                else:
-                    # vse_render.inputBGMediaPath = newTempRenderPath + shot.getOutputMediaPath(
-                    #     providePath=False, specificFrame=specificFrame
-                    # )
-                    vse_render.inputBGMediaPath = newTempRenderPath + shot.getOutputMediaPath(
-                        "SH_IMAGE_SEQ" + playblastSuffix, providePath=False, specificFrame=specificFrame
+                    # Warning: this defines the start index of the first image (usually 0 or 1)
+                    # This is different from props.editStartFrame which is the offset of the scene take relatively to a main edit
+                    #   compositedMedia_PathOnly = shot.getOutputMediaPath(rootPath=rootPath, provideName=False)
+                    compositedImgSeqPath = shot.getOutputMediaPath(
+                        "SH_IMAGE_SEQ" + playblastSuffix, rootPath=rootPath, genericFrame=True
                     )
+                    compositedMedia_NameOnly = shot.getName_PathCompliant()
+
+                    if verbose or config.devDebug or True:
+                        print(f"{'--    renderedImgSeq: ': <30}{renderedImgSeq}")
+                        print(f"{'--    newTempRenderPath: ': <30}{newTempRenderPath}")
+                        print(f"{'--    compositedMediaPath: ': <30}{compositedMediaPath}")
+                        print(f"{'--    compositedImgSeqPath: ': <30}{compositedImgSeqPath}")
+
+                    deleteTempFiles = True
+                    if props.use_project_settings:
+                        if renderPreset.bypass_rendering_project_settings and renderPreset.keepIntermediateFiles:
+                            deleteTempFiles = False
+                    else:
+                        deleteTempFiles = not renderPreset.keepIntermediateFiles
 
-                _logger.debug(f"\n - BGMediaPath: {vse_render.inputBGMediaPath}")
-                vse_render.inputBGResolution = renderedImgSeq_resolution
-                vse_render.outputResolution = vse_render.inputBGResolution
+                    if deleteTempFiles and config.devDebug and config.devDebug_keepVSEContent:
+                        deleteTempFiles = False
 
-                if preset_useStampInfo:
-                    _logger.debug(f"\n - specificFrame: {specificFrame}")
-                    vse_render.inputOverMediaPath = infoImgSeq
-                    _logger.debug(f"\n - OverMediaPath: {vse_render.inputOverMediaPath}")
-                    vse_render.inputOverResolution = infoImgSeq_resolution
-                    vse_render.outputResolution = vse_render.inputOverResolution
+                    journal.start(f"{shot.name}/composite")
+                    if specificFrame is None:
+                        video_frame_start = (
+                            props.project_output_first_frame if props.use_project_settings else prefs.output_first_frame
+                        )
+                        video_frame_end = shot.end - shot.start + video_frame_start
+                        if renderHandles:
+                            video_frame_end += 2 * handles
+
+                    if useBackgroundCompositing:
+                        compositeJob = {
+                            "binary_path": bpy.app.binary_path,
+                            "bg_media_path": vse_render.inputBGMediaPath,
+                            "bg_resolution": list(renderedImgSeq_resolution),
+                            "over_media_path": infoImgSeq if preset_useStampInfo else None,
+                            "over_resolution": list(infoImgSeq_resolution),
+                            "audio_media_path": audioFilePath,
+                            "fps": projectFps,
+                            "frame_start": video_frame_start,
+                            "frame_end": video_frame_end,
+                            "output_filepath": compositedMediaPath,
+                            "output_filename": compositedMedia_NameOnly,
+                            "composited_img_seq_path": compositedImgSeqPath,
+                            "output_file_prefix": props.getRenderShotPrefix(),
+                            "postfix_scene_name": shot.getName_PathCompliant(),
+                            "output_resolution": list(infoImgSeq_resolution),
+                            "output_media_mode": renderPreset.outputMediaMode,
+                            "import_at_frame": video_frame_start,
+                            "frame_padding": padding,
+                            "temp_dir_to_delete": newTempRenderPath if deleteTempFiles else None,
+                        }
+                        jobFile = os.path.join(compositeJobsDir, f"composite_{shot.getName_PathCompliant()}.json")
+
+                        # the images and the sound of the shot are done, its composite can start
+                        imagesTaskName = f"{shot.name}/images"
+                        scheduler.addTask(imagesTaskName)
+                        scheduler.setTaskDone(imagesTaskName)
+                        compositeTaskNames.append(f"{shot.name}/composite")
+                        scheduler.addTask(
+                            f"{shot.name}/composite",
+                            function=partial(rendering_workers.compositeShotInWorker, compositeJob, jobFile),
+                            dependencies=[imagesTaskName],
+                            onComplete=partial(
+                                _onShotCompositeComplete, mediaPath=compositedMediaPath, fingerprint=shotFingerprint
+                            ),
+                        )
 
-                if specificFrame is None and renderSound:
-                    vse_render.inputAudioMediaPath = audioFilePath
+                    elif specificFrame is None:
+                        vse_render.compositeVideoInVSE(
+                            projectFps,
+                            video_frame_start,
+                            video_frame_end,
+                            compositedMediaPath,
+                            compositedMedia_NameOnly,
+                            compositedImgSeqPath=compositedImgSeqPath,
+                            output_file_prefix=props.getRenderShotPrefix(),
+                            postfixSceneName=shot.getName_PathCompliant(),
+                            output_resolution=infoImgSeq_resolution,
+                            output_media_mode=renderPreset.outputMediaMode,
+                            importAtFrame=video_frame_start,
+                            frame_padding=padding,
+                        )
+                    else:
+                        vse_render.compositeVideoInVSE(
+                            projectFps,
+                            specificFrame,
+                            specificFrame,
+                            compositedMediaPath,
+                            compositedMedia_NameOnly,
+                            output_file_prefix=props.getRenderShotPrefix(),
+                            postfixSceneName=shot.getName_PathCompliant(),
+                            output_resolution=infoImgSeq_resolution,
+                            output_media_mode=renderPreset.outputMediaMode,
+                            importAtFrame=0,
+                            frame_padding=padding,
+                        )
 
-                padding = (
-                    props.project_img_name_digits_padding
-                    if props.use_project_settings
-                    else prefs.img_name_digits_padding
-                )
+                    # bpy.ops.render.render("INVOKE_DEFAULT", animation=False, write_still=True)
+                    # bpy.ops.render.render('INVOKE_DEFAULT', animation = True)
+                    # bpy.ops.render.opengl ( animation = True )
 
-                # Warning: this defines the start index of the first image (usually 0 or 1)
-                # This is different from props.editStartFrame which is the offset of the scene take relatively to a main edit
-                #   compositedMedia_PathOnly = shot.getOutputMediaPath(rootPath=rootPath, provideName=False)
-                compositedImgSeqPath = shot.getOutputMediaPath(
-                    "SH_IMAGE_SEQ" + playblastSuffix, rootPath=rootPath, genericFrame=True
-                )
-                compositedMedia_NameOnly = shot.getName_PathCompliant()
+                    # deleteTempFiles = not config.devDebug_keepVSEContent and not renderPreset.keepIntermediateFiles
+                    if not useBackgroundCompositing:
+                        journal.complete(f"{shot.name}/composite")
+                        if deleteTempFiles:
+                            _deleteTempFiles(newTempRenderPath)
 
-                if verbose or config.devDebug or True:
-                    print(f"{'--    renderedImgSeq: ': <30}{renderedImgSeq}")
-                    print(f"{'--    newTempRenderPath: ': <30}{newTempRenderPath}")
-                    print(f"{'--    compositedMediaPath: ': <30}{compositedMediaPath}")
-                    print(f"{'--    compositedImgSeqPath: ': <30}{compositedImgSeqPath}")
+                elif useFfmpegPipe:
+                    if audioFilePath is not None:
+                        streamedAudioFiles.append(audioFilePath)
 
-                if specificFrame is None:
-                    video_frame_start = (
-                        props.project_output_first_frame if props.use_project_settings else prefs.output_first_frame
-                    )
-                    video_frame_end = shot.end - shot.start + video_frame_start
-                    if renderHandles:
-                        video_frame_end += 2 * handles
-
-                    vse_render.compositeVideoInVSE(
-                        projectFps,
-                        video_frame_start,
-                        video_frame_end,
-                        compositedMediaPath,
-                        compositedMedia_NameOnly,
-                        compositedImgSeqPath=compositedImgSeqPath,
-                        output_file_prefix=props.getRenderShotPrefix(),
-                        postfixSceneName=shot.getName_PathCompliant(),
-                        output_resolution=infoImgSeq_resolution,
-                        output_media_mode=renderPreset.outputMediaMode,
-                        importAtFrame=video_frame_start,
-                        frame_padding=padding,
-                    )
                 else:
-                    vse_render.compositeVideoInVSE(
-                        projectFps,
-                        specificFrame,
-                        specificFrame,
-                        compositedMediaPath,
-                        compositedMedia_NameOnly,
-                        output_file_prefix=props.getRenderShotPrefix(),
-                        postfixSceneName=shot.getName_PathCompliant(),
-                        output_resolution=infoImgSeq_resolution,
-                        output_media_mode=renderPreset.outputMediaMode,
-                        importAtFrame=0,
-                        frame_padding=padding,
-                    )
+                    #######################
+                    # Collect rendered image sequences
+                    #######################
+                    videoAndSound = dict()
 
-                # bpy.ops.render.render("INVOKE_DEFAULT", animation=False, write_still=True)
-                # bpy.ops.render.render('INVOKE_DEFAULT', animation = True)
-                # bpy.ops.render.opengl ( animation = True )
+                    videoAndSound["bg"] = renderedImgSeq
+                    videoAndSound["bg_resolution"] = renderedImgSeq_resolution
 
-                deleteTempFiles = True
-                if props.use_project_settings:
-                    if renderPreset.bypass_rendering_project_settings and renderPreset.keepIntermediateFiles:
-                        deleteTempFiles = False
-                else:
-                    deleteTempFiles = not renderPreset.keepIntermediateFiles
+                    print(f"*** setting output_resolution: {infoImgSeq_resolution}")
+                    videoAndSound["output_resolution"] = infoImgSeq_resolution
 
-                if deleteTempFiles and config.devDebug and config.devDebug_keepVSEContent:
-                    deleteTempFiles = False
+                    videoAndSound["fg_sequence_resolution"] = infoImgSeq_resolution
+                    if preset_useStampInfo:
+                        videoAndSound["fg_sequence"] = infoImgSeq
+                    videoAndSound["sound"] = audioFilePath
 
-                # deleteTempFiles = not config.devDebug_keepVSEContent and not renderPreset.keepIntermediateFiles
-                if deleteTempFiles:
-                    _deleteTempFiles(newTempRenderPath)
+                    renderedShotSequencesArr.append(videoAndSound)
 
-            else:
-                #######################
-                # Collect rendered image sequences
-                #######################
-                videoAndSound = dict()
+                if len(renderedShotSequencesArr):
+                    _logger.debug_ext("\n** renderedShotSequencesArr:")
+                    for item in renderedShotSequencesArr:
+                        _logger.debug_ext(f"\n    {item}")
 
-                videoAndSound["bg"] = renderedImgSeq
-                videoAndSound["bg_resolution"] = renderedImgSeq_resolution
+                # print render time
+                #######################
 
-                print(f"*** setting output_resolution: {infoImgSeq_resolution}")
-                videoAndSound["output_resolution"] = infoImgSeq_resolution
+                deltaTime = time.monotonic() - startShotRenderTime
+                _logger.info_ext(
+                    f"Shot render time (incl. video): {deltaTime:0.2f} sec.",
+                    tag="RENDERTIME",
+                    display=displayRenderTimes,
+                    col=colorRenderTimes,
+                )
 
-                videoAndSound["fg_sequence_resolution"] = infoImgSeq_resolution
-                if preset_useStampInfo:
-                    videoAndSound["fg_sequence"] = infoImgSeq
-                videoAndSound["sound"] = audioFilePath
+                allRenderTimes[shot.name + "_" + "full"] = deltaTime
 
-                renderedShotSequencesArr.append(videoAndSound)
+                # the fingerprint of a shot composited in background is written at the end of its composite
+                if generateShotVideos and not useBackgroundCompositing:
+                    rendering_fingerprints.writeFingerprint(compositedMediaPath, shotFingerprint)
 
-            if len(renderedShotSequencesArr):
-                _logger.debug_ext("\n** renderedShotSequencesArr:")
-                for item in renderedShotSequencesArr:
-                    _logger.debug_ext(f"\n    {item}")
+                _logger.info_ext("\n----------------------------------------------------", col="GREEN")
 
-            # print render time
-            #######################
+        #######################
+        # wait for the composites made in background
+        #######################
 
-            deltaTime = time.monotonic() - startShotRenderTime
+        if scheduler is not None:
+            startWaitTime = time.monotonic()
+            scheduler.wait(compositeTaskNames)
             _logger.info_ext(
-                f"Shot render time (incl. video): {deltaTime:0.2f} sec.",
+                f"Wait for the background composites: {time.monotonic() - startWaitTime:0.2f} sec.",
                 tag="RENDERTIME",
                 display=displayRenderTimes,
                 col=colorRenderTimes,
             )
 
-            allRenderTimes[shot.name + "_" + "full"] = deltaTime
+            newMediaFiles = [file for file in newMediaFiles if file not in failedFiles]
+            sequenceFiles = [file for file in sequenceFiles if file not in failedFiles]
 
-            _logger.info_ext("\n----------------------------------------------------", col="GREEN")
+        shotsLoopDone = True
+    finally:
+        # on errors the playblast stream is stopped and its partial video deleted
+        if useFfmpegPipe and not shotsLoopDone:
+            _stopStreaming()
+            Path(streamedVideoPath).unlink(missing_ok=True)
+
+        # on errors the composites not started yet are cancelled, the running ones are waited for
+        if scheduler is not None:
+            scheduler.shutdown(cancelPendingTasks=not shotsLoopDone)
+            if not config.devDebug:
+                shutil.rmtree(compositeJobsDir, ignore_errors=True)
+
+    #######################
+    # render shots in the workers
+    #######################
+
+    if len(workersShotsDurations):
+        workersFilesDict = rendering_workers.renderShotsInWorkers(
+            scene,
+            renderMode,
+            takeIndex,
+            workersShotsDurations,
+            workersExpectedFiles,
+            numWorkers,
+            rootPath,
+            render_handles=render_handles,
+            renderSound=renderSound,
+            generateShotVideos=generateShotVideos,
+            stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
+        )
+
+        failedFiles.extend(workersFilesDict["failed_files"])
+        newMediaFiles = [file for file in newMediaFiles if file not in failedFiles]
+        sequenceFiles = [file for file in sequenceFiles if file not in failedFiles]
+
+        numRenderedShots += len(workersShotsDurations)
+        for shotName, mediaPath in workersExpectedFiles.items():
+            if generateShotVideos and mediaPath not in failedFiles:
+                journal.complete(f"{shotName}/composite")
+
+        # image sequences are collected in the order of the shots
+        for shot in shotList:
+            if shot.name in workersFilesDict["shot_sequences"]:
+                renderedShotSequencesArr.append(workersFilesDict["shot_sequences"][shot.name])
 
     #######################
     # render sequence video
@@ -862,11 +1213,19 @@ def launchRenderWithVSEComposite(
 
             _logger.info_ext(f"  Rendered sequence from shot videos: {sequenceOutputFullPath}")
 
-            if not fileListOnly:
+            editVideoIsDone = (
+                resume
+                and 0 == numRenderedShots
+                and journal.isDone("edit_video")
+                and Path(sequenceOutputFullPath).exists()
+            )
+            if not fileListOnly and not editVideoIsDone:
                 # print(f"sequenceFiles: {sequenceFiles}")
+                journal.start("edit_video")
                 vse_render.buildSequenceVideoFromMedia(
                     sequenceOutputFullPath, handles, projectFps, mediaFiles=sequenceFiles
                 )
+                journal.complete("edit_video")
 
                 # currentTakeRenderTime = time.monotonic()
                 # print(f"      \nTake render time: {(currentTakeRenderTime - previousTakeRenderTime):0.2f} sec.")
@@ -893,7 +1252,32 @@ def launchRenderWithVSEComposite(
             # )
             print(f"  Rendered sequence from shot sequences: {sequenceOutputFullPath}")
 
-            if len(renderedShotSequencesArr):
+            if useFfmpegPipe:
+                videoIsEncoded = False
+                try:
+                    if not streamingFailed:
+                        frameGrabber.free()
+                        videoIsEncoded = ffmpegEncoder.close()
+                        if videoIsEncoded and len(streamedAudioFiles):
+                            videoIsEncoded = rendering_ffmpeg.muxAudio(
+                                ffmpegPath, streamedVideoPath, streamedAudioFiles, sequenceOutputFullPath
+                            )
+                except Exception as e:
+                    _logger.error_ext(f"Encoding of the playblast failed: {e}")
+                    videoIsEncoded = False
+                finally:
+                    _stopStreaming()
+                    # partial video, or video without sound left by a failed muxing
+                    if not videoIsEncoded or streamedVideoPath != sequenceOutputFullPath:
+                        Path(streamedVideoPath).unlink(missing_ok=True)
+                if not videoIsEncoded:
+                    failedFiles.append(sequenceOutputFullPath)
+
+                # only the sound files of the shots have been written
+                for audioFilePath in streamedAudioFiles:
+                    _deleteTempFiles(str(Path(audioFilePath).parent))
+
+            elif len(renderedShotSequencesArr):
                 vse_render.buildSequenceVideoFromMedia(
                     sequenceOutputFullPath, handles, projectFps, mediaDictArr=renderedShotSequencesArr
                 )
@@ -940,11 +1324,12 @@ def launchRenderWithVSEComposite(
     # startFrameIn3D = -1
     # startFrameInEdit = -1
 
-    failedFiles = []
     filesDict = {
         "rendered_files": newMediaFiles,
         "failed_files": failedFiles,
         "sequence_video_file": sequenceOutputFullPath,
+        # rendered image sequences of the shots when no shot video is generated
+        "shot_sequences": renderedShotSequencesArr,
     }
 
     if "PLAYBLAST" == renderMode:
@@ -1174,7 +1559,16 @@ def launchRender(context, renderMode, rootPath, area=None):
             if -1 != currentTakeInd:
                 takesToRender = [currentTakeInd]
 
+        # checked once since the rendering of a take modifies the file, the workers of the next takes then still
+        # open the file saved above
+        fileIsSavedForWorkers = None
+        if 1 < preset.numRenderWorkers:
+            fileIsSavedForWorkers = rendering_workers.isFileSavedForWorkers()
+
         for takeInd in takesToRender:
+            journal = rendering_journal.openJournal(
+                props.renderRootPath, scene, props.takes[takeInd], preset.renderMode, resume=preset.resumeRendering
+            )
             renderedFilesDict = launchRenderWithVSEComposite(
                 context,
                 preset,
@@ -1185,6 +1579,11 @@ def launchRender(context, renderMode, rootPath, area=None):
                 generateSequenceVideo=preset.generateEditVideo,
                 renderAlsoDisabled=preset.renderAlsoDisabled,
                 area=area,
+                numWorkers=preset.numRenderWorkers,
+                resume=preset.resumeRendering,
+                journal=journal,
+                compositeInBackground=preset.compositeInBackground,
+                fileIsSavedForWorkers=fileIsSavedForWorkers,
             )
 
             if preset.renderOtioFile:
@@ -1192,7 +1591,10 @@ def launchRender(context, renderMode, rootPath, area=None):
 
                 take = props.takes[takeInd]
                 if "VIDEO" in props.renderSettingsAll.outputMediaMode:
-                    _generateEditFiles()
+                    if not (preset.resumeRendering and journal.isDone("edit_files")):
+                        journal.start("edit_files")
+                        _generateEditFiles()
+                        journal.complete("edit_files")
 
                 # renderedOtioFile = exportShotManagerEditToOtio(
                 #     scene,
@@ -0,0 +1,248 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Direct encoding of the playblasts with ffmpeg
+
+The frames of the playblast are drawn offscreen from the viewport used for the rendering, composited in memory
+with the Stamp Info images and streamed as raw RGBA pixels to a single ffmpeg process through a pipe.
+No intermediate image is written. The sound of the shots is added at the end by a second ffmpeg pass that
+copies the video stream.
+
+The ffmpeg executable is the one specified in the add-on preferences, or the one found in the PATH.
+"""
+
+import os
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+
+import bpy
+
+from shotmanager.config import config
+from shotmanager.config import sm_logging
+
+_logger = sm_logging.getLogger(__name__)
+
+
+def getFfmpegPath():
+    """Return the path of the ffmpeg executable, None if not found"""
+    prefs = config.getAddonPrefs()
+    if "" != prefs.ffmpegFilePath:
+        ffmpegPath = bpy.path.abspath(prefs.ffmpegFilePath)
+        if Path(ffmpegPath).is_file():
+            return ffmpegPath
+        _logger.warning_ext(f"FFmpeg executable specified in the preferences not found: {ffmpegPath}")
+    return shutil.which("ffmpeg")
+
+
+class ViewportFrameGrabber:
+    """Draw the scene from its camera with the settings of the specified viewport into an offscreen buffer"""
+
+    def __init__(self, area, resolution):
+        import gpu
+
+        self.space = area.spaces.active
+        self.region = next(region for region in area.regions if "WINDOW" == region.type)
+        self.resolution = resolution
+        self.offscreen = gpu.types.GPUOffScreen(resolution[0], resolution[1])
+
+    def grab(self, context, scene):
+        """Return the image of the current frame as an array of shape (height, width, 4), top row first"""
+        import numpy as np
+
+        width, height = self.resolution
+        camera = scene.camera
+        viewMatrix = camera.matrix_world.inverted()
+        projectionMatrix = camera.calc_matrix_camera(
+            context.evaluated_depsgraph_get(),
+            x=width,
+            y=height,
+            scale_x=scene.render.pixel_aspect_x,
+            scale_y=scene.render.pixel_aspect_y,
+        )
+        self.offscreen.draw_view3d(
+            scene,
+            context.view_layer,
+            self.space,
+            self.region,
+            viewMatrix,
+            projectionMatrix,
+            do_color_management=True,
+        )
+
+        pixels = np.asarray(self.offscreen.texture_color.read())
+        if np.uint8 != pixels.dtype:
+            pixels = (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+        return np.flipud(pixels.reshape(height, width, 4))
+
+    def free(self):
+        """Release the offscreen buffer. Can be called several times"""
+        if self.offscreen is not None:
+            self.offscreen.free()
+            self.offscreen = None
+
+
+def compositeFrame(image, stampImage, resolution):
+    """Return the specified image centered in a frame of the specified resolution, with the Stamp Info image
+    alpha-composited over it
+    Args:
+        image: array of shape (height, width, 4)
+        stampImage: PIL image of the Stamp Info frame, None if not used
+        resolution: [width, height] of the final frame
+    """
+    import numpy as np
+
+    width, height = resolution
+    imageHeight, imageWidth = image.shape[0:2]
+    if [imageWidth, imageHeight] == [width, height]:
+        frame = image.copy()
+    else:
+        # the image is cropped if it is larger than the frame
+        frame = np.zeros((height, width, 4), dtype=np.uint8)
+        offsetX = (width - imageWidth) // 2
+        offsetY = (height - imageHeight) // 2
+        frameX, imageX = max(0, offsetX), max(0, -offsetX)
+        frameY, imageY = max(0, offsetY), max(0, -offsetY)
+        copyW = min(imageWidth - imageX, width - frameX)
+        copyH = min(imageHeight - imageY, height - frameY)
+        copiedImage = image[imageY : imageY + copyH, imageX : imageX + copyW]
+        frame[frameY : frameY + copyH, frameX : frameX + copyW] = copiedImage
+
+    if stampImage is not None:
+        stamp = np.asarray(stampImage.convert("RGBA"), dtype=np.uint16)
+        if stamp.shape[0:2] != frame.shape[0:2]:
+            _logger.error_ext(f"Stamp Info image resolution {stamp.shape[1]} x {stamp.shape[0]} doesn't match")
+        else:
+            alpha = stamp[:, :, 3:4]
+            frameRGB = frame[:, :, 0:3].astype(np.uint16)
+            frame[:, :, 0:3] = ((stamp[:, :, 0:3] * alpha + frameRGB * (255 - alpha) + 127) // 255).astype(np.uint8)
+
+    frame[:, :, 3] = 255
+    return frame
+
+
+class FfmpegPipeEncoder:
+    """ffmpeg process encoding the raw RGBA frames written in its standard input into a MP4 video"""
+
+    def __init__(self, ffmpegPath, outputFilePath, resolution, fps):
+        self.ffmpegPath = ffmpegPath
+        self.outputFilePath = outputFilePath
+        self.resolution = resolution
+        self.numFrames = 0
+
+        Path(outputFilePath).parent.mkdir(parents=True, exist_ok=True)
+        command = [
+            ffmpegPath,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            f"{resolution[0]}x{resolution[1]}",
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "veryfast",
+            "-crf",
+            "18",
+            "-pix_fmt",
+            "yuv420p",
+            outputFilePath,
+        ]
+        # the errors are written in a file since a pipe could fill up and block ffmpeg
+        self.logFile = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self.logFile)
+
+    def writeFrame(self, frame):
+        """Write a frame given as an array of shape (height, width, 4) and of type uint8"""
+        try:
+            self.process.stdin.write(frame.tobytes())
+        except (BrokenPipeError, OSError):
+            self.process.wait()
+            raise RuntimeError(f"FFmpeg encoding failed: {self._getLog()}")
+        self.numFrames += 1
+
+    def close(self):
+        """Wait for the end of the encoding. Return True if the video has been generated"""
+        if self.process.stdin is not None and not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+        returnCode = self.process.wait()
+        if 0 != returnCode:
+            _logger.error_ext(f"FFmpeg encoding failed: {self._getLog()}")
+        self.logFile.close()
+        return 0 == returnCode
+
+    def abort(self):
+        """Stop the encoding without waiting for the remaining frames. Does nothing if the encoding is finished"""
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        if self.process.stdin is not None and not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+        if not self.logFile.closed:
+            self.logFile.close()
+
+    def _getLog(self):
+        if self.logFile.closed:
+            return ""
+        self.logFile.seek(0)
+        return self.logFile.read().decode("utf-8", errors="replace")
+
+
+def muxAudio(ffmpegPath, videoFilePath, audioFilePaths, outputFilePath):
+    """Add the specified audio files, concatenated, to the video. The video stream is copied, not encoded again.
+    Return True if the video has been generated
+    """
+    command = [ffmpegPath, "-y", "-loglevel", "error", "-i", videoFilePath]
+    for audioFilePath in audioFilePaths:
+        command += ["-i", audioFilePath]
+    audioInputs = "".join(f"[{ind + 1}:a]" for ind in range(len(audioFilePaths)))
+    command += [
+        "-filter_complex",
+        f"{audioInputs}concat=n={len(audioFilePaths)}:v=0:a=1[audio]",
+        "-map",
+        "0:v",
+        "-map",
+        "[audio]",
+        "-c:v",
+        "copy",
+        "-c:a",
+        "aac",
+        outputFilePath,
+    ]
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if 0 != result.returncode:
+        _logger.error_ext(f"FFmpeg sound muxing failed: {result.stderr.decode('utf-8', errors='replace')}")
+        Path(outputFilePath).unlink(missing_ok=True)
+        return False
+    os.remove(videoFilePath)
+    return True
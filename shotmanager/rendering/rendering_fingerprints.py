@@ -0,0 +1,314 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Fingerprints of the rendered shots
+
+A fingerprint is a hash of what defines the rendered media of a shot: frame range and handles, notes of the shot
+and of its take, camera settings and animation, render preset and context, Stamp Info settings and, optionally,
+the animation of all the objects of the scene. It is written in a file next to the shot media after the rendering so that a shot whose
+fingerprint is unchanged doesn't have to be rendered again.
+
+Note: The content of the scene seen by the camera (geometry, materials...) is not part of the fingerprint.
+"""
+
+import json
+from pathlib import Path
+
+import bpy
+
+from shotmanager.config import sm_logging
+from shotmanager.rendering.rendering_fingerprints_values import getDigest, getStampInfoSettingsValues
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# to increment when the content of the fingerprints changes so that the previous ones are not valid anymore
+FINGERPRINT_VERSION = 3
+FINGERPRINT_FILE_SUFFIX = ".fingerprint.json"
+
+_SIMPLE_PROPERTY_TYPES = ("BOOLEAN", "INT", "FLOAT", "STRING", "ENUM")
+
+# transformation channels of the objects, used instead of their matrices that depend on the current frame
+_TRANSFORM_CHANNELS = (
+    "location",
+    "rotation_mode",
+    "rotation_euler",
+    "rotation_quaternion",
+    "rotation_axis_angle",
+    "scale",
+    "delta_location",
+    "delta_rotation_euler",
+    "delta_rotation_quaternion",
+    "delta_scale",
+)
+
+# properties of the render presets that have no effect on the rendered media of a shot
+_IGNORED_PRESET_PROPERTIES = (
+    "name",
+    "renderAllTakes",
+    "renderAllShots",
+    "renderAlsoDisabled",
+    "rerenderExistingShotVideos",
+    "fingerprintSceneAnimation",
+    "resumeRendering",
+    "compositeInBackground",
+    "generateEditVideo",
+    "renderOtioFile",
+    "otioFileType",
+    "numRenderWorkers",
+    "updatePlayblastInVSM",
+    "openRenderedVideoInPlayer",
+)
+
+
+def getFingerprintFilePath(mediaPath):
+    """Return the path of the file storing the fingerprint of the specified rendered media"""
+    return f"{mediaPath}{FINGERPRINT_FILE_SUFFIX}"
+
+
+def _getPropertiesValues(data, ignoredProperties=()):
+    """Return a dictionary with the values of the simple properties of the specified RNA struct.
+    The properties inherited from ID, some of them being runtime values, are ignored
+    """
+    if data is None:
+        return None
+
+    idProperties = bpy.types.ID.bl_rna.properties if isinstance(data, bpy.types.ID) else ()
+    values = dict()
+    for prop in data.bl_rna.properties:
+        if prop.type not in _SIMPLE_PROPERTY_TYPES or "rna_type" == prop.identifier:
+            continue
+        if prop.identifier in idProperties or prop.identifier in ignoredProperties:
+            continue
+        value = getattr(data, prop.identifier)
+        if "ENUM" == prop.type and prop.is_enum_flag:
+            value = sorted(value)
+        elif "STRING" != prop.type and "ENUM" != prop.type and prop.is_array:
+            value = list(value)
+        values[prop.identifier] = value
+    return values
+
+
+def _getAnimationValues(idBlock):
+    """Return the keys of the action of the specified data block, None if it is not animated"""
+    if idBlock is None or idBlock.animation_data is None or idBlock.animation_data.action is None:
+        return None
+
+    fcurvesValues = []
+    for fcurve in idBlock.animation_data.action.fcurves:
+        keyframes = fcurve.keyframe_points
+        coords = [0.0] * (2 * len(keyframes))
+        leftHandles = [0.0] * (2 * len(keyframes))
+        rightHandles = [0.0] * (2 * len(keyframes))
+        keyframes.foreach_get("co", coords)
+        keyframes.foreach_get("handle_left", leftHandles)
+        keyframes.foreach_get("handle_right", rightHandles)
+        fcurvesValues.append(
+            (
+                fcurve.data_path,
+                fcurve.array_index,
+                fcurve.mute,
+                coords,
+                leftHandles,
+                rightHandles,
+                [keyframe.interpolation for keyframe in keyframes],
+                fcurve.extrapolation,
+            )
+        )
+    return fcurvesValues
+
+
+def _getAnimatedPaths(idBlock):
+    """Return the data paths of the properties animated by the action of the specified data block"""
+    if idBlock is None or idBlock.animation_data is None or idBlock.animation_data.action is None:
+        return set()
+    return {fcurve.data_path for fcurve in idBlock.animation_data.action.fcurves}
+
+
+def _getObjectTransformValues(obj, visitedObjects=None):
+    """Return the values defining the transformation of the specified object whatever the current frame:
+    the non-animated transformation channels, the keys of its action, its parent and its constraints.
+    The parents and the constraint targets are described recursively
+    """
+    if obj is None:
+        return None
+
+    visitedObjects = set() if visitedObjects is None else visitedObjects
+    if obj.name in visitedObjects:
+        return obj.name
+    visitedObjects.add(obj.name)
+
+    # the values of the animated channels depend on the current frame, their keys are used instead
+    animatedPaths = _getAnimatedPaths(obj)
+    channels = dict()
+    for channel in _TRANSFORM_CHANNELS:
+        if channel not in animatedPaths:
+            value = getattr(obj, channel)
+            channels[channel] = value if isinstance(value, str) else list(value)
+
+    constraints = []
+    for constraint in obj.constraints:
+        target = getattr(constraint, "target", None)
+        ignoredProperties = ["show_expanded", "active"]
+        if f'constraints["{constraint.name}"].influence' in animatedPaths:
+            ignoredProperties.append("influence")
+        constraints.append(
+            (
+                _getPropertiesValues(constraint, ignoredProperties=ignoredProperties),
+                None if target is None else _getObjectTransformValues(target, visitedObjects),
+                getattr(constraint, "subtarget", None),
+            )
+        )
+
+    values = {
+        "name": obj.name,
+        "channels": channels,
+        "animation": _getAnimationValues(obj),
+        "constraints": constraints,
+        "parent": None,
+    }
+    if obj.parent is not None:
+        values["parent"] = {
+            "parent_type": obj.parent_type,
+            "parent_bone": obj.parent_bone,
+            "matrix_parent_inverse": [list(row) for row in obj.matrix_parent_inverse],
+            "object": _getObjectTransformValues(obj.parent, visitedObjects),
+        }
+    return values
+
+
+def getSceneAnimationDigest(scene):
+    """Return a hash of the animation of all the objects of the scene and of their data.
+    It is computed once per rendering and given to getShotFingerprint
+    """
+    animations = dict()
+    for obj in scene.objects:
+        animations[obj.name] = (_getAnimationValues(obj), _getAnimationValues(obj.data))
+    return getDigest(animations)
+
+
+def getShotFingerprint(
+    scene,
+    props,
+    take,
+    shot,
+    renderPreset,
+    handles,
+    stampInfoSettings=None,
+    stampInfoCustomSettingsDict=None,
+    sceneAnimationDigest=None,
+    specificFrame=None,
+):
+    """Return the fingerprint of the media rendered for the specified shot, as an hexadecimal string
+    Args:
+        handles: duration of the rendered handles, 0 if they are not rendered
+        stampInfoSettings: Stamp Info settings used for the rendering, None if Stamp Info is not used
+        sceneAnimationDigest: hash of the animation of the scene returned by getSceneAnimationDigest, None to ignore it
+    """
+    camera = shot.camera
+    values = {
+        "version": FINGERPRINT_VERSION,
+        "shot": {
+            "name": shot.name,
+            "start": shot.start,
+            "end": shot.end,
+            "handles": handles,
+            "specificFrame": specificFrame,
+            "enabled": shot.enabled,
+            "notes": (shot.note01, shot.note02, shot.note03),
+        },
+        "take": {
+            "name": take.name,
+            "notes": (take.note01, take.note02, take.note03),
+        },
+        "camera": None,
+        "render_preset": _getPropertiesValues(renderPreset, ignoredProperties=_IGNORED_PRESET_PROPERTIES),
+        "render_context": _getPropertiesValues(props.renderContext),
+        "scene_render": {
+            "engine": scene.render.engine,
+            "resolution": (scene.render.resolution_x, scene.render.resolution_y),
+            "resolution_percentage": scene.render.resolution_percentage,
+            "fps": (scene.render.fps, scene.render.fps_base),
+        },
+        "stamp_info": None,
+        "scene_animation": sceneAnimationDigest,
+    }
+
+    # the Stamp Info settings written for each shot still hold the values of the previously rendered shot,
+    # the data they are set from is hashed instead
+    if stampInfoSettings is not None:
+        values["stamp_info"] = {
+            "settings": getStampInfoSettingsValues(
+                _getPropertiesValues(stampInfoSettings),
+                useProjectSettings=props.use_project_settings,
+                stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
+            ),
+            "custom_settings": stampInfoCustomSettingsDict,
+            "shot_prefix": props.getRenderShotPrefix(),
+            "sequence_name": props.getSequenceName("FULL"),
+            "edit_start": props.getEditTime(shot, shot.start, referenceLevel="GLOBAL_EDIT"),
+            "edit_duration": props.getEditDuration(),
+        }
+        if props.use_project_settings:
+            values["stamp_info"]["project"] = (props.project_output_first_frame, props.project_img_name_digits_padding)
+
+    # the fingerprint must not depend on the current frame, which is not the same from one rendering to another
+    if camera is not None:
+        values["camera"] = {
+            "transform": _getObjectTransformValues(camera),
+            "data": _getPropertiesValues(camera.data, ignoredProperties=_getAnimatedPaths(camera.data)),
+            "data_animation": _getAnimationValues(camera.data),
+        }
+
+    return getDigest(values)
+
+
+def isMediaUpToDate(mediaPath, fingerprint):
+    """Return True if the specified media exists and has been rendered with the specified fingerprint"""
+    fingerprintFilePath = getFingerprintFilePath(mediaPath)
+    if not Path(mediaPath).exists() or not Path(fingerprintFilePath).exists():
+        return False
+
+    try:
+        with open(fingerprintFilePath, "r") as f:
+            storedFingerprint = json.load(f).get("fingerprint", None)
+    except Exception:
+        _logger.warning_ext(f"Invalid fingerprint file: {fingerprintFilePath}")
+        return False
+    return fingerprint == storedFingerprint
+
+
+def writeFingerprint(mediaPath, fingerprint):
+    """Write the fingerprint of the specified media next to it. Nothing is written if the media doesn't exist"""
+    if not Path(mediaPath).exists():
+        return
+    try:
+        with open(getFingerprintFilePath(mediaPath), "w") as f:
+            json.dump({"version": FINGERPRINT_VERSION, "fingerprint": fingerprint}, f, indent=4)
+    except Exception:
+        _logger.error_ext(f"Cannot write the fingerprint of: {mediaPath}")
+
+
+def deleteFingerprint(mediaPath):
+    """Delete the fingerprint of the specified media so that it is rendered again"""
+    fingerprintFilePath = Path(getFingerprintFilePath(mediaPath))
+    if fingerprintFilePath.exists():
+        try:
+            fingerprintFilePath.unlink()
+        except Exception:
+            _logger.error_ext(f"Cannot delete the fingerprint file: {fingerprintFilePath}")
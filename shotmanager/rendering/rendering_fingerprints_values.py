@@ -0,0 +1,85 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Values hashed in the fingerprints of the rendered shots
+
+This module works on plain Python values and doesn't depend on Blender, the values of the Blender data being
+read by rendering_fingerprints.py. It can then be checked outside of Blender.
+"""
+
+import json
+import hashlib
+
+# Stamp Info settings written by renderStampedInfoForShot for each rendered shot. They still hold the values of the
+# previous shot when the fingerprint of a shot is computed, the data they come from is hashed instead
+STAMP_INFO_SHOT_PROPERTIES = (
+    "shotName",
+    "cameraName",
+    "takeName",
+    "sequenceName",
+    "renderRootPath",
+    "edit3DFrame",
+    "edit3DTotalNumber",
+    "shotHandles",
+    "notesLine01",
+    "notesLine02",
+    "notesLine03",
+    "cornerNote",
+)
+
+# Stamp Info settings written for each shot from the project settings, when they are used
+STAMP_INFO_PROJECT_PROPERTIES = (
+    "notesUsed",
+    "cornerNoteUsed",
+    "bottomNoteUsed",
+    "bottomNote",
+    "videoFirstFrameIndexUsed",
+    "videoFirstFrameIndex",
+    "frameDigitsPadding",
+)
+
+# Stamp Info settings written for each shot from the custom settings, when they are specified
+STAMP_INFO_CUSTOM_PROPERTIES = (
+    "bottomNoteUsed",
+    "bottomNote",
+)
+
+
+def getDigest(values):
+    """Return the hash of the specified values, as an hexadecimal string. The values have to be JSON compliant"""
+    return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def getStampInfoSettingsValues(stampInfoValues, useProjectSettings=False, stampInfoCustomSettingsDict=None):
+    """Return the values of the Stamp Info settings without the ones written by the rendering of each shot,
+    so that the result doesn't depend on the shot rendered before
+    Args:
+        stampInfoValues: dictionary of the values of the properties of the Stamp Info settings, None if not used
+    """
+    if stampInfoValues is None:
+        return None
+
+    ignoredProperties = set(STAMP_INFO_SHOT_PROPERTIES)
+    if useProjectSettings:
+        ignoredProperties.update(STAMP_INFO_PROJECT_PROPERTIES)
+    if stampInfoCustomSettingsDict is not None:
+        ignoredProperties.update(STAMP_INFO_CUSTOM_PROPERTIES)
+        if "customFileFullPath" in stampInfoCustomSettingsDict:
+            ignoredProperties.add("customFileFullPath")
+
+    return {name: value for name, value in stampInfoValues.items() if name not in ignoredProperties}
@@ -0,0 +1,156 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Journal of the rendering of a take
+
+The rendering of a take is made of units: the 3D frames, the Stamp Info frames and the composite of each shot,
+then the edit video and the edit files of the take. The state of each unit (planned, in progress, done) is written
+in a json file placed in the render root folder each time it changes, so that a rendering interrupted by a crash
+can be resumed from the last completed unit.
+
+Units are identified by strings such as "SH0010/frames", "SH0010/stamp_info", "SH0010/composite", "edit_video"
+and "edit_files".
+"""
+
+import os
+import json
+from datetime import datetime
+from pathlib import Path
+
+import bpy
+
+from shotmanager.config import sm_logging
+
+_logger = sm_logging.getLogger(__name__)
+
+
+JOURNAL_VERSION = 1
+
+# states of the units
+PLANNED = "PLANNED"
+IN_PROGRESS = "IN_PROGRESS"
+DONE = "DONE"
+
+# last bytes of the image files, used to check that an image has been completely written
+_IMAGE_FILE_ENDINGS = {
+    ".png": b"IEND\xaeB`\x82",
+    ".jpg": b"\xff\xd9",
+    ".jpeg": b"\xff\xd9",
+}
+
+
+def getJournalFilePath(rootPath, take):
+    """Return the path of the journal of the rendering of the specified take in the specified render root folder"""
+    return os.path.join(bpy.path.abspath(rootPath), f"_render_journal_{take.getName_PathCompliant()}.json")
+
+
+def getJobKey(scene, take, renderMode):
+    """Return the values identifying a rendering job. A journal can only be resumed by a job with the same key"""
+    return {"file": bpy.data.filepath, "scene": scene.name, "take": take.name, "render_mode": renderMode}
+
+
+def isImageFileComplete(filePath):
+    """Return True if the specified image file exists and has been completely written.
+    The end of the file is checked for the PNG and JPEG formats, only its size for the other formats
+    """
+    path = Path(filePath)
+    if not path.exists():
+        return False
+
+    fileSize = path.stat().st_size
+    if 0 == fileSize:
+        return False
+
+    fileEnding = _IMAGE_FILE_ENDINGS.get(path.suffix.lower(), None)
+    if fileEnding is None:
+        return True
+
+    if fileSize < len(fileEnding):
+        return False
+    with open(path, "rb") as f:
+        f.seek(-len(fileEnding), os.SEEK_END)
+        return fileEnding == f.read()
+
+
+class RenderJournal:
+    """Journal of the units of a rendering job.
+    When filePath is None the journal is kept in memory only
+    """
+
+    def __init__(self, filePath=None, jobKey=None, resume=False):
+        self.filePath = filePath
+        self.jobKey = jobKey
+        self.units = dict()
+
+        if resume and filePath is not None and Path(filePath).exists():
+            try:
+                with open(filePath, "r") as f:
+                    journalDict = json.load(f)
+            except Exception:
+                _logger.warning_ext(f"Render journal cannot be read, rendering everything again: {filePath}")
+                journalDict = None
+
+            if journalDict is not None:
+                if JOURNAL_VERSION == journalDict.get("version", None) and jobKey == journalDict.get("job", None):
+                    self.units = journalDict.get("units", dict())
+                    _logger.info_ext(f"Resuming rendering from journal: {filePath}", col="GREEN")
+                else:
+                    _logger.warning_ext(f"Render journal is from another job, rendering everything again: {filePath}")
+
+        self.save()
+
+    def getStatus(self, unit):
+        return self.units.get(unit, {"status": PLANNED})["status"]
+
+    def isDone(self, unit):
+        return DONE == self.getStatus(unit)
+
+    def isInProgress(self, unit):
+        return IN_PROGRESS == self.getStatus(unit)
+
+    def start(self, unit):
+        self._setStatus(unit, IN_PROGRESS)
+
+    def complete(self, unit):
+        self._setStatus(unit, DONE)
+
+    def _setStatus(self, unit, status):
+        self.units[unit] = {"status": status, "time": datetime.now().isoformat(timespec="seconds")}
+        self.save()
+
+    def save(self):
+        """Write the journal in its file. The file is replaced at once so that it is valid even after a crash"""
+        if self.filePath is None:
+            return
+
+        journalDict = {"version": JOURNAL_VERSION, "job": self.jobKey, "units": self.units}
+        tmpFilePath = self.filePath + ".tmp"
+        try:
+            Path(self.filePath).parent.mkdir(parents=True, exist_ok=True)
+            with open(tmpFilePath, "w") as f:
+                json.dump(journalDict, f, indent=4)
+            os.replace(tmpFilePath, self.filePath)
+        except Exception:
+            _logger.error_ext(f"Cannot write the render journal: {self.filePath}")
+
+
+def openJournal(rootPath, scene, take, renderMode, resume=False):
+    """Return the journal of the rendering of the specified take. If resume is False or if the existing journal
+    is from another job, a new journal is started
+    """
+    return RenderJournal(getJournalFilePath(rootPath, take), getJobKey(scene, take, renderMode), resume=resume)
@@ -0,0 +1,195 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Scheduler of the tasks of a rendering
+
+The rendering of a take is a graph of tasks: for each shot the 3D frames, the Stamp Info frames and the sound,
+then the composite of the shot, and finally the edit video that depends on the composites of all the shots.
+
+The tasks using the Blender data (3D render, Stamp Info, sound mixdown...) have to be executed in the main thread,
+in the order of the shots. They are run by the rendering code itself, which then marks them as done.
+The other tasks are given a function, run in a worker thread as soon as their dependencies are done. These
+functions must not access the Blender data: they typically wait for a background process or work on files.
+
+The completion callbacks of the tasks are always called in the main thread, from update() and wait().
+
+Note: launchRenderWithVSEComposite currently uses a single edge of this graph: the images task of each shot,
+added and marked done once its 3D frames, Stamp Info frames and sound have been rendered sequentially in the main
+thread, and the composite task of the shot depending on it. The edit video is still built after the wait for
+all the composites.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from shotmanager.config import sm_logging
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# default number of tasks running at the same time in the worker threads
+MAX_BACKGROUND_TASKS = 2
+
+# duration in seconds between 2 checks of the state of the background tasks in wait()
+SCHEDULER_POLLING_INTERVAL = 0.2
+
+# states of the tasks
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+DONE = "DONE"
+FAILED = "FAILED"
+
+
+class RenderTask:
+    """Node of the graph of the rendering"""
+
+    __slots__ = ("name", "function", "dependencies", "onComplete", "status", "result", "error", "future")
+
+    def __init__(self, name, function=None, dependencies=(), onComplete=None):
+        self.name = name
+        self.function = function
+        self.dependencies = tuple(dependencies)
+        self.onComplete = onComplete
+        self.status = PENDING
+        self.result = None
+        self.error = None
+        self.future = None
+
+    def isFinished(self):
+        return self.status in (DONE, FAILED)
+
+
+class RenderScheduler:
+    """Run the background tasks of the rendering as soon as their dependencies are done.
+    A task fails if its function raises an exception or if one of its dependencies fails.
+
+    Usage:
+        scheduler = RenderScheduler()
+        scheduler.addTask("SH010/frames")
+        ... render the frames ...
+        scheduler.setTaskDone("SH010/frames")
+        scheduler.addTask("SH010/composite", function, dependencies=["SH010/frames"], onComplete=callback)
+        ...
+        scheduler.wait()
+        scheduler.shutdown()
+    """
+
+    def __init__(self, maxBackgroundTasks=MAX_BACKGROUND_TASKS):
+        self.tasks = dict()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, maxBackgroundTasks), thread_name_prefix="SM_Render")
+
+    def addTask(self, name, function=None, dependencies=(), onComplete=None):
+        """Add a task to the graph. Its dependencies must have been added before.
+        Args:
+            function: function without arguments run in a worker thread. If None, the task is run by the caller
+                      in the main thread, which has to call setTaskDone or setTaskFailed
+            onComplete: function called in the main thread with the task as argument when the task is finished
+        """
+        if name in self.tasks:
+            _logger.error_ext(f"Render scheduler: Task {name} already added")
+            return self.tasks[name]
+
+        for dependency in dependencies:
+            if dependency not in self.tasks:
+                raise ValueError(f"Render scheduler: Dependency {dependency} of task {name} not found")
+
+        task = RenderTask(name, function=function, dependencies=dependencies, onComplete=onComplete)
+        self.tasks[name] = task
+        self.update()
+        return task
+
+    def setTaskDone(self, name, result=None):
+        task = self.tasks[name]
+        task.status = DONE
+        task.result = result
+        self._completeTask(task)
+        self.update()
+
+    def setTaskFailed(self, name, error=None):
+        task = self.tasks[name]
+        task.status = FAILED
+        task.error = error
+        self._completeTask(task)
+        self.update()
+
+    def _completeTask(self, task):
+        if task.onComplete is not None:
+            try:
+                task.onComplete(task)
+            except Exception:
+                _logger.exception(f"Render scheduler: Completion of task {task.name} failed")
+
+    def update(self):
+        """Process the background tasks that have finished and start the ones whose dependencies are done.
+        Return True if some background tasks are still pending or running
+        """
+        tasksToProcess = True
+        while tasksToProcess:
+            tasksToProcess = False
+            for task in self.tasks.values():
+                if task.function is None or task.isFinished():
+                    continue
+
+                if RUNNING == task.status:
+                    if task.future.done():
+                        error = task.future.exception()
+                        if error is None:
+                            task.status = DONE
+                            task.result = task.future.result()
+                        else:
+                            _logger.error_ext(f"Render scheduler: Task {task.name} failed: {error}")
+                            task.status = FAILED
+                            task.error = error
+                        self._completeTask(task)
+                        tasksToProcess = True
+                    continue
+
+                dependenciesStatus = [self.tasks[dependency].status for dependency in task.dependencies]
+                if FAILED in dependenciesStatus:
+                    task.status = FAILED
+                    task.error = "Dependency failed"
+                    self._completeTask(task)
+                    tasksToProcess = True
+                elif all(DONE == status for status in dependenciesStatus):
+                    task.status = RUNNING
+                    task.future = self._executor.submit(task.function)
+
+        return any(task.function is not None and not task.isFinished() for task in self.tasks.values())
+
+    def wait(self, names=None):
+        """Wait for the specified background tasks to finish, all of them if names is None.
+        The tasks run by the caller in the main thread have to be done before the call
+        """
+        names = self.tasks.keys() if names is None else names
+        tasks = [self.tasks[name] for name in names]
+        for task in tasks:
+            if task.function is None and not task.isFinished():
+                raise RuntimeError(f"Render scheduler: Waiting for task {task.name} run in the main thread")
+
+        self.update()
+        while not all(task.isFinished() for task in tasks):
+            time.sleep(SCHEDULER_POLLING_INTERVAL)
+            self.update()
+
+    def shutdown(self, cancelPendingTasks=False):
+        """Wait for the end of the running background tasks and release the worker threads
+        Args:
+            cancelPendingTasks: if True, the background tasks not started yet are not run, typically when the
+                                rendering has failed
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancelPendingTasks)
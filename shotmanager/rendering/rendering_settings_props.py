@@ -103,7 +103,48 @@ class UAS_ShotManager_RenderSettings(PropertyGroup):
         default=True,
     )
 
-    rerenderExistingShotVideos: BoolProperty(name="Re-render Exisiting Shot Videos", default=True)
+    rerenderExistingShotVideos: BoolProperty(
+        name="Re-render Exisiting Shot Videos",
+        description=(
+            "Render all the shots."
+            "\nWhen unchecked, the shots with existing media that have been rendered with the same frame range,"
+            "\ncamera, camera animation, render and Stamp Info settings are not rendered again"
+        ),
+        default=True,
+    )
+
+    # used by ALL
+    fingerprintSceneAnimation: BoolProperty(
+        name="Check Scene Animation",
+        description=(
+            "When existing shot videos are not rendered again, also render the shots again if the animation"
+            "\nof any object of the scene has changed since the previous rendering"
+        ),
+        default=False,
+        options=set(),
+    )
+
+    # used by ALL
+    resumeRendering: BoolProperty(
+        name="Resume Interrupted Rendering",
+        description=(
+            "Continue the previous rendering of the take from the last completed step, as written in its journal"
+            "\nin the render folder. The existing frames of the interrupted shot are checked and kept"
+        ),
+        default=False,
+        options=set(),
+    )
+
+    # used by ALL
+    compositeInBackground: BoolProperty(
+        name="Composite in Background",
+        description=(
+            "Composite the video of each shot in a background instance of Blender while the next shot"
+            "\nis rendered, instead of compositing it before rendering the next shot"
+        ),
+        default=False,
+        options=set(),
+    )
 
     bypass_rendering_project_settings: BoolProperty(
         name="Bypass Project Settings",
@@ -162,6 +203,33 @@ class UAS_ShotManager_RenderSettings(PropertyGroup):
         default=False,
     )
 
+    # only used by ALL
+    numRenderWorkers: IntProperty(
+        name="Render Workers",
+        description=(
+            "Number of background instances of Blender rendering the shots in parallel."
+            "\nEach one opens the saved file, which then has to be saved before the rendering."
+            "\nWith 1 the shots are rendered one after the other in this instance of Blender"
+        ),
+        min=1,
+        soft_max=16,
+        max=64,
+        default=1,
+        options=set(),
+    )
+
+    # only used by PLAYBLAST
+    streamToFfmpeg: BoolProperty(
+        name="Direct Video Encoding",
+        description=(
+            "Stream the playblast frames and their Stamp Info framing directly to ffmpeg, without writing"
+            "\nintermediate images. Requires ffmpeg, see the add-on preferences."
+            "\nNot used when the intermediate files are kept"
+        ),
+        default=False,
+        options=set(),
+    )
+
     otioFileType: EnumProperty(
         name="File Type",
         description="Export the edit either in an OpenTimelineIO file format or a Final Cut XML",
@@ -229,12 +297,17 @@ class UAS_ShotManager_RenderSettings(PropertyGroup):
         self.renderOtioFile = False
         self.useStampInfo = True
         self.rerenderExistingShotVideos = True
+        self.fingerprintSceneAnimation = False
+        self.resumeRendering = False
+        self.compositeInBackground = False
+        self.streamToFfmpeg = False
         self.bypass_rendering_project_settings = False
         self.generateImageSequence = False
         self.outputMediaMode = "VIDEO"
         self.keepIntermediateFiles = False
         self.generateShotVideo = True
         self.generateEditVideo = False
+        self.numRenderWorkers = 1
         self.otioFileType = "XML"
         self.resolutionPercentage = 100
         self.updatePlayblastInVSM = False
@@ -197,6 +197,7 @@ def renderStampedInfoForShot(
     specificFrame=None,
     stampInfoCustomSettingsDict=None,
     verbose=False,
+    frameCallback=None,
 ):
     """Launch the rendering or the frames of the shot, with Stamp Info
 
@@ -207,6 +208,8 @@ def renderStampedInfoForShot(
 
     Args:
         resolution: array [width, height], resolution of the image rendered in Blender
+        frameCallback: if specified, the images are not written but given to this function, called with the frame
+                       and the PIL image once the scene is at the frame
     """
     if not (newTempRenderPath.endswith("/") or newTempRenderPath.endswith("\\")):
         newTempRenderPath += "\\"
@@ -383,7 +386,7 @@ def renderStampedInfoForShot(
             # txt += f"\n    stampInfoSettings.renderRootPath: {stampInfoSettings.renderRootPath}"
             _logger.info_ext(txt)
 
-        stampInfoSettings.renderTmpImageWithStampedInfo(
+        stampImage = stampInfoSettings.renderTmpImageWithStampedInfo(
             scene,
             currentFrame,
             resolution=resolutionFramed,
@@ -391,7 +394,10 @@ def renderStampedInfoForShot(
             renderPath=newTempRenderPath,
             renderFilename=tmpShotFilename,
             verbose=False,
+            writeFile=frameCallback is None,
         )
+        if frameCallback is not None:
+            frameCallback(currentFrame, stampImage)
 
     if verbose:
         txt = "\n------------------------------------------\n"
@@ -730,10 +730,22 @@ def draw3DRenderPanel(self, context):
         row.prop(props.renderSettingsAll, "rerenderExistingShotVideos")
         row.prop(props.renderSettingsAll, "generateEditVideo")
 
+        row = col.row()
+        row.enabled = not props.renderSettingsAll.rerenderExistingShotVideos
+        row.prop(props.renderSettingsAll, "fingerprintSceneAnimation")
+
+        row = col.row()
+        row.prop(props.renderSettingsAll, "resumeRendering")
+        row.prop(props.renderSettingsAll, "compositeInBackground")
+
         row = col.row()
         row.prop(props.renderSettingsAll, "renderAllTakes")
         row.prop(props.renderSettingsAll, "renderAlsoDisabled")
 
+        row = col.row()
+        row.label(text="Render Workers:")
+        row.prop(props.renderSettingsAll, "numRenderWorkers", text="")
+
         openButEnabled = not (display_bypass_options and "IMAGE_SEQ" == props.renderSettingsAll.outputMediaMode)
         openButEnabled = openButEnabled and not props.renderSettingsAll.renderAllTakes
         drawAfterRendering(props.renderSettingsAll, box, openButEnabled=openButEnabled)
@@ -827,6 +839,9 @@ def draw3DRenderPanel(self, context):
         col = colFlow.row()
         col.prop(props.renderSettingsPlayblast, "disableCameraBG")
 
+        row = box.row()
+        row.prop(props.renderSettingsPlayblast, "streamToFfmpeg")
+
         drawAfterRendering(props.renderSettingsPlayblast, box)
 
         drawRenderInfos(context, box)
@@ -0,0 +1,410 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Parallel rendering of the shots in background instances of Blender
+
+The shots to render are dispatched to a pool of workers. Each worker is a "blender -b" process opening the saved
+file and calling launchRenderWithVSEComposite on its own list of shots (3D render, stamp info, shot composite).
+The description of the job of a worker and its result are exchanged through json files placed in a temporary folder.
+
+The file has to be saved before the rendering since the workers open it from the disk.
+
+The composite of a shot, made in the VSE from its image sequences and its sound file, can also be done by
+a background instance of Blender started without file. This is used by the render scheduler to composite
+a shot while the next one is rendered. See rendering_scheduler.py
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import subprocess
+from pathlib import Path
+
+import bpy
+
+from shotmanager.config import config
+from shotmanager.config import sm_logging
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# duration in seconds between 2 checks of the state of the workers
+WORKERS_POLLING_INTERVAL = 0.5
+
+
+def isFileSavedForWorkers():
+    """Return True if the current file is saved, the workers opening it then get the current state of the scene.
+    To call right after the file is saved since the rendering itself modifies the data
+    """
+    if "" == bpy.data.filepath:
+        _logger.warning_ext("Parallel rendering: File has to be saved - Shots will be rendered in this instance")
+        return False
+
+    if bpy.data.is_dirty:
+        _logger.warning_ext("Parallel rendering: File has unsaved changes - Shots will be rendered in this instance")
+        return False
+
+    return True
+
+
+def canRenderInWorkers(numWorkers, numShots, fileIsSaved=None):
+    """Return True if the rendering of the specified number of shots can be dispatched to the workers
+    Args:
+        fileIsSaved: result of isFileSavedForWorkers() when called before the rendering, checked now if None
+    """
+    if numWorkers <= 1 or numShots <= 1 or bpy.app.background:
+        return False
+
+    if fileIsSaved is None:
+        fileIsSaved = isFileSavedForWorkers()
+    return fileIsSaved
+
+
+def getRenderPreset(props, renderMode):
+    """Return the render settings corresponding to the specified render mode, None if not found"""
+    renderPresets = {
+        "STILL": props.renderSettingsStill,
+        "ANIMATION": props.renderSettingsAnim,
+        "ALL": props.renderSettingsAll,
+        "PLAYBLAST": props.renderSettingsPlayblast,
+    }
+    return renderPresets.get(renderMode, None)
+
+
+def dispatchShotsToWorkers(shotsDurations, numWorkers):
+    """Distribute the shots to the workers so that the total durations to render by each worker are balanced.
+    The longest shots are given first to the least loaded worker.
+    Args:
+        shotsDurations: list of tupples (shot name, duration in frames)
+    Return: a list of lists of shot names, one per worker, in the order of shotsDurations. Empty lists are removed
+    """
+    workersShots = [[] for _ in range(numWorkers)]
+    workersLoads = [0] * numWorkers
+
+    shotsOrder = {name: ind for ind, (name, _duration) in enumerate(shotsDurations)}
+    for name, duration in sorted(shotsDurations, key=lambda shotDuration: -shotDuration[1]):
+        workerInd = workersLoads.index(min(workersLoads))
+        workersShots[workerInd].append(name)
+        workersLoads[workerInd] += duration
+
+    for shots in workersShots:
+        shots.sort(key=lambda name: shotsOrder[name])
+    return [shots for shots in workersShots if len(shots)]
+
+
+def renderShotsInWorkers(
+    scene,
+    renderMode,
+    takeIndex,
+    shotsDurations,
+    expectedFiles,
+    numWorkers,
+    rootPath,
+    render_handles=True,
+    renderSound=True,
+    generateShotVideos=True,
+    stampInfoCustomSettingsDict=None,
+):
+    """Render the specified shots in parallel in background instances of Blender, started from the saved file.
+    Args:
+        shotsDurations: list of tupples (shot name, duration in frames)
+        expectedFiles: dictionary with the shot names as keys and the media to generate for each shot as values
+    Return:
+        A dictionary with the following entries:
+            - rendered_files: files generated by the workers
+            - failed_files: files that the workers failed to generate
+            - shot_sequences: dictionary with the shot names as keys and their rendered image sequences as values,
+                              filled only when generateShotVideos is False
+    """
+    workersShots = dispatchShotsToWorkers(shotsDurations, numWorkers)
+    jobsDir = tempfile.mkdtemp(prefix="shotmanager_render_")
+
+    _logger.info_ext(
+        f"Parallel rendering: {len(shotsDurations)} shots dispatched to {len(workersShots)} workers", col="GREEN"
+    )
+
+    workers = []
+    # log files opened, including the one of a worker whose start failed
+    logFiles = []
+    workersDone = False
+    try:
+        for workerInd, shotNames in enumerate(workersShots):
+            jobFile = os.path.join(jobsDir, f"job_{workerInd:02}.json")
+            job = {
+                "scene": scene.name,
+                "render_mode": renderMode,
+                "take_index": takeIndex,
+                "shots": shotNames,
+                "expected_files": [expectedFiles[name] for name in shotNames],
+                "root_path": rootPath,
+                "render_handles": render_handles,
+                "render_sound": renderSound,
+                "generate_shot_videos": generateShotVideos,
+                "stamp_info_custom_settings": stampInfoCustomSettingsDict,
+                "result_file": os.path.join(jobsDir, f"result_{workerInd:02}.json"),
+            }
+            with open(jobFile, "w") as f:
+                json.dump(job, f, indent=4)
+
+            logFilePath = os.path.join(jobsDir, f"worker_{workerInd:02}.log")
+            command = [
+                bpy.app.binary_path,
+                "-b",
+                bpy.data.filepath,
+                "--python-expr",
+                "from shotmanager.rendering import rendering_workers; rendering_workers.runWorker()",
+                "--",
+                "--job",
+                jobFile,
+            ]
+            logFile = open(logFilePath, "w")
+            logFiles.append(logFile)
+            process = subprocess.Popen(command, stdout=logFile, stderr=subprocess.STDOUT)
+            workers.append((process, job, logFile, logFilePath))
+            _logger.info_ext(f"  Worker {workerInd} started, shots: {', '.join(shotNames)}")
+
+        startTime = time.monotonic()
+        while any(process.poll() is None for process, _job, _logFile, _logFilePath in workers):
+            time.sleep(WORKERS_POLLING_INTERVAL)
+        _logger.info_ext(f"Parallel rendering: workers done in {time.monotonic() - startTime:0.2f} sec.", col="GREEN")
+
+        workersDone = True
+    finally:
+        # on errors and interruptions the started workers are stopped, no orphan Blender instance is left
+        if not workersDone:
+            _logger.error_ext("Parallel rendering: Interrupted - Stopping the workers")
+            for process, _job, _logFile, _logFilePath in workers:
+                if process.poll() is None:
+                    process.kill()
+                process.wait()
+            for logFile in logFiles:
+                logFile.close()
+            if not config.devDebug:
+                shutil.rmtree(jobsDir, ignore_errors=True)
+
+    filesDict = {"rendered_files": [], "failed_files": [], "shot_sequences": dict()}
+    keepJobsDir = False
+    for workerInd, (process, job, logFile, logFilePath) in enumerate(workers):
+        logFile.close()
+        result = None
+        if Path(job["result_file"]).exists():
+            with open(job["result_file"], "r") as f:
+                result = json.load(f)
+
+        if result is None or 0 != process.returncode or "error" in result:
+            _logger.error_ext(f"Parallel rendering: Worker {workerInd} failed, see log: {logFilePath}")
+            keepJobsDir = True
+
+        if result is None:
+            filesDict["failed_files"].extend(job["expected_files"])
+        else:
+            filesDict["rendered_files"].extend(result["rendered_files"])
+            filesDict["failed_files"].extend(result["failed_files"])
+            filesDict["shot_sequences"].update(result["shot_sequences"])
+
+    if not keepJobsDir and not config.devDebug:
+        shutil.rmtree(jobsDir, ignore_errors=True)
+
+    return filesDict
+
+
+#####################################################################
+# Worker side
+#####################################################################
+
+
+def runWorker():
+    """Entry point of a worker, called in a background instance of Blender with the arguments:
+        blender -b file.blend --python-expr "..." -- --job job.json
+    The result of the rendering is written in the result file specified in the job
+    """
+    import traceback
+
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Shot Manager render worker")
+    parser.add_argument("--job", required=True, help="Path of the json file describing the job of the worker")
+    args = parser.parse_args(argv)
+
+    with open(args.job, "r") as f:
+        job = json.load(f)
+
+    result = {"rendered_files": [], "failed_files": job["expected_files"], "shot_sequences": dict()}
+    try:
+        result = _renderJob(job)
+    except Exception:
+        _logger.exception("Shot Manager render worker failed")
+        result["error"] = traceback.format_exc()
+
+    with open(job["result_file"], "w") as f:
+        json.dump(result, f, indent=4)
+
+
+def _getContextOverrideArgs(scene):
+    """Return the arguments of the context override used in the workers.
+    The rendering and the composite functions require a window and a screen, they are taken from the opened file
+    """
+    overrideArgs = {"scene": scene}
+    windows = bpy.context.window_manager.windows
+    if len(windows):
+        window = windows[0]
+        window.scene = scene
+        overrideArgs["window"] = window
+        overrideArgs["screen"] = window.screen
+        area = next((area for area in window.screen.areas if "VIEW_3D" == area.type), None)
+        if area is not None:
+            overrideArgs["area"] = area
+    return overrideArgs
+
+
+def _renderJob(job):
+    from shotmanager.rendering import rendering
+    from shotmanager.rendering import rendering_journal
+
+    scene = bpy.data.scenes[job["scene"]]
+    props = config.getAddonProps(scene)
+    take = props.getCurrentTake() if -1 == job["take_index"] else props.getTakeByIndex(job["take_index"])
+    takeShots = {shot.name: shot for shot in take.shots}
+    shotList = [takeShots[name] for name in job["shots"]]
+
+    overrideArgs = _getContextOverrideArgs(scene)
+    area = overrideArgs.get("area", None)
+
+    renderPreset = getRenderPreset(props, job["render_mode"])
+    with bpy.context.temp_override(**overrideArgs):
+        workerFilesDict = rendering.launchRenderWithVSEComposite(
+            bpy.context,
+            renderPreset=renderPreset,
+            takeIndex=job["take_index"],
+            filePath=job["root_path"],
+            stampInfoCustomSettingsDict=job["stamp_info_custom_settings"],
+            rerenderExistingShotVideos=True,
+            generateSequenceVideo=False,
+            generateShotVideos=job["generate_shot_videos"],
+            specificShotList=shotList,
+            render_handles=job["render_handles"],
+            renderSound=job["render_sound"],
+            area=area,
+            journal=rendering_journal.RenderJournal(),
+        )
+
+    # the shot videos are generated only in the video output modes
+    checkVideos = job["generate_shot_videos"] and renderPreset is not None and "VIDEO" in renderPreset.outputMediaMode
+
+    result = {"rendered_files": [], "failed_files": [], "shot_sequences": dict()}
+    for file in job["expected_files"]:
+        if checkVideos and not Path(file).exists():
+            result["failed_files"].append(file)
+        else:
+            result["rendered_files"].append(file)
+
+    # image sequences are given in the order of the rendered shots
+    for shotName, shotSequence in zip(job["shots"], workerFilesDict.get("shot_sequences", [])):
+        result["shot_sequences"][shotName] = shotSequence
+
+    return result
+
+
+#####################################################################
+# Compositing worker
+#####################################################################
+
+
+def compositeShotInWorker(job, jobFile):
+    """Composite a shot in a background instance of Blender started without file and wait for its end.
+    This function doesn't access the Blender data and can be run in a thread.
+    Args:
+        job: dictionary with the media to composite and the arguments of compositeVideoInVSE
+    Return: the path of the composited media
+    """
+    with open(jobFile, "w") as f:
+        json.dump(job, f, indent=4)
+
+    command = [
+        job["binary_path"],
+        "-b",
+        "--python-expr",
+        "from shotmanager.rendering import rendering_workers; rendering_workers.runCompositeWorker()",
+        "--",
+        "--job",
+        jobFile,
+    ]
+    logFilePath = os.path.splitext(jobFile)[0] + ".log"
+    with open(logFilePath, "w") as logFile:
+        returnCode = subprocess.call(command, stdout=logFile, stderr=subprocess.STDOUT)
+
+    videoIsMissing = "VIDEO" in job["output_media_mode"] and not Path(job["output_filepath"]).exists()
+    if 0 != returnCode or videoIsMissing:
+        raise RuntimeError(f"Compositing of {job['output_filename']} failed, see log: {logFilePath}")
+
+    if job["temp_dir_to_delete"] is not None:
+        shutil.rmtree(job["temp_dir_to_delete"], ignore_errors=True)
+    if not config.devDebug:
+        os.remove(jobFile)
+        os.remove(logFilePath)
+
+    return job["output_filepath"]
+
+
+def runCompositeWorker():
+    """Entry point of a compositing worker, called in a background instance of Blender with the arguments:
+        blender -b --python-expr "..." -- --job job.json
+    The process exits with an error code if the composite fails
+    """
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Shot Manager compositing worker")
+    parser.add_argument("--job", required=True, help="Path of the json file describing the composite")
+    args = parser.parse_args(argv)
+
+    with open(args.job, "r") as f:
+        job = json.load(f)
+
+    try:
+        vse_render = bpy.context.window_manager.UAS_vse_render
+        vse_render.clearMedia()
+        vse_render.inputBGMediaPath = job["bg_media_path"]
+        vse_render.inputBGResolution = job["bg_resolution"]
+        vse_render.outputResolution = job["bg_resolution"]
+        if job["over_media_path"] is not None:
+            vse_render.inputOverMediaPath = job["over_media_path"]
+            vse_render.inputOverResolution = job["over_resolution"]
+            vse_render.outputResolution = job["over_resolution"]
+        if job["audio_media_path"] is not None:
+            vse_render.inputAudioMediaPath = job["audio_media_path"]
+
+        with bpy.context.temp_override(**_getContextOverrideArgs(bpy.context.scene)):
+            vse_render.compositeVideoInVSE(
+                job["fps"],
+                job["frame_start"],
+                job["frame_end"],
+                job["output_filepath"],
+                job["output_filename"],
+                compositedImgSeqPath=job["composited_img_seq_path"],
+                output_file_prefix=job["output_file_prefix"],
+                postfixSceneName=job["postfix_scene_name"],
+                output_resolution=job["output_resolution"],
+                output_media_mode=job["output_media_mode"],
+                importAtFrame=job["import_at_frame"],
+                frame_padding=job["frame_padding"],
+            )
+    except Exception:
+        _logger.exception("Shot Manager compositing worker failed")
+        sys.exit(1)
@@ -1220,8 +1220,9 @@ def retimeScene(
         shotList = props.getShotsList(ignoreDisabled=False)
 
         if "CLEAR_ANIM" != mode:
-            for shot in shotList:
-                retime_shot(shot, *retime_args)
+            with props.batch_edit():
+                for shot in shotList:
+                    retime_shot(shot, *retime_args)
 
     # markers
     if retimerApplyToSettings.applyToMarkers:
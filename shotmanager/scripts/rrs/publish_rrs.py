@@ -110,8 +110,10 @@ def publishRRS(
     rerenderExistingShotVideos=True,
     renderAlsoDisabled=True,
     settingsDict=None,
+    resume=False,
 ):
     """Return a dictionary with the rendered and the failed file paths
+    When resume is True, the rendering continues from the last unit completed in the journal of the previous one
     The dictionary have the following entries:
         - rendered_files_in_cache: rendered files when cache is used
         - failed_files_in_cache: failed files when cache is used
@@ -217,6 +219,7 @@ def publishRRS(
         area=bpy.context.area,
         stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
         override_all_viewports=True,
+        resume=resume,
     )
 
     ################
@@ -36,10 +36,11 @@ _logger = sm_logging.getLogger(__name__)
 
 # Preparation of the files
 def renderStampedImage(
-    scene, currentFrame, renderW, renderH, innerH, renderPath=None, renderFilename=None, verbose=False
+    scene, currentFrame, renderW, renderH, innerH, renderPath=None, renderFilename=None, verbose=False, writeFile=True
 ):
     """Called by the Pre renderer callback
     Preparation of the files
+    Return the PIL image of the stamped info. It is written in a file only if writeFile is True
     """
     # Notes
     #   - Image origine is at TOP LEFT corner
@@ -736,6 +737,9 @@ def renderStampedImage(
         # img_draw.text((col01, currentTextTop), textProp, font=font, fill=textColorRGBA)
         img_draw.text((col01, currentTextFromBottom), textProp, font=font, fill=textColorRGBA)
 
+    if not writeFile:
+        return imgInfo
+
     dirAndFilename = getInfoFileFullPath(scene, currentFrame)
     if renderPath is None:
         renderPath = dirAndFilename[0]
@@ -762,6 +766,8 @@ def renderStampedImage(
         _logger.error_ext(f"Stamp Info: renderTmpImageWithStampedInfo Error: Cannot save file: {filepath}")
         raise
 
+    return imgInfo
+
 
 def drawRangesAndFrame(
     scene,
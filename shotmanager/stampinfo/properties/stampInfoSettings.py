@@ -593,8 +593,10 @@ class UAS_SMStampInfoSettings(bpy.types.PropertyGroup):
         renderPath=None,
         renderFilename=None,
         verbose=False,
+        writeFile=True,
     ):
-        """Args:
+        """Return the PIL image of the stamped info, written in a file only if writeFile is True
+        Args:
         resolution: the resolution frame"""
 
         if resolution is None or innerHeight is None:
@@ -606,7 +608,7 @@ class UAS_SMStampInfoSettings(bpy.types.PropertyGroup):
             renderH = resolution[1]
             innerH = innerHeight
 
-        infoImage.renderStampedImage(
+        return infoImage.renderStampedImage(
             scene,
             currentFrame,
             renderW,
@@ -615,6 +617,7 @@ class UAS_SMStampInfoSettings(bpy.types.PropertyGroup):
             renderPath=renderPath,
             renderFilename=renderFilename,
             verbose=verbose,
+            writeFile=writeFile,
         )
 
     def getRenderResolutionForStampInfo(self, scene, usePercentage=True, forceMultiplesOf2=True):
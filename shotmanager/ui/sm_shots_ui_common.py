@@ -19,6 +19,7 @@
 Common UI parts for the shots in the shots list component
 """
 
+import fnmatch
 
 from shotmanager.config import config
 
@@ -28,48 +29,192 @@ _logger = sm_logging.getLogger(__name__)
 
 
 #####################################################################
-# Draw functions
+# Row model
 #####################################################################
 
+# The values displayed in the rows of the shots list are computed once per redraw of the list, in the filter_items
+# function of the lists, and then read by their draw_item function for each visible row.
+
+# key: pointer of the Shot Manager properties, value: ShotsListModel instance
+_shotsListModels = dict()
+
+
+class ShotsListRow:
+    """Values displayed in the row of a shot in the shots list"""
+
+    __slots__ = (
+        "name",
+        "start",
+        "end",
+        "cameraIsNone",
+        "hasWarnings",
+        "shotTypeIconId",
+        "numSharedCam",
+        "hasBGImage",
+        "hasGreasePencil",
+        "greasePencilIsInDrawMode",
+        "hasNotes",
+        "editStart",
+        "editEnd",
+    )
+
+
+class ShotsListModel:
+    """Values displayed in the shots list of the specified take, computed in a single pass on its shots"""
+
+    __slots__ = (
+        "takePointer",
+        "currentShotIndex",
+        "currentFrame",
+        "takeContainsSharedCameras",
+        "displayCameraBG",
+        "displayStoryboardColumn",
+        "displayStoryboard",
+        "displayNotes",
+        "continuousGPEditing",
+        "rows",
+    )
+
+    def __init__(self, context, props, take, shots):
+        currentLayout = props.getCurrentLayout()
+        displayCameraBGInLayout = currentLayout is not None and currentLayout.display_cameraBG_in_properties
+        displayStoryboardInLayout = currentLayout is not None and currentLayout.display_storyboard_in_properties
+        displayNotesInLayout = currentLayout is not None and currentLayout.display_notes_in_properties
 
-def drawShotType(scene, layout, props, item, index, current_shot_index, itemHasWarnings):
+        self.takePointer = take.as_pointer()
+        self.currentShotIndex = props.current_shot_index
+        self.currentFrame = context.scene.frame_current
+        self.takeContainsSharedCameras = props.isThereSharedCamerasInTake()
+        self.displayCameraBG = displayCameraBGInLayout and props.display_cameraBG_in_shotlist
+        self.displayStoryboardColumn = props.display_greasepencil_in_shotlist or displayStoryboardInLayout
+        self.displayStoryboard = displayStoryboardInLayout and props.display_greasepencil_in_shotlist
+        self.displayNotes = displayNotesInLayout and props.display_notes_in_shotlist
+        self.continuousGPEditing = self.displayStoryboard and props.isContinuousGPEditingModeActive()
+
+        displayEditTimes = props.display_edit_times_in_shotlist
+        self.rows = []
+        for index, shot in enumerate(shots):
+            row = ShotsListRow()
+            row.name = shot.name
+            row.start = shot.start
+            row.end = shot.end
+
+            # check if the camera still exists in the scene
+            row.hasWarnings = not shot.isCameraValid()
+            camera = shot.camera
+            row.cameraIsNone = camera is None
+
+            row.shotTypeIconId = _getShotTypeIcon(shot, index, self.currentShotIndex, self.currentFrame).icon_id
+            if self.takeContainsSharedCameras:
+                row.numSharedCam = props.getNumSharedCamera(camera)
+            else:
+                row.numSharedCam = 2
+
+            row.hasBGImage = self.displayCameraBG and shot.hasBGImage()
+
+            gp = shot.getGreasePencilObject("STORYBOARD") if self.displayStoryboard else None
+            row.hasGreasePencil = gp is not None
+            row.greasePencilIsInDrawMode = gp is not None and "PAINT_GPENCIL" == gp.mode
+
+            row.hasNotes = self.displayNotes and shot.hasNotes()
+
+            if displayEditTimes:
+                row.editStart = props.getEditTime(shot, row.start)
+                row.editEnd = props.getEditTime(shot, row.end)
+            else:
+                row.editStart = row.editEnd = None
+
+            self.rows.append(row)
+
+
+def getShotsListModel(context, props, take, shots):
+    """Return the row model of the shots list of the specified take, built at the last call of filterShotsListItems
+    or built now if it doesn't match the take anymore
+    """
+    model = _shotsListModels.get(props.as_pointer(), None)
+    if (
+        model is None
+        or model.takePointer != take.as_pointer()
+        or len(model.rows) != len(shots)
+        or model.currentFrame != context.scene.frame_current
+    ):
+        model = ShotsListModel(context, props, take, shots)
+        _shotsListModels[props.as_pointer()] = model
+    return model
+
+
+def filterShotsListItems(uiList, context, props, take, shots):
+    """Build the row model of the shots list for this redraw and return the filter flags and the new order of the
+    shots, as expected from UIList.filter_items.
+    The shots are filtered by name, case-insensitively, and sorted by name the same way as the default UIList does,
+    in one pass on the names of the model
+    """
+    model = ShotsListModel(context, props, take, shots)
+    _shotsListModels[props.as_pointer()] = model
+
+    names = [row.name for row in model.rows]
+    filterFlags = []
+    newOrder = []
+
+    if uiList.filter_name and names:
+        pattern = f"*{uiList.filter_name.lower()}*"
+        bitflag = uiList.bitflag_filter_item
+        filterFlags = [bitflag if fnmatch.fnmatchcase(name.lower(), pattern) else 0 for name in names]
+
+    if uiList.use_filter_sort_alpha:
+        sortedIndices = sorted(range(len(names)), key=lambda ind: names[ind].lower())
+        newOrder = [0] * len(names)
+        for newIndex, index in enumerate(sortedIndices):
+            newOrder[index] = newIndex
+
+    return filterFlags, newOrder
+
+
+def _getShotTypeIcon(shot, index, currentShotIndex, currentFrame):
     currentIconIsOrange = True
     orange = "_Orange" if currentIconIsOrange else ""
-    if "PREVIZ" == item.shotType:
-        cam = f"Cam{orange}" if current_shot_index == index else ""
+    if "PREVIZ" == shot.shotType:
+        cam = f"Cam{orange}" if currentShotIndex == index else ""
     # STORYBOARD
     else:
-        cam = f"Stb{orange}" if current_shot_index == index else "Stb"
+        cam = f"Stb{orange}" if currentShotIndex == index else "Stb"
 
-    if item.enabled:
+    if shot.enabled:
         icon = config.icons_col[f"ShotMan_Enabled{cam}"]
-        if item.start <= scene.frame_current <= item.end:
+        if shot.start <= currentFrame <= shot.end:
             icon = config.icons_col[f"ShotMan_EnabledCurrent{cam}"]
     else:
         icon = config.icons_col[f"ShotMan_Disabled{cam}"]
+    return icon
+
+
+#####################################################################
+# Draw functions
+#####################################################################
+
 
-    if item.camera is None or itemHasWarnings:
+def drawShotType(layout, row, index):
+    if row.cameraIsNone or row.hasWarnings:
         layout.alert = True
 
     # mainRow = layout.row(align=True)
 
-    layout.operator("uas_shot_manager.set_current_shot", icon_value=icon.icon_id, text="").index = index
+    layout.operator("uas_shot_manager.set_current_shot", icon_value=row.shotTypeIconId, text="").index = index
 
 
-def drawStoryboardRow(layout, props, item, index):
+def drawStoryboardRow(layout, model, shotRow, index):
     row = layout.row(align=True)
     row.scale_x = 1.1
 
-    gp = item.getGreasePencilObject("STORYBOARD")
-    if gp is None:
+    if not shotRow.hasGreasePencil:
         icon = config.icons_col["ShotManager_CamGPNoShot_32"]
         row.operator("uas_shot_manager.greasepencil_select_and_draw", text="", icon_value=icon.icon_id).index = index
     else:
         # if "STORYBOARD" == props.currentLayoutMode():
-        opMode = "DRAW" if props.isContinuousGPEditingModeActive() else "SELECT"
+        opMode = "DRAW" if model.continuousGPEditing else "SELECT"
 
         # if gp == context.active_object and context.active_object.mode == "PAINT_GPENCIL":
-        if gp.mode == "PAINT_GPENCIL":
+        if shotRow.greasePencilIsInDrawMode:
             icon = "GREASEPENCIL"
             row.alert = True
             op = row.operator("uas_shot_manager.greasepencil_select_and_draw", text="", icon=icon)
@@ -82,7 +227,7 @@ def drawStoryboardRow(layout, props, item, index):
             # else:
             #     icon = config.icons_col["ShotManager_CamGPShot_32"]
 
-            if props.isContinuousGPEditingModeActive():
+            if model.continuousGPEditing:
                 icon = "OUTLINER_DATA_GP_LAYER"
                 op = row.operator("uas_shot_manager.greasepencil_select_and_draw", text="", icon=icon)
             else:
@@ -95,11 +240,11 @@ def drawStoryboardRow(layout, props, item, index):
     row.scale_x = 0.9
 
 
-def drawNotesRow(layout, props, item, index):
+def drawNotesRow(layout, shotRow, index):
     row = layout.row(align=True)
     row.scale_x = 1.0
 
-    if item.hasNotes():
+    if shotRow.hasNotes:
         icon = config.icons_col["ShotManager_NotesData_32"]
         row.operator("uas_shot_manager.shots_shownotes", text="", icon_value=icon.icon_id).index = index
     else:
@@ -38,33 +38,30 @@ _logger = sm_logging.getLogger(__name__)
 
 
 class UAS_UL_ShotManager_Items(bpy.types.UIList):
-    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+    def filter_items(self, context, data, propname):
         props = config.getAddonProps(context.scene)
-        current_shot_index = props.current_shot_index
-        scene = context.scene
+        return sm_shots_ui_common.filterShotsListItems(self, context, props, data, getattr(data, propname))
 
-        itemHasWarnings = False
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        props = config.getAddonProps(context.scene)
+        model = sm_shots_ui_common.getShotsListModel(context, props, data, data.shots)
+        shotRow = model.rows[index]
+        current_shot_index = model.currentShotIndex
 
         display_getsetcurrentframe_in_shotlist = props.display_getsetcurrentframe_in_shotlist
 
-        currentFrame = context.scene.frame_current
+        currentFrame = model.currentFrame
 
-        # check if the camera still exists in the scene
-        cameraIsValid = item.isCameraValid()
-        itemHasWarnings = not cameraIsValid
-
-        takeContainsSharedCameras = props.isThereSharedCamerasInTake()
-        if takeContainsSharedCameras:
-            numSharedCam = props.getNumSharedCamera(item.camera)
-        else:
-            numSharedCam = 2
+        itemHasWarnings = shotRow.hasWarnings
+        takeContainsSharedCameras = model.takeContainsSharedCameras
+        numSharedCam = shotRow.numSharedCam
 
         # draw shot type
         ##########################
 
         mainRow = layout.row(align=True)
 
-        sm_shots_ui_common.drawShotType(scene, mainRow, props, item, index, current_shot_index, itemHasWarnings)
+        sm_shots_ui_common.drawShotType(mainRow, shotRow, index)
 
         mainRow.separator(factor=0.8)
 
@@ -74,13 +71,13 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             if props.display_selectbut_in_shotlist:
                 row.operator("uas_shot_manager.shots_selectcamera", text="", icon="RESTRICT_SELECT_OFF").index = index
 
-            if props.getCurrentLayout().display_cameraBG_in_properties and props.display_cameraBG_in_shotlist:
+            if model.displayCameraBG:
                 row = row.row(align=True)
                 row.scale_x = 0.9
                 # icon = "VIEW_CAMERA" if item.hasBGImage() else "BLANK1"
                 icon = (
                     config.icons_col["ShotManager_CamBGShot_32"]
-                    if item.hasBGImage()
+                    if shotRow.hasBGImage
                     else config.icons_col["ShotManager_CamBGNoShot_32"]
                 )
                 row.operator("uas_shot_manager.cambgitem", text="", icon_value=icon.icon_id).index = index
@@ -99,17 +96,17 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
                 row.prop(item, "color", text="")
                 row.scale_x = 0.45
 
-        if props.display_greasepencil_in_shotlist or props.getCurrentLayout().display_storyboard_in_properties:
+        if model.displayStoryboardColumn:
 
             mainRow.separator(factor=0.8)
             stbRow = mainRow.row(align=True)
             stbRow.scale_x = 1.0
 
-            if props.getCurrentLayout().display_storyboard_in_properties and props.display_greasepencil_in_shotlist:
-                sm_shots_ui_common.drawStoryboardRow(stbRow, props, item, index)
+            if model.displayStoryboard:
+                sm_shots_ui_common.drawStoryboardRow(stbRow, model, shotRow, index)
 
-            if props.getCurrentLayout().display_notes_in_properties and props.display_notes_in_shotlist:
-                sm_shots_ui_common.drawNotesRow(stbRow, props, item, index)
+            if model.displayNotes:
+                sm_shots_ui_common.drawNotesRow(stbRow, shotRow, index)
 
         mainRow.separator(factor=0.6)
         sm_shots_ui_common.drawShotName(mainRow, props, item)
@@ -135,8 +132,8 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             #     ).shotSource = f"[{index},0]"
 
             grid_flow.scale_x = 0.4
-            shotEditStart = item.getEditStart()
-            if currentFrame == item.start:
+            shotEditStart = shotRow.editStart
+            if currentFrame == shotRow.start:
                 if props.highlight_all_shot_frames or current_shot_index == index:
                     grid_flow.alert = True
             # grid_flow.prop(item, "start", text="")
@@ -151,11 +148,11 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
                 ).shotSource = f"[{index},0]"
 
             grid_flow.scale_x = 0.4
-            if currentFrame == item.start:
+            if currentFrame == shotRow.start:
                 if props.highlight_all_shot_frames or current_shot_index == index:
                     grid_flow.alert = True
             grid_flow.prop(item, "start", text="")
-            grid_flow.alert = item.camera is None or itemHasWarnings
+            grid_flow.alert = shotRow.cameraIsNone or itemHasWarnings
 
         # duration
         ###########
@@ -173,7 +170,7 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             )
 
             if props.highlight_all_shot_frames or current_shot_index == index:
-                if item.start <= currentFrame and currentFrame <= item.end:
+                if shotRow.start <= currentFrame and currentFrame <= shotRow.end:
                     grid_flow.alert = True
 
             if props.display_duration_in_shotlist:
@@ -182,7 +179,7 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             else:
                 grid_flow.scale_x = 0.05
                 grid_flow.operator("uas_shot_manager.shot_duration", text="").index = index
-            grid_flow.alert = item.camera is None or itemHasWarnings
+            grid_flow.alert = shotRow.cameraIsNone or itemHasWarnings
         else:
             grid_flow.scale_x = 1.5
 
@@ -190,8 +187,8 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
         ###########
         if props.display_edit_times_in_shotlist:
             grid_flow.scale_x = 0.4
-            shotEditEnd = item.getEditEnd()
-            if currentFrame == item.end:
+            shotEditEnd = shotRow.editEnd
+            if currentFrame == shotRow.end:
                 if props.highlight_all_shot_frames or current_shot_index == index:
                     grid_flow.alert = True
             grid_flow.operator("uas_shot_manager.shottimeinedit", text=str(shotEditEnd)).shotSource = f"[{index},1]"
@@ -204,11 +201,11 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             #     ).shotSource = f"[{index},1]"
         else:
             grid_flow.scale_x = 0.4
-            if currentFrame == item.end:
+            if currentFrame == shotRow.end:
                 if props.highlight_all_shot_frames or current_shot_index == index:
                     grid_flow.alert = True
             grid_flow.prop(item, "end", text="")
-            grid_flow.alert = item.camera is None or itemHasWarnings
+            grid_flow.alert = shotRow.cameraIsNone or itemHasWarnings
 
             grid_flow.scale_x = button_x_factor - 0.2
             if display_getsetcurrentframe_in_shotlist:
@@ -233,7 +230,7 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             )
 
             if props.highlight_all_shot_frames or current_shot_index == index:
-                if item.start <= currentFrame and currentFrame <= item.end:
+                if shotRow.start <= currentFrame and currentFrame <= shotRow.end:
                     grid_flow.alert = True
 
             if props.display_duration_in_shotlist:
@@ -253,7 +250,7 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
         grid_flow.scale_x = 2.6
 
         if props.display_camera_in_shotlist:
-            if item.camera is None:
+            if shotRow.cameraIsNone:
                 grid_flow.alert = True
             grid_flow.prop(item, "camera", text="")
             grid_flow.scale_x = 0.3
@@ -263,13 +260,13 @@ class UAS_UL_ShotManager_Items(bpy.types.UIList):
             #  numSharedCam = props.getNumSharedCamera(item.camera)
             camlistrow.alert = 1 < numSharedCam
             camlistrow.operator("uas_shot_manager.list_camera_instances", text=str(numSharedCam)).index = index
-            if item.camera is None:
+            if shotRow.cameraIsNone:
                 grid_flow.alert = False
 
         if props.display_lens_in_shotlist:
             grid_flow.scale_x = 0.4
             grid_flow.use_property_decorate = True
-            if item.camera is not None:
+            if not shotRow.cameraIsNone:
                 grid_flow.prop(item.camera.data, "lens", text="Lens")
             else:
                 grid_flow.alert = True
@@ -31,6 +31,7 @@ from xmlrpc.client import Boolean
 import bpy
 
 from shotmanager.utils import utils_os
+from shotmanager.utils.utils_python import UniqueNameAllocator
 from shotmanager.config import config
 from shotmanager.config import sm_logging
 
@@ -627,18 +628,8 @@ def getViewportAreaView(context, viewport_index=0):
 
 def findFirstUniqueName(originalItem, name, itemsArray):
     """Return a string that correspont to name.xxx as the first unique name in the array"""
-    itemInd = 0
-    numDuplicatesFound = 0
-    newIndexStr = ".{:03}"
-    newName = name
-    while itemInd < len(itemsArray):
-        if itemsArray[itemInd] != originalItem and newName == itemsArray[itemInd].name:
-            newName = name + newIndexStr.format(numDuplicatesFound)
-            numDuplicatesFound += 1
-            itemInd = 0
-        else:
-            itemInd += 1
-    return newName
+    nameAllocator = UniqueNameAllocator(usedNames=[item.name for item in itemsArray if item != originalItem])
+    return nameAllocator.getUniqueName(name)
 
 
 def getSceneVSE(vsm_sceneName, createVseTab=False):
@@ -0,0 +1,167 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Latency instrumentation of the handlers of Shot Manager
+
+The frame change handlers and the draw handlers of the overlay tools are decorated with profiledHandler.
+When the profiling is enabled the duration of each call is stored in a rolling window per handler, from
+which the p50, p95 and max durations are computed, and the calls exceeding the frame budget (1 / fps) are
+counted as dropped frames. When it is disabled the decorated handlers only pay for a test on a global.
+"""
+
+import functools
+import json
+import time
+from collections import deque
+
+import bpy
+
+# number of calls used to compute the percentiles of each handler
+ROLLING_WINDOW_SIZE = 600
+
+_profilingEnabled = False
+
+# key: name of the handler, value: HandlerProfile instance
+_handlerProfiles = dict()
+
+
+class HandlerProfile:
+    """Rolling statistics of the durations of the calls of a handler. Durations are in seconds"""
+
+    __slots__ = ("name", "category", "durations", "numCalls", "numOverBudget", "maxDuration", "totalDuration")
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+        self.durations = deque(maxlen=ROLLING_WINDOW_SIZE)
+        self.numCalls = 0
+        self.numOverBudget = 0
+        self.maxDuration = 0.0
+        self.totalDuration = 0.0
+
+    def addCall(self, duration, budget):
+        self.durations.append(duration)
+        self.numCalls += 1
+        self.totalDuration += duration
+        if self.maxDuration < duration:
+            self.maxDuration = duration
+        if budget < duration:
+            self.numOverBudget += 1
+
+    def getPercentile(self, percent):
+        """Return the duration under which the specified percentage of the calls of the rolling window are"""
+        if not len(self.durations):
+            return 0.0
+        sortedDurations = sorted(self.durations)
+        ind = min(len(sortedDurations) - 1, int(round(percent / 100.0 * (len(sortedDurations) - 1))))
+        return sortedDurations[ind]
+
+    def toDict(self):
+        """Return the statistics of the handler as a dictionary of JSON compatible values, durations in ms"""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "numCalls": self.numCalls,
+            "numOverBudget": self.numOverBudget,
+            "p50_ms": self.getPercentile(50) * 1000.0,
+            "p95_ms": self.getPercentile(95) * 1000.0,
+            "max_ms": self.maxDuration * 1000.0,
+            "mean_ms": self.totalDuration / self.numCalls * 1000.0 if self.numCalls else 0.0,
+            "window_ms": [d * 1000.0 for d in self.durations],
+        }
+
+
+def isProfilingEnabled():
+    return _profilingEnabled
+
+
+def setProfilingEnabled(enabled):
+    """Enable or disable the profiling of the handlers. The statistics are kept until resetProfiles is called"""
+    global _profilingEnabled
+    _profilingEnabled = enabled
+
+
+def resetProfiles():
+    _handlerProfiles.clear()
+
+
+def getFrameBudget(scene=None):
+    """Return the duration of a frame, in seconds, at the frame rate of the specified scene"""
+    scn = bpy.context.scene if scene is None else scene
+    if scn is None:
+        return 1.0 / 25.0
+    return scn.render.fps_base / scn.render.fps
+
+
+def profiledHandler(category):
+    """Decorator measuring the duration of each call of the decorated handler when the profiling is enabled.
+    category: type of the handler, such as "frame_change_pre" or "draw"
+    """
+
+    def decorator(func):
+        name = f"{func.__module__.rpartition('.')[2]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profilingEnabled:
+                return func(*args, **kwargs)
+
+            startTime = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - startTime
+                profile = _handlerProfiles.get(name, None)
+                if profile is None:
+                    profile = HandlerProfile(name, category)
+                    _handlerProfiles[name] = profile
+                profile.addCall(duration, getFrameBudget())
+
+        return wrapper
+
+    return decorator
+
+
+def getProfiles():
+    """Return the list of the profiles of the handlers called since the last reset"""
+    return list(_handlerProfiles.values())
+
+
+def getProfilesAsDict():
+    return {
+        "frameBudget_ms": getFrameBudget() * 1000.0,
+        "rollingWindowSize": ROLLING_WINDOW_SIZE,
+        "handlers": [profile.toDict() for profile in _handlerProfiles.values()],
+    }
+
+
+def exportProfilesToJson(filepath):
+    """Write the statistics of the profiled handlers in the specified JSON file"""
+    with open(filepath, "w") as f:
+        json.dump(getProfilesAsDict(), f, indent=4)
+
+
+def getProfilesReadout():
+    """Return the statistics of the profiled handlers as a list of short text lines, to display in overlays"""
+    lines = [f"Handlers profiling - frame budget: {getFrameBudget() * 1000.0:.1f} ms"]
+    for profile in _handlerProfiles.values():
+        lines.append(
+            f"{profile.name}:  p50 {profile.getPercentile(50) * 1000.0:.2f}  p95 {profile.getPercentile(95) * 1000.0:.2f}"
+            f"  max {profile.maxDuration * 1000.0:.2f} ms  -  over budget: {profile.numOverBudget}/{profile.numCalls}"
+        )
+    return lines
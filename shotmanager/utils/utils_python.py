@@ -19,6 +19,8 @@
 Functions useful in a generic context
 """
 
+from bisect import bisect_left
+
 
 def copyString(str1):
     resStr = ""
@@ -35,3 +37,112 @@ def asciiColor(r, g, b):
 def clamp(v, minV, maxV):
     res = min(v, maxV)
     return max(res, minV)
+
+
+class UniqueNameAllocator:
+    """Allocate names that are unique among a set of used names
+
+    When a name is already used, a suffix made from suffixFormat and an index is appended to it, starting at
+    firstIndex, eg: "Cam", "Cam.000", "Cam.001"... The next index to try is kept for each base name so that
+    allocating many names from the same base name does not test again the indices already taken.
+    The used names are counted so that a name used several times remains used until all its users are removed.
+    Suffixed names freed by removeName() are not allocated again by the same allocator, it is meant to be
+    short-lived (one call, one batch of creations)
+    """
+
+    def __init__(self, usedNames=(), suffixFormat=".{:03}", firstIndex=0, caseSensitive=True):
+        self.suffixFormat = suffixFormat
+        self.firstIndex = firstIndex
+        self.caseSensitive = caseSensitive
+        self._usedNames = dict()
+        self._nextIndices = dict()
+        for name in usedNames:
+            self.addName(name)
+
+    def _key(self, name):
+        return name if self.caseSensitive else name.lower()
+
+    def isUsed(self, name):
+        return self._key(name) in self._usedNames
+
+    def addName(self, name):
+        """Register the specified name as used"""
+        key = self._key(name)
+        self._usedNames[key] = self._usedNames.get(key, 0) + 1
+
+    def removeName(self, name):
+        """Unregister one use of the specified name"""
+        key = self._key(name)
+        numUses = self._usedNames.get(key, 0)
+        if 1 < numUses:
+            self._usedNames[key] = numUses - 1
+        elif 1 == numUses:
+            del self._usedNames[key]
+
+    def getUniqueName(self, name):
+        """Return the first unique name based on the specified name and register it as used"""
+        uniqueName = name
+        if self.isUsed(name):
+            baseKey = self._key(name)
+            index = self._nextIndices.get(baseKey, self.firstIndex)
+            uniqueName = name + self.suffixFormat.format(index)
+            while self.isUsed(uniqueName):
+                index += 1
+                uniqueName = name + self.suffixFormat.format(index)
+            self._nextIndices[baseKey] = index + 1
+
+        self.addName(uniqueName)
+        return uniqueName
+
+    def reserveNames(self, name, count):
+        """Return a list of count unique names based on the specified name and register them as used"""
+        return [self.getUniqueName(name) for _i in range(count)]
+
+
+def getMovesToReorder(order):
+    """Return the list of the moves, as tupples (fromIndex, toIndex) to apply in this order with the function move() of
+    a Blender collection, to reorder the collection so that its item i is the item order[i] of the initial collection.
+    A move removes the item and inserts it at the target index. The number of moves is the minimum: only the items
+    that are not in the longest subsequence already in the right order are moved
+    """
+    numItems = len(order)
+    # positions in the new order of the items, in their current order
+    targetPositions = [0] * numItems
+    for newInd, currentInd in enumerate(order):
+        targetPositions[currentInd] = newInd
+
+    # longest increasing subsequence of the target positions (patience sorting)
+    tailValues = []
+    tailIndices = []
+    predecessors = [-1] * numItems
+    for i, pos in enumerate(targetPositions):
+        k = bisect_left(tailValues, pos)
+        if k == len(tailValues):
+            tailValues.append(pos)
+            tailIndices.append(i)
+        else:
+            tailValues[k] = pos
+            tailIndices[k] = i
+        predecessors[i] = tailIndices[k - 1] if 0 < k else -1
+
+    inPlace = [False] * numItems
+    i = tailIndices[-1] if len(tailIndices) else -1
+    while -1 != i:
+        inPlace[i] = True
+        i = predecessors[i]
+
+    # the items that are not in place are moved in their new order, each one just after its new predecessor
+    moves = []
+    items = list(range(numItems))
+    for newInd, currentInd in enumerate(order):
+        if inPlace[currentInd]:
+            continue
+        fromInd = items.index(currentInd)
+        toInd = 0 if 0 == newInd else items.index(order[newInd - 1]) + 1
+        if fromInd < toInd:
+            toInd -= 1
+        if fromInd != toInd:
+            items.insert(toInd, items.pop(fromInd))
+            moves.append((fromInd, toInd))
+
+    return moves
@@ -19,6 +19,8 @@
 Functions to manipulate Shot Manager
 """
 
+import time
+
 import bpy
 import addon_utils
 
@@ -69,6 +71,34 @@ def sceneHasShotManagerData(scene):
     return propGrp
 
 
+def resolveMissingParentScenes():
+    """Set the parentScene property of the Shot Manager properties, takes and shots that don't have it, in
+    a single pass over the scenes, their takes and their shots of the file.
+    Used when loading files created before V1.2.21 or patched by the data patches.
+    Return the tupple (number of parentScene pointers fixed, time taken in seconds)
+    """
+    startTime = time.perf_counter()
+    numFixed = 0
+
+    for scene in bpy.data.scenes:
+        if "UAS_shot_manager_props" not in scene:
+            continue
+        props = config.getAddonProps(scene)
+        if props.parentScene is None:
+            props.parentScene = scene
+            numFixed += 1
+        for take in props.takes:
+            if take.parentScene is None:
+                take.parentScene = scene
+                numFixed += 1
+            for shot in take.shots:
+                if shot.parentScene is None:
+                    shot.parentScene = scene
+                    numFixed += 1
+
+    return (numFixed, time.perf_counter() - startTime)
+
+
 def getStampInfo():
     """Return the Stamp Info settings instance, None if Stamp Info is not installed
     or its version is not supported"""
@@ -19,18 +19,65 @@
 Functions specific to Shot Manager props
 """
 
+import time
 from stat import S_IMODE, S_IWRITE
 from pathlib import Path
 
 import bpy
 from shotmanager.config import config
+from shotmanager.properties import edit_index
 from shotmanager.utils import utils
 from shotmanager.utils.utils_markers import sceneContainsCameraBinding
 
+# The warnings are evaluated at each redraw of the main and render panels. They are then memoized and evaluated
+# again only when the data changes (depsgraph update, file load and save, change of the edit) or when they are
+# older than WARNINGS_MAX_AGE, since the checks done on the file system cannot be invalidated by events.
+# The checks done on the file system are themselves done at most once per FILE_SYSTEM_CHECKS_INTERVAL seconds.
+
+# durations in seconds
+WARNINGS_MAX_AGE = 2.0
+FILE_SYSTEM_CHECKS_INTERVAL = 2.0
+
+# key: tupple (pointer of the Shot Manager properties, pointer of the scene),
+# value: tupple (edit generation, file path, time of the evaluation, warnings list)
+_warningsCache = dict()
+
+# key: tupple (name of the check, checked path), value: tupple (time of the check, result)
+_fileSystemChecks = dict()
+
+
+def invalidateWarnings():
+    """Force the evaluation of the warnings at their next request. The file system checks are not affected"""
+    _warningsCache.clear()
+
+
+def clearAll():
+    """Clear the memoized warnings and file system checks. To be called when a file is loaded or saved"""
+    _warningsCache.clear()
+    _fileSystemChecks.clear()
+
+
+def _getFileSystemCheck(checkName, path, checkFunction):
+    """Return the result of checkFunction(path), called at most once per FILE_SYSTEM_CHECKS_INTERVAL for a given path"""
+    key = (checkName, path)
+    currentTime = time.monotonic()
+    check = _fileSystemChecks.get(key, None)
+    if check is None or FILE_SYSTEM_CHECKS_INTERVAL < currentTime - check[0]:
+        check = (currentTime, checkFunction(path))
+        _fileSystemChecks[key] = check
+    return check[1]
+
+
+def _isFileReadOnly(filePath):
+    stat = Path(filePath).stat()
+    # print(f"Blender file Stats: {stat.st_mode}")
+    return S_IMODE(stat.st_mode) & S_IWRITE == 0
+
 
 def getWarnings(props, scene):
     """Check if some warnings are to be mentioned to the user/
     A warning message can be on several lines when the separator \n is used.
+    The warnings are memoized, see WARNINGS_MAX_AGE. The returned list must not be modified.
 
     Return:
         An array of tupples made of:
@@ -39,6 +86,26 @@ def getWarnings(props, scene):
             - the panel type, which can be 'ALL', 'MAIN' or 'RENDER'
         eg: [("Current file in Read-Only", 1, 'ALL'), ("Current scene fps and project fps are different !!", 2, 'MAIN')]
     """
+    key = (props.as_pointer(), scene.as_pointer())
+    generation = edit_index.getGeneration(props)
+    filePath = bpy.data.filepath
+    currentTime = time.monotonic()
+
+    cachedWarnings = _warningsCache.get(key, None)
+    if (
+        cachedWarnings is not None
+        and cachedWarnings[0] == generation
+        and cachedWarnings[1] == filePath
+        and currentTime - cachedWarnings[2] <= WARNINGS_MAX_AGE
+    ):
+        return cachedWarnings[3]
+
+    warningList = _evaluateWarnings(props, scene)
+    _warningsCache[key] = (generation, filePath, currentTime, warningList)
+    return warningList
+
+
+def _evaluateWarnings(props, scene):
     prefs = config.getAddonPrefs()
     warningList = []
 
@@ -50,9 +117,7 @@ def getWarnings(props, scene):
         # wkip to remove ones warning mecanics are integrated in the settings
         pass
     else:
-        stat = Path(currentFilePath).stat()
-        # print(f"Blender file Stats: {stat.st_mode}")
-        if S_IMODE(stat.st_mode) & S_IWRITE == 0:
+        if _getFileSystemCheck("readOnly", currentFilePath, _isFileReadOnly):
             warningList.append(("Current file in Read-Only", 10, "ALL"))
 
     # check is the data version is compatible with the current version
@@ -109,7 +174,9 @@ def getWarnings(props, scene):
     if "" == props.renderRootPath:
         warningList.append(("Rendering path is not defined", 120, "RENDER"))
 
-    elif not props.isRenderRootPathValid():
+    elif not _getFileSystemCheck(
+        "renderRootPath", (props.renderRootPath, bpy.data.filepath), lambda _path: props.isRenderRootPathValid()
+    ):
         warningList.append(("Rendering path is invalid", 121, "RENDER"))
 
     # check if the resolution render percentage is at 100%
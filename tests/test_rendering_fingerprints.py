@@ -0,0 +1,117 @@
+"""
+Check of the values hashed in the fingerprints of the rendered shots, run outside of Blender
+
+The module is loaded from its file since importing the shotmanager package requires Blender.
+"""
+
+import importlib.util
+from pathlib import Path
+
+_MODULE_PATH = Path(__file__).parents[1] / "shotmanager" / "rendering" / "rendering_fingerprints_values.py"
+_spec = importlib.util.spec_from_file_location("rendering_fingerprints_values", _MODULE_PATH)
+fingerprints_values = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fingerprints_values)
+
+
+def _getStampInfoValues():
+    """Values of the Stamp Info settings set by the user"""
+    return {
+        "stampInfoUsed": True,
+        "shotUsed": True,
+        "cameraUsed": True,
+        "notesUsed": False,
+        "cornerNoteUsed": False,
+        "bottomNoteUsed": True,
+        "bottomNote": "user note",
+        "customFileFullPath": "",
+        "fontScaleHNorm": 0.0185,
+        "shotName": "",
+        "cameraName": "",
+        "takeName": "",
+        "sequenceName": "",
+        "renderRootPath": "",
+        "edit3DFrame": -1,
+        "edit3DTotalNumber": 0,
+        "shotHandles": 0,
+        "notesLine01": "",
+        "notesLine02": "",
+        "notesLine03": "",
+        "cornerNote": "",
+    }
+
+
+def _renderShot(stampInfoValues, shot, useProjectSettings, stampInfoCustomSettingsDict):
+    """Write the Stamp Info settings the way renderStampedInfoForShot does for the specified shot"""
+    if stampInfoCustomSettingsDict is not None and "customFileFullPath" in stampInfoCustomSettingsDict:
+        stampInfoValues["customFileFullPath"] = stampInfoCustomSettingsDict["customFileFullPath"]
+    if useProjectSettings:
+        stampInfoValues["notesUsed"] = "" != shot["note01"]
+        stampInfoValues["cornerNoteUsed"] = not shot["enabled"]
+        stampInfoValues["bottomNoteUsed"] = False
+        stampInfoValues["bottomNote"] = ""
+        stampInfoValues["videoFirstFrameIndexUsed"] = True
+        stampInfoValues["videoFirstFrameIndex"] = 1
+        stampInfoValues["frameDigitsPadding"] = 5
+    stampInfoValues["takeName"] = "Main_Take"
+    stampInfoValues["sequenceName"] = "Act01_Seq0010"
+    stampInfoValues["notesLine01"] = shot["note01"]
+    stampInfoValues["cornerNote"] = "" if shot["enabled"] else " *** Shot Muted in the take ***"
+    stampInfoValues["shotHandles"] = 10
+    stampInfoValues["edit3DTotalNumber"] = 250
+    for frame in range(shot["start"], shot["end"] + 1):
+        stampInfoValues["renderRootPath"] = f"C:/render/{shot['name']}/"
+        stampInfoValues["shotName"] = f"Act01_Seq0010_{shot['name']}"
+        if stampInfoCustomSettingsDict is not None:
+            stampInfoValues["bottomNoteUsed"] = True
+            stampInfoValues["bottomNote"] = "Step: " + stampInfoCustomSettingsDict["asset_tracking_step"]
+        stampInfoValues["cameraName"] = shot["camera"]
+        stampInfoValues["edit3DFrame"] = frame
+
+
+def _getFingerprintDigest(stampInfoValues, shot, useProjectSettings, stampInfoCustomSettingsDict):
+    return fingerprints_values.getDigest(
+        {
+            "shot": shot,
+            "stamp_info": fingerprints_values.getStampInfoSettingsValues(
+                stampInfoValues,
+                useProjectSettings=useProjectSettings,
+                stampInfoCustomSettingsDict=stampInfoCustomSettingsDict,
+            ),
+        }
+    )
+
+
+def _checkDigestIndependentFromPreviousShot(useProjectSettings, stampInfoCustomSettingsDict):
+    shotA = {"name": "Sh010", "start": 10, "end": 40, "enabled": True, "note01": "", "camera": "Cam_Sh010"}
+    shotB = {"name": "Sh020", "start": 41, "end": 80, "enabled": False, "note01": "fix", "camera": "Cam_Sh020"}
+
+    stampInfoValues = _getStampInfoValues()
+    firstDigest = _getFingerprintDigest(stampInfoValues, shotA, useProjectSettings, stampInfoCustomSettingsDict)
+    _renderShot(stampInfoValues, shotA, useProjectSettings, stampInfoCustomSettingsDict)
+    _renderShot(stampInfoValues, shotB, useProjectSettings, stampInfoCustomSettingsDict)
+    secondDigest = _getFingerprintDigest(stampInfoValues, shotA, useProjectSettings, stampInfoCustomSettingsDict)
+    _renderShot(stampInfoValues, shotA, useProjectSettings, stampInfoCustomSettingsDict)
+    thirdDigest = _getFingerprintDigest(stampInfoValues, shotA, useProjectSettings, stampInfoCustomSettingsDict)
+
+    assert firstDigest == secondDigest == thirdDigest
+
+
+def test_digest_independent_from_previous_shot():
+    _checkDigestIndependentFromPreviousShot(useProjectSettings=False, stampInfoCustomSettingsDict=None)
+
+
+def test_digest_independent_from_previous_shot_with_project_settings():
+    _checkDigestIndependentFromPreviousShot(useProjectSettings=True, stampInfoCustomSettingsDict=None)
+
+
+def test_digest_independent_from_previous_shot_with_custom_settings():
+    customSettings = {"asset_tracking_step": "Layout", "customFileFullPath": "C:/project/stampinfo.json"}
+    _checkDigestIndependentFromPreviousShot(useProjectSettings=False, stampInfoCustomSettingsDict=customSettings)
+
+
+def test_user_settings_change_digest():
+    shot = {"name": "Sh010", "start": 10, "end": 40, "enabled": True, "note01": "", "camera": "Cam_Sh010"}
+    stampInfoValues = _getStampInfoValues()
+    digest = _getFingerprintDigest(stampInfoValues, shot, False, None)
+    stampInfoValues["cameraUsed"] = False
+    assert digest != _getFingerprintDigest(stampInfoValues, shot, False, None)